@@ -7,8 +7,15 @@ from tools.place_search_tool import PlaceSearchTool
 from tools.expense_calculator_tool import CalculatorTool
 from tools.currency_conversion_tool import CurrencyConverterTool
 
-from langgraph.graph import StateGraph, MessagesState, END, START
-from langgraph.prebuilt import ToolNode, tools_condition
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import StateGraph, END, START
+from langgraph.prebuilt import tools_condition
+from agent.state import TripState
+from agent.tool_executor import ConcurrentToolExecutor
+from agent.prefetch import DestinationPrefetcher
+from agent.token_budget import TokenBudget
+from agent.model_cascade import ModelCascade
+from utils.config_loader import load_config
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 
@@ -43,23 +50,58 @@ class GraphBuilder:
             ]
         )
         self.llm_with_tools = self.llm.bind_tools(tools=self.tools)
+        self.tool_executor = ConcurrentToolExecutor(self.tools)
+        config = load_config()
+        prefetch_config = config.get("prefetch", {})
+        self.prefetcher = (
+            DestinationPrefetcher(self.tools, self.tool_executor, prefetch_config)
+            if prefetch_config.get("enabled", False)
+            else None
+        )
+        self.token_budget = (
+            TokenBudget.from_config(
+                model_provider, config.get("llm", {}).get(model_provider, {}).get("model_name")
+            )
+            if config.get("token_budget", {}).get("enabled", False)
+            else None
+        )
+        cascade_config = config.get("model_cascade", {})
+        self.cascade = (
+            ModelCascade.from_config(
+                cascade_config,
+                self.llm,
+                config.get("llm", {}).get(model_provider, {}).get("model_name", model_provider),
+                self.tools,
+            )
+            if cascade_config.get("enabled", False)
+            else None
+        )
         self.system_prompt = SYSTEM_PROMPT
         self.graph = None
 
-    def agent_function(self, state: MessagesState):
+    async def agent_function(self, state: TripState, config: RunnableConfig):
 
         """
         The core agent logic that decides which tool to use or providing the final answer.
         Args:
-            state (MessagesState): The current state of the graph containing messages.
+            state (TripState): The current state of the graph containing messages.
+            config (RunnableConfig): The run config, forwarded so callbacks (e.g. token streaming) reach the LLM.
         Returns:
-            dict: The updated state with the new message from the LLM.
+            dict: The updated state with the new message from the LLM, the prompt tokens trimmed
+            and the model and latency of the turn.
         """
         logger.info("Agent function invoked")
         user_question = state["messages"]
         input_question = [self.system_prompt] + user_question
-        response = self.llm_with_tools.invoke(input_question)
-        return {"messages": response}
+        tokens_saved = 0
+        if self.token_budget is not None:
+            input_question, tokens_saved = self.token_budget.fit(input_question)
+        if self.cascade is not None:
+            turn = sum(1 for message in user_question if message.type == "ai") + 1
+            response, turns = await self.cascade.ainvoke(input_question, turn, config=config)
+            return {"messages": response, "tokens_saved": tokens_saved, "turns": turns}
+        response = await self.llm_with_tools.ainvoke(input_question, config=config)
+        return {"messages": response, "tokens_saved": tokens_saved}
 
     def build_graph(self):
 
@@ -72,14 +114,25 @@ class GraphBuilder:
         """
         try:
             logger.info("Building and compiling the graph")
-            graph_builder = StateGraph(MessagesState)
+            graph_builder = StateGraph(TripState)
 
             graph_builder.add_node("agent", self.agent_function)
-            graph_builder.add_node("tools", ToolNode(self.tools))
-
-            graph_builder.add_edge(START, "agent")
+            graph_builder.add_node("tools", self.tool_executor.run)
+
+            if self.prefetcher is not None:
+                graph_builder.add_node("prefetch", self.prefetcher.run)
+                graph_builder.add_node("release_prefetch", self.prefetcher.release)
+                graph_builder.add_edge(START, "prefetch")
+                graph_builder.add_edge("prefetch", "agent")
+                # the answer is final: prefetches the agent did not use are cancelled
+                graph_builder.add_conditional_edges(
+                    "agent", tools_condition, {"tools": "tools", END: "release_prefetch"}
+                )
+                graph_builder.add_edge("release_prefetch", END)
+            else:
+                graph_builder.add_edge(START, "agent")
+                graph_builder.add_conditional_edges("agent", tools_condition)
 
-            graph_builder.add_conditional_edges("agent", tools_condition)
             graph_builder.add_edge("tools", "agent")
 
             
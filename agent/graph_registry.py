@@ -0,0 +1,127 @@
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from agent.agentic_workflow import GraphBuilder
+from logger.logger import logger
+from exception.exception_handling import TripMateException
+
+
+class GraphRegistry:
+    """
+    A process-wide registry holding one compiled agent graph per model provider.
+
+    Graphs are built once (at startup or on first use) and shared by every request.
+    The compiled graphs keep no per-request state, so concurrent invocations of the
+    same graph are safe. Reloading builds a fresh graph and swaps it in atomically;
+    requests already running keep the graph they started with.
+    """
+
+    def __init__(self, providers: Optional[List[str]] = None):
+        """
+        Initializes the GraphRegistry.
+
+        Args:
+            providers (List[str]): The model providers to build when `build_all` is called.
+        """
+        self.providers = providers or ["groq"]
+        self._graphs: Dict[str, object] = {}
+        self._build_timings: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        logger.info(f"GraphRegistry initialized for providers: {self.providers}")
+
+    def _provider_lock(self, provider: str) -> threading.Lock:
+        """
+        Returns the lock serializing builds for a single provider.
+        """
+        with self._lock:
+            return self._build_locks.setdefault(provider, threading.Lock())
+
+    def build(self, provider: str):
+        """
+        Builds and compiles the graph for a provider and registers it.
+
+        Args:
+            provider (str): The model provider to build the graph for.
+        Returns:
+            CompiledGraph: The newly compiled graph.
+        Raises:
+            TripMateException: If the graph cannot be built.
+        """
+        try:
+            logger.info(f"Building graph for provider: {provider}")
+            start = time.perf_counter()
+            graph_builder = GraphBuilder(model_provider=provider)
+            init_done = time.perf_counter()
+            graph = graph_builder.build_graph()
+            compile_done = time.perf_counter()
+
+            with self._lock:
+                previous = self._build_timings.get(provider, {})
+                self._graphs[provider] = graph
+                self._build_timings[provider] = {
+                    "init_ms": round((init_done - start) * 1000, 2),
+                    "compile_ms": round((compile_done - init_done) * 1000, 2),
+                    "total_ms": round((compile_done - start) * 1000, 2),
+                    "built_at": datetime.now().isoformat(timespec="seconds"),
+                    "build_count": previous.get("build_count", 0) + 1,
+                }
+            logger.info(
+                f"Graph for {provider} built in {self._build_timings[provider]['total_ms']} ms"
+            )
+            return graph
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    def build_all(self) -> None:
+        """
+        Builds the graphs for every configured provider.
+        """
+        for provider in self.providers:
+            self.build(provider)
+
+    def get(self, provider: str = "groq"):
+        """
+        Returns the compiled graph for a provider, building it on first use.
+
+        Args:
+            provider (str): The model provider.
+        Returns:
+            CompiledGraph: The shared compiled graph.
+        """
+        graph = self._graphs.get(provider)
+        if graph is not None:
+            return graph
+        with self._provider_lock(provider):
+            # another request may have finished the build while we waited
+            graph = self._graphs.get(provider)
+            if graph is None:
+                graph = self.build(provider)
+            return graph
+
+    def reload(self, provider: Optional[str] = None) -> List[str]:
+        """
+        Rebuilds the graph for one provider, or for every registered provider.
+
+        Args:
+            provider (str): The provider to reload. Reloads all when omitted.
+        Returns:
+            List[str]: The providers that were rebuilt.
+        """
+        targets = [provider] if provider else sorted(set(self.providers) | set(self._graphs))
+        for target in targets:
+            with self._provider_lock(target):
+                self.build(target)
+        return targets
+
+    def stats(self) -> dict:
+        """
+        Returns the build timings of every registered graph.
+        """
+        with self._lock:
+            return {provider: dict(timing) for provider, timing in self._build_timings.items()}
@@ -0,0 +1,195 @@
+import time
+import threading
+from contextlib import aclosing
+from typing import Optional, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, message_chunk_to_message
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from utils.llm_router import without_token_streaming
+from utils.model_loader import get_llm_registry
+from logger.logger import logger
+
+
+FAST = "fast"
+STRONG = "strong"
+
+
+class ModelCascade:
+    """
+    Runs the agent's tool-selection turns on a fast model and its final answer on a strong one.
+
+    Every turn is first sent to the fast model. A reply that calls tools is used as
+    is; a reply without tool calls means the agent is ready to answer, so the turn is
+    sent again to the strong model, which writes the final plan from the same prompt
+    (and may still call tools). The fast turn is streamed and stopped once it has
+    written `max_draft_chars` of text without a tool call, so only the start of the
+    discarded draft is generated; the draft is never streamed to the client. A tier
+    configured with `models` is routed between its providers like the "auto"
+    provider, so an answer turn fails over when one provider is unavailable.
+    """
+
+    _stats = {
+        FAST: {"turns": 0, "total_ms": 0.0},
+        STRONG: {"turns": 0, "total_ms": 0.0},
+        "escalations": 0,
+        "drafts_stopped": 0,
+    }
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        fast: Runnable,
+        strong: Runnable,
+        fast_name: str,
+        strong_name: str,
+        escalate: bool = True,
+        max_draft_chars: int = 64,
+    ):
+        """
+        Initializes the ModelCascade.
+
+        Args:
+            fast (Runnable): The fast model, with the tools bound.
+            strong (Runnable): The strong model, with the tools bound.
+            fast_name (str): The fast model's name, used in turn reports.
+            strong_name (str): The strong model's name, used in turn reports.
+            escalate (bool): Whether answer turns are re-run on the strong model.
+            max_draft_chars (int): How much answer text the fast model writes before it is stopped.
+        """
+        self.fast = fast
+        self.strong = strong
+        self.fast_name = fast_name
+        self.strong_name = strong_name
+        self.escalate = escalate
+        self.max_draft_chars = max_draft_chars
+
+    @classmethod
+    def from_config(cls, cascade_config: dict, default_llm: Runnable, default_name: str, tools: Sequence) -> "ModelCascade":
+        """
+        Creates the cascade from the `model_cascade` config section.
+
+        A tier with `models` (provider -> model) is routed between those providers; a
+        tier with `provider` and `model_name` uses that model; any other tier uses the
+        graph's own model.
+
+        Args:
+            cascade_config (dict): The `model_cascade` config section.
+            default_llm (Runnable): The graph's model, without tools.
+            default_name (str): The name reported for the graph's model.
+            tools (Sequence): The tools the agent may call.
+        """
+
+        def tier(name: str) -> Tuple[Runnable, str]:
+            settings = cascade_config.get(name, {})
+            if settings.get("models"):
+                models = settings["models"]
+                llm = get_llm_registry().router(
+                    list(models), {provider: {"model_name": model} for provider, model in models.items()}
+                )
+                return llm.bind_tools(tools=tools), ",".join(f"{provider}:{model}" for provider, model in models.items())
+            if not settings.get("model_name"):
+                return default_llm.bind_tools(tools=tools), default_name
+            llm = get_llm_registry().get(settings["provider"], settings["model_name"])
+            return llm.bind_tools(tools=tools), f"{settings['provider']}:{settings['model_name']}"
+
+        (fast, fast_name), (strong, strong_name) = tier(FAST), tier(STRONG)
+        logger.info(f"Model cascade: {fast_name} selects tools, {strong_name} answers")
+        return cls(
+            fast,
+            strong,
+            fast_name,
+            strong_name,
+            cascade_config.get("escalate_final_answer", True),
+            cascade_config.get("max_draft_chars", 64),
+        )
+
+    @classmethod
+    def _record(cls, tier: str, elapsed_ms: float, escalated: bool = False, stopped: bool = False) -> None:
+        with cls._lock:
+            cls._stats[tier]["turns"] += 1
+            cls._stats[tier]["total_ms"] += elapsed_ms
+            if escalated:
+                cls._stats["escalations"] += 1
+            if stopped:
+                cls._stats["drafts_stopped"] += 1
+
+    @classmethod
+    def cascade_stats(cls) -> dict:
+        """
+        Returns the number of turns and the mean latency of each tier.
+        """
+        with cls._lock:
+            stats = {"escalations": cls._stats["escalations"], "drafts_stopped": cls._stats["drafts_stopped"]}
+            for tier in (FAST, STRONG):
+                entry = cls._stats[tier]
+                stats[tier] = {
+                    "turns": entry["turns"],
+                    "mean_ms": round(entry["total_ms"] / entry["turns"], 2) if entry["turns"] else 0.0,
+                }
+        return stats
+
+    def _report(self, turn: int, tier: str, response: AIMessage, elapsed_ms: float, escalated: bool) -> dict:
+        report = {
+            "turn": turn,
+            "tier": tier,
+            # routed tiers only know which model answered from the response metadata
+            "model": (getattr(response, "response_metadata", None) or {}).get("model_name")
+            or (self.fast_name if tier == FAST else self.strong_name),
+            "latency_ms": round(elapsed_ms, 2),
+            "tool_calls": len(getattr(response, "tool_calls", None) or []),
+            "escalated": escalated,
+        }
+        logger.info(
+            f"Turn {turn}: {report['model']} ({tier}) took {report['latency_ms']} ms, "
+            f"{report['tool_calls']} tool calls{', escalated' if escalated else ''}"
+        )
+        return report
+
+    async def _fast_turn(self, messages: Sequence[BaseMessage], config: Optional[RunnableConfig]) -> Tuple[AIMessage, bool]:
+        """
+        Streams the fast model's turn, stopping it once it is drafting an answer.
+
+        Returns:
+            Tuple[AIMessage, bool]: The (possibly partial) reply and whether it was stopped.
+        """
+        response = None
+        async with aclosing(self.fast.astream(messages, config=config)) as stream:
+            async for chunk in stream:
+                response = chunk if response is None else response + chunk
+                if not getattr(response, "tool_call_chunks", None) and len(str(response.content)) >= self.max_draft_chars:
+                    # closing the stream ends the generation
+                    return response, True
+        if response is None:
+            raise ValueError(f"{self.fast_name} returned an empty response")
+        return message_chunk_to_message(response), False
+
+    async def ainvoke(self, messages: Sequence[BaseMessage], turn: int, config: Optional[RunnableConfig] = None) -> Tuple[AIMessage, list]:
+        """
+        Runs one agent turn through the cascade.
+
+        Args:
+            messages (Sequence[BaseMessage]): The prompt of the turn.
+            turn (int): The number of the turn within the request, starting at 1.
+            config (RunnableConfig): The run config.
+        Returns:
+            Tuple[AIMessage, list]: The reply and the per-model report of the turn.
+        """
+        start = time.perf_counter()
+        if self.escalate:
+            # a streamed answer must come from one model, so the fast draft is not streamed
+            response, stopped = await self._fast_turn(messages, without_token_streaming(config))
+        else:
+            response, stopped = await self.fast.ainvoke(messages, config=config), False
+        fast_ms = (time.perf_counter() - start) * 1000
+        self._record(FAST, fast_ms, stopped=stopped)
+        reports = [self._report(turn, FAST, response, fast_ms, escalated=False)]
+        if not stopped and (response.tool_calls or not self.escalate):
+            return response, reports
+
+        start = time.perf_counter()
+        response = await self.strong.ainvoke(messages, config=config)
+        strong_ms = (time.perf_counter() - start) * 1000
+        self._record(STRONG, strong_ms, escalated=True)
+        reports.append(self._report(turn, STRONG, response, strong_ms, escalated=True))
+        return response, reports
@@ -0,0 +1,216 @@
+import re
+import time
+import uuid
+import asyncio
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.prebuilt.tool_node import msg_content_output
+
+from agent.state import TripState
+from agent.tool_executor import ConcurrentToolExecutor
+from utils.config_loader import load_config
+from utils.weather_info import normalize_city
+from logger.logger import logger
+
+
+# "a trip to New York", "visiting Goa", "3 days in Paris, France", "an itinerary for Goa"
+_CAPITALIZED_DESTINATION = re.compile(
+    r"\b(?:to|in|at|for|about|visit|visiting|around|explore|exploring)\s+(?:the\s+)?([A-Z][\w'-]*(?:\s+[A-Z][\w'-]*)*)"
+)
+# lower-case queries such as "plan a trip to goa"
+_LOWERCASE_DESTINATION = re.compile(
+    r"\b(?:trip|travel|travelling|traveling|going|fly|flying|vacation|holiday)\s+to\s+([a-z][a-z'-]+)"
+)
+_NOT_DESTINATIONS = {"the", "a", "an", "my", "our", "some", "somewhere", "me", "us", "i"}
+# capitalized words that follow a destination without being part of it ("Goa In December")
+_TRAILING_WORDS = {
+    "i", "in", "on", "for", "from", "with", "during", "next", "this",
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+}
+
+
+def extract_destination(text: str) -> Optional[str]:
+    """
+    Cheaply guesses the destination named in a user query.
+
+    Args:
+        text (str): The user query.
+
+    Returns:
+        Optional[str]: The destination, or None when no likely destination is found.
+    """
+    for match in _CAPITALIZED_DESTINATION.finditer(text):
+        words = match.group(1).split()
+        # "in December", "on Monday" and "for I" name no place; a later match may
+        if match.group(1).lower() in _NOT_DESTINATIONS or words[0].lower() in _TRAILING_WORDS:
+            continue
+        end = next((i for i, word in enumerate(words) if i and word.lower() in _TRAILING_WORDS), len(words))
+        return " ".join(words[:end])
+    match = _LOWERCASE_DESTINATION.search(text)
+    if match and match.group(1) not in _NOT_DESTINATIONS:
+        return match.group(1).title()
+    return None
+
+
+class DestinationPrefetcher:
+    """
+    Speculatively fetches destination data while the first LLM turn runs.
+
+    The prefetch node guesses the destination of the latest user message and starts
+    the configured tools for it in the background. When the agent later calls one of
+    those tools with the same destination, the tool executor awaits the running fetch
+    instead of calling the upstream again. Fetches still running when the request
+    ends, or when their scope outlives `ttl_seconds`, are cancelled.
+    """
+
+    # shared across instances so /metrics reports every graph
+    _stats = {"requests": 0, "destinations": 0, "fetches": 0, "served": 0, "failed": 0, "cancelled": 0}
+    _stats_lock = threading.Lock()
+
+    def __init__(self, tools: Sequence, tool_executor: ConcurrentToolExecutor, prefetch_config: Optional[dict] = None):
+        """
+        Initializes the DestinationPrefetcher and registers it with the tool executor.
+
+        Args:
+            tools (Sequence): The tools the agent may call.
+            tool_executor (ConcurrentToolExecutor): The executor whose limits the fetches share.
+            prefetch_config (dict): The `prefetch` config section. Loaded from the config file when omitted.
+        """
+        if prefetch_config is None:
+            prefetch_config = load_config().get("prefetch", {})
+        tools_by_name = {tool.name: tool for tool in tools}
+        self.tools = {
+            name: tools_by_name[name]
+            for name in prefetch_config.get("tools", [])
+            if name in tools_by_name
+        }
+        self.ttl = prefetch_config.get("ttl_seconds", 120)
+        self.tool_executor = tool_executor
+        self._scopes: Dict[str, Tuple[float, Dict[Tuple[str, str], asyncio.Task]]] = {}
+        tool_executor.prefetcher = self
+
+    @classmethod
+    def _count(cls, key: str, amount: int = 1) -> None:
+        with cls._stats_lock:
+            cls._stats[key] += amount
+
+    @classmethod
+    def prefetch_stats(cls) -> dict:
+        """
+        Returns how many fetches were started and how many tool calls they answered.
+        """
+        with cls._stats_lock:
+            stats = dict(cls._stats)
+        stats["hit_rate"] = round(stats["served"] / stats["fetches"], 3) if stats["fetches"] else 0.0
+        return stats
+
+    @staticmethod
+    def _key(tool_name: str, destination: str) -> Tuple[str, str]:
+        # the city alone, so a call for "Goa, India" is served by the prefetch for "Goa"
+        return tool_name, normalize_city(destination).split(",", 1)[0]
+
+    def _close_scope(self, scope: str) -> None:
+        """
+        Forgets a request's prefetches, cancelling the ones still running.
+        """
+        _, tasks = self._scopes.pop(scope, (0.0, {}))
+        unused = [task for task in tasks.values() if not task.done()]
+        for task in unused:
+            task.cancel()
+        if unused:
+            self._count("cancelled", len(unused))
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for scope in [scope for scope, (created, _) in self._scopes.items() if now - created > self.ttl]:
+            self._close_scope(scope)
+
+    async def _fetch(self, tool_name: str, destination: str):
+        tool = self.tools[tool_name]
+        async with self.tool_executor.slots(tool_name):
+            return await tool.ainvoke({next(iter(tool.args)): destination})
+
+    def _fetch_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self._count("failed")
+            logger.warning(f"Prefetch failed: {str(task.exception())}")
+
+    async def run(self, state: TripState, config: RunnableConfig) -> dict:
+        """
+        The node function: starts the prefetches for the destination of the latest user message.
+
+        Args:
+            state (TripState): The current state of the graph containing messages.
+            config (RunnableConfig): The run config.
+        Returns:
+            dict: The state update holding the prefetch scope, or nothing when no destination was found.
+        """
+        self._count("requests")
+        question = next(
+            (message for message in reversed(state["messages"]) if isinstance(message, HumanMessage)),
+            None,
+        )
+        destination = extract_destination(str(question.content)) if question is not None else None
+        if destination is None or not self.tools:
+            return {}
+
+        self._prune()
+        tasks = {}
+        for name in self.tools:
+            task = asyncio.create_task(self._fetch(name, destination))
+            task.add_done_callback(self._fetch_done)
+            tasks[self._key(name, destination)] = task
+        scope = uuid.uuid4().hex
+        self._scopes[scope] = (time.monotonic(), tasks)
+        self._count("destinations")
+        self._count("fetches", len(self.tools))
+        logger.info(f"Prefetching {', '.join(self.tools)} for {destination}")
+        return {"prefetch_key": scope}
+
+    async def release(self, state: TripState) -> dict:
+        """
+        The node function run when the agent has answered: cancels the request's unused prefetches.
+
+        Args:
+            state (TripState): The current state of the graph containing messages.
+        Returns:
+            dict: An empty state update.
+        """
+        scope = state.get("prefetch_key")
+        if scope is not None:
+            self._close_scope(scope)
+        return {}
+
+    async def serve(self, tool_call: dict, state) -> Optional[ToolMessage]:
+        """
+        Answers a tool call from a matching prefetch of the same request.
+
+        Args:
+            tool_call (dict): The tool call with name, args and id.
+            state: The graph state the call was made from.
+        Returns:
+            Optional[ToolMessage]: The tool result, or None when the call has to be executed.
+        """
+        scope = state.get("prefetch_key") if isinstance(state, dict) else None
+        if scope not in self._scopes or tool_call["name"] not in self.tools or not tool_call["args"]:
+            return None
+        argument = str(next(iter(tool_call["args"].values())))
+        task = self._scopes[scope][1].pop(self._key(tool_call["name"], argument), None)
+        if task is None:
+            return None
+        try:
+            result = await task
+        except Exception:
+            # counted by _fetch_done; the executor calls the tool again
+            return None
+        self._count("served")
+        return ToolMessage(
+            content=msg_content_output(result),
+            name=tool_call["name"],
+            tool_call_id=tool_call["id"],
+        )
@@ -0,0 +1,290 @@
+import re
+import time
+import zlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from agent.prefetch import extract_destination
+from utils.config_loader import load_config, subscribe
+
+
+# filler words that do not change what a travel query asks for
+_FILLER_WORDS = {
+    "a", "an", "the", "to", "for", "of", "in", "on", "at", "and", "me", "my", "i", "we", "us",
+    "our", "please", "can", "could", "you", "would", "like", "want", "give", "make", "create",
+    "plan", "planning", "suggest", "help", "some", "kindly", "need",
+}
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+# words that flip the meaning of the word after them ("non vegetarian", "without flights")
+_NEGATIONS = {"non", "not", "no", "without"}
+# where a place name in a route ends: a connecting word, punctuation or the end of the query
+_PLACE_END = r"(?=\s+(?:in|on|for|with|during|next|this|and|by|via|under|over)\b|[^\w' ]|$)"
+# "from Goa to Mumbai" and "to Mumbai from Goa"
+_ROUTES = (
+    re.compile(rf"\bfrom\s+(?P<origin>[a-z][\w' ]*?)\s+to\s+(?P<destination>[a-z][\w' ]*?){_PLACE_END}", re.I),
+    re.compile(rf"\bto\s+(?P<destination>[a-z][\w' ]*?)\s+from\s+(?P<origin>[a-z][\w' ]*?){_PLACE_END}", re.I),
+)
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def query_tokens(text: str) -> list:
+    """
+    Lower-cases a query, splits hyphenated words, drops punctuation and filler words
+    and strips plural endings ("3 days" and "3-day" both become "3 day").
+    """
+    words = re.findall(r"[a-z0-9]+(?:\.\d+)?", text.lower().replace("-", " "))
+    return [
+        word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+        for word in words
+        if word not in _FILLER_WORDS
+    ]
+
+
+def query_route(text: str) -> Optional[Tuple[str, str]]:
+    """
+    Returns the (origin, destination) of a query naming both ("from Goa to Mumbai"), in order.
+    """
+    for pattern in _ROUTES:
+        match = pattern.search(text)
+        if match:
+            return " ".join(query_tokens(match.group("origin"))), " ".join(query_tokens(match.group("destination")))
+    return None
+
+
+def negated_words(tokens: list) -> frozenset:
+    """
+    Returns the negations of a query together with the word each one negates.
+    """
+    return frozenset(
+        (word, tokens[index + 1] if index + 1 < len(tokens) else "")
+        for index, word in enumerate(tokens)
+        if word in _NEGATIONS
+    )
+
+
+class ResponseCache:
+    """
+    A two-tier cache of final /query answers.
+
+    The exact tier matches the normalized query text. The near-duplicate tier compares
+    MinHash signatures of the query's content words, so rephrasings such
+    as "3 day trip to Goa" and "plan a 3-day Goa trip" share an answer. A near-duplicate
+    only matches when both queries name the same numbers and destination, so "3 days"
+    never answers "5 days" and Goa never answers Kerala. Both tiers keep the direction
+    of a route, so "from Goa to Mumbai" never answers "from Mumbai to Goa", and a
+    near-duplicate must negate the same words ("non vegetarian" never answers
+    "vegetarian"). In short queries a single
+    word is a large share of the request ("3 day budget trip to Goa"), so when either
+    query has at most `exact_match_max_tokens` content words, both must have the same
+    content words, in any order.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl: float = 1800.0,
+        near_duplicates: bool = True,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        exact_match_max_tokens: int = 6,
+    ):
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            maxsize (int): The maximum number of answers kept.
+            ttl (float): The time-to-live of an answer in seconds.
+            near_duplicates (bool): Whether the near-duplicate tier is used.
+            threshold (float): The minimum estimated Jaccard similarity of a near-duplicate.
+            num_perm (int): The number of MinHash permutations.
+            exact_match_max_tokens (int): Queries with at most this many content words only match the same words.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.near_duplicates = near_duplicates
+        self.threshold = threshold
+        self.exact_match_max_tokens = exact_match_max_tokens
+        rng = np.random.default_rng(20240601)
+        # coefficients below 2**32 keep a * x + b exact in uint64 for 32-bit word hashes
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        # key -> (expires_at, answer, signature, numbers, route, destination tokens, negations, tokens)
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._stats = {"exact_hits": 0, "near_hits": 0, "misses": 0, "bypassed": 0, "stores": 0}
+        self._lock = threading.Lock()
+
+    def _signature(self, tokens: list) -> Optional[np.ndarray]:
+        if not tokens:
+            return None
+        hashes = np.array([zlib.crc32(token.encode()) for token in set(tokens)], dtype=np.uint64)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    @staticmethod
+    def _entities(text: str, tokens: list) -> tuple:
+        destination = extract_destination(text)
+        return (
+            tuple(sorted(_NUMBER.findall(" ".join(tokens)))),
+            query_route(text),
+            frozenset(query_tokens(destination)) if destination else frozenset(),
+            negated_words(tokens),
+            frozenset(tokens),
+        )
+
+    def _compatible(self, first: tuple, second: tuple) -> bool:
+        """
+        Returns whether two queries name the same numbers, route and negations and each
+        other's destination, and the same content words when either query is short.
+        """
+        numbers, route, destination, negations, tokens = first
+        other_numbers, other_route, other_destination, other_negations, other_tokens = second
+        if min(len(tokens), len(other_tokens)) <= self.exact_match_max_tokens and tokens != other_tokens:
+            return False
+        return (
+            numbers == other_numbers
+            and route == other_route
+            and negations == other_negations
+            and destination <= other_tokens
+            and other_destination <= tokens
+        )
+
+    def _prepare(self, provider: str, text: str) -> tuple:
+        tokens = query_tokens(text)
+        # "to" is a filler word, so the route is part of the key to keep its direction
+        return (provider, " ".join(tokens), query_route(text)), tokens
+
+    def count_bypass(self) -> None:
+        """
+        Records a request that opted out of the cache.
+        """
+        with self._lock:
+            self._stats["bypassed"] += 1
+
+    def lookup(self, provider: str, text: str) -> Tuple[Optional[str], str]:
+        """
+        Returns the cached answer of a query and the tier that matched.
+
+        Args:
+            provider (str): The LLM provider the answer must come from.
+            text (str): The user query.
+        Returns:
+            Tuple[Optional[str], str]: The answer (or None) and "exact", "near" or "miss".
+        """
+        key, tokens = self._prepare(provider, text)
+        now = time.monotonic()
+        with self._lock:
+            for expired in [k for k, entry in self._entries.items() if entry[0] <= now]:
+                del self._entries[expired]
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["exact_hits"] += 1
+                return entry[1], "exact"
+            candidates = [
+                (k, entry) for k, entry in self._entries.items()
+                if k[0] == provider and entry[2] is not None
+            ]
+        if self.near_duplicates and candidates:
+            signature = self._signature(tokens)
+            entities = self._entities(text, tokens)
+            if signature is not None:
+                matching = [(k, entry) for k, entry in candidates if self._compatible(entry[3:], entities)]
+                if matching:
+                    signatures = np.stack([entry[2] for _, entry in matching])
+                    similarity = (signatures == signature).mean(axis=1)
+                    best = int(similarity.argmax())
+                    if similarity[best] >= self.threshold:
+                        with self._lock:
+                            self._stats["near_hits"] += 1
+                        return matching[best][1][1], "near"
+        with self._lock:
+            self._stats["misses"] += 1
+        return None, "miss"
+
+    def store(self, provider: str, text: str, answer: str, ttl: Optional[float] = None) -> None:
+        """
+        Caches the answer of a query.
+
+        Args:
+            provider (str): The LLM provider that produced the answer.
+            text (str): The user query.
+            answer (str): The final answer.
+            ttl (float): Overrides the cache-wide time-to-live for this answer.
+        """
+        key, tokens = self._prepare(provider, text)
+        entry = (
+            time.monotonic() + (self.ttl if ttl is None else ttl),
+            answer,
+            self._signature(tokens),
+            *self._entities(text, tokens),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._stats["stores"] += 1
+
+    def resize(self, maxsize: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """
+        Changes the size limit and the default time-to-live, evicting the oldest answers that no longer fit.
+        """
+        with self._lock:
+            if ttl is not None:
+                self.ttl = ttl
+            if maxsize is not None:
+                self.maxsize = maxsize
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every cached answer.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def cache_stats(self) -> dict:
+        """
+        Returns the size and the per-tier hit counters of the cache.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["exact_hits"] + stats["near_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            round((stats["exact_hits"] + stats["near_hits"]) / lookups, 3) if lookups else 0.0
+        )
+        return stats
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Returns the process-wide /query response cache.
+    """
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                cache_config = load_config().get("response_cache", {})
+                near_config = cache_config.get("near_duplicate", {})
+                _response_cache = ResponseCache(
+                    maxsize=cache_config.get("maxsize", 512),
+                    ttl=cache_config.get("ttl_seconds", 1800),
+                    near_duplicates=near_config.get("enabled", True),
+                    threshold=near_config.get("threshold", 0.8),
+                    num_perm=near_config.get("num_perm", 64),
+                    exact_match_max_tokens=near_config.get("exact_match_max_tokens", 6),
+                )
+                subscribe(
+                    "response_cache",
+                    lambda config: _response_cache.resize(config.get("maxsize"), config.get("ttl_seconds")),
+                )
+    return _response_cache
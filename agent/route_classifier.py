@@ -0,0 +1,145 @@
+import re
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+ACTORS = ["TransportAgent", "HotelAgent", "ItineraryAgent"]
+
+# keyword rules naming what a worker does; words any request may use ("plan", "trip",
+# "food", "airport") are left to the model. When several workers' rules match, only the
+# first in ACTORS order gets `RULE_BONUS`, the order the supervisor prompt asks for
+RULES: Dict[str, re.Pattern] = {
+    "TransportAgent": re.compile(
+        r"\b(flights?|fly|flying|airfares?|airlines?|trains?|rail|bus(es)?|fares?|"
+        r"transport(ation)?|commute|cabs?|taxis?|ferry|ferries)\b"
+    ),
+    "HotelAgent": re.compile(
+        # "stay" and "nights" alone also ask how long to spend somewhere, so only lodging phrasings count
+        r"\b(hotels?|hostels?|resorts?|rooms?|room rates?|accommodations?|places? to stay|where (should \w+ |to )?stay|"
+        r"lodging|check[- ]?in|b&b|airbnb|suites?)\b"
+    ),
+    "ItineraryAgent": re.compile(
+        r"\b(itinerar(y|ies)|day[- ]by[- ]day|attractions?|sightseeing|things to do|places to visit|"
+        r"weather|safety|museums?|hikes?|hiking|restaurants?)\b"
+    ),
+}
+RULE_BONUS = 2.0
+
+# seed queries the linear model is trained on; multi-step requests are labelled with the
+# first step the supervisor prompt asks for (transport, then hotel, then itinerary)
+TRAINING_QUERIES: List[Tuple[str, str]] = [
+    ("find flights from delhi to goa next month", "TransportAgent"),
+    ("how much is a train ticket from mumbai to pune", "TransportAgent"),
+    ("cheapest way to get from bangalore to chennai", "TransportAgent"),
+    ("what are the airfares to paris in june", "TransportAgent"),
+    ("bus options between jaipur and udaipur", "TransportAgent"),
+    ("how do i travel from london to edinburgh", "TransportAgent"),
+    ("approximate fare for a flight to tokyo", "TransportAgent"),
+    ("plan a trip to bali with flights", "TransportAgent"),
+    ("book me the fastest route to rome", "TransportAgent"),
+    ("compare train and flight prices to kochi", "TransportAgent"),
+    ("are there direct flights to singapore", "TransportAgent"),
+    ("transport costs for going to manali", "TransportAgent"),
+    ("hotels and flights for a week in london", "TransportAgent"),
+    ("taxi from the airport to our hotel in jaipur", "TransportAgent"),
+    ("find a hotel in goa near the beach", "HotelAgent"),
+    ("room rates in paris for three nights", "HotelAgent"),
+    ("is there availability at resorts in munnar next month", "HotelAgent"),
+    ("cheap places to stay in bangkok", "HotelAgent"),
+    ("where should i stay in tokyo for a week", "HotelAgent"),
+    ("hostels in barcelona under 30 euros", "HotelAgent"),
+    ("book accommodation in rome for two", "HotelAgent"),
+    ("hotel prices in dubai in december", "HotelAgent"),
+    ("family friendly accommodation in bali with a pool", "HotelAgent"),
+    ("plan a trip to kerala with hotels", "HotelAgent"),
+    ("check hotel availability in istanbul", "HotelAgent"),
+    ("luxury suites in maldives", "HotelAgent"),
+    ("plan a 3 day trip to goa", "ItineraryAgent"),
+    ("create a day by day itinerary for paris", "ItineraryAgent"),
+    ("what are the top attractions in rome", "ItineraryAgent"),
+    ("things to do in tokyo for 5 days", "ItineraryAgent"),
+    ("is barcelona safe for tourists and what is the weather", "ItineraryAgent"),
+    ("suggest places to visit in kerala", "ItineraryAgent"),
+    ("weekend plan for munnar with hiking", "ItineraryAgent"),
+    ("what to see in istanbul in 2 days", "ItineraryAgent"),
+    ("food and museums to try in vienna", "ItineraryAgent"),
+    ("plan a week in bali for a family", "ItineraryAgent"),
+    ("4 day itinerary for jaipur with local markets", "ItineraryAgent"),
+    ("what is the weather like in manali in january", "ItineraryAgent"),
+    ("how many nights should i spend in rome", "ItineraryAgent"),
+    ("how long should i stay in paris", "ItineraryAgent"),
+    ("is 3 nights enough for barcelona", "ItineraryAgent"),
+    ("how many days should we stay in goa", "ItineraryAgent"),
+]
+
+NUM_FEATURES = 1 << 10
+
+
+def _tokens(text: str) -> List[str]:
+    words = re.findall(r"[a-z0-9&]+", text.lower())
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+def _features(text: str) -> np.ndarray:
+    """
+    Hashes the unigrams and bigrams of a query into a fixed-size count vector.
+    """
+    vector = np.zeros(NUM_FEATURES)
+    for token in _tokens(text):
+        vector[zlib.crc32(token.encode("utf-8")) % NUM_FEATURES] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class RouteClassifier:
+    """
+    A local classifier choosing the supervisor's next worker from the user's request.
+
+    A multinomial logistic regression over hashed unigrams and bigrams, trained on
+    TRAINING_QUERIES when the classifier is created (a few milliseconds), scores the
+    three workers; keyword rules add a fixed bonus to the logit of the first worker, in
+    the supervisor prompt's order, that they match. FINISH is never predicted: deciding that a request is fully answered needs
+    the conversation, so it is left to the LLM.
+    """
+
+    def __init__(self, training_queries: Optional[List[Tuple[str, str]]] = None, epochs: int = 300, learning_rate: float = 0.5, l2: float = 1e-3):
+        """
+        Initializes and trains the RouteClassifier.
+
+        Args:
+            training_queries (List[Tuple[str, str]]): (query, actor) pairs. Defaults to TRAINING_QUERIES.
+            epochs (int): The number of full-batch gradient descent steps.
+            learning_rate (float): The gradient descent step size.
+            l2 (float): The L2 regularization strength.
+        """
+        training_queries = training_queries or TRAINING_QUERIES
+        features = np.stack([_features(query) for query, _ in training_queries])
+        labels = np.array([ACTORS.index(actor) for _, actor in training_queries])
+        targets = np.eye(len(ACTORS))[labels]
+        self.weights = np.zeros((NUM_FEATURES, len(ACTORS)))
+        self.bias = np.zeros(len(ACTORS))
+        for _ in range(epochs):
+            gradient = self._softmax(features @ self.weights + self.bias) - targets
+            self.weights -= learning_rate * (features.T @ gradient / len(labels) + l2 * self.weights)
+            self.bias -= learning_rate * gradient.mean(axis=0)
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+        return shifted / shifted.sum(axis=-1, keepdims=True)
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """
+        Returns the most likely worker for a request and its probability.
+        """
+        logits = _features(text) @ self.weights + self.bias
+        lowered = text.lower()
+        for index, actor in enumerate(ACTORS):
+            if RULES[actor].search(lowered):
+                logits[index] += RULE_BONUS
+                break
+        probabilities = self._softmax(logits)
+        best = int(probabilities.argmax())
+        return ACTORS[best], float(probabilities[best])
@@ -0,0 +1,19 @@
+import operator
+from typing import Annotated, Optional
+from langgraph.graph import MessagesState
+
+
+class TripState(MessagesState):
+    """
+    The state of the trip planner graph.
+
+    Attributes:
+        messages: The conversation, merged with the add_messages reducer.
+        prefetch_key: The scope holding the speculative fetches started for this request, if any.
+        tokens_saved: The prompt tokens the token budget trimmed, summed over the agent turns.
+        turns: The model and latency of every LLM call made by the agent turns.
+    """
+
+    prefetch_key: Optional[str]
+    tokens_saved: Annotated[int, operator.add]
+    turns: Annotated[list, operator.add]
@@ -1,4 +1,6 @@
 import sys
+import threading
+from typing import Optional
 
 from langgraph.graph import MessagesState
 from langchain_core.messages import SystemMessage
@@ -6,8 +8,10 @@ from langchain_core.messages import SystemMessage
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 from utils.model_loader import ModelLoader
+from utils.config_loader import load_config
 
 from utils.schemas import NextStep
+from agent.route_classifier import RouteClassifier
 from prompt_library.supervisor_prompts import SUPERVISOR_SYSTEM_PROMPT
 
 
@@ -16,7 +20,18 @@ class SupervisorAgent:
     """
         The Orchestrator Agent.
         It analyzes the user's request and determines the next step.
+
+        A fresh user request is first scored by a local RouteClassifier; when its
+        confidence reaches the `supervisor_fast_path` threshold, the structured-output
+        LLM call is skipped. A sample of the confident decisions is still sent to the
+        LLM to measure how often the fast path disagrees with it.
         """
+
+    _classifier: Optional[RouteClassifier] = None
+    _stats = {"decisions": 0, "fast_path": 0, "llm_calls": 0, "audited": 0, "disagreements": 0}
+    _confident = 0
+    _lock = threading.Lock()
+
     def __init__(self, model_provider: str = "groq"):
         """
         Initialize the SupervisorAgent with an LLM
@@ -30,6 +45,62 @@ class SupervisorAgent:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
             raise error
+
+    @classmethod
+    def classifier(cls) -> RouteClassifier:
+        """
+        Returns the process-wide RouteClassifier, training it on first use.
+        """
+        if cls._classifier is None:
+            with cls._lock:
+                if cls._classifier is None:
+                    cls._classifier = RouteClassifier()
+        return cls._classifier
+
+    @classmethod
+    def _count(cls, *keys: str) -> None:
+        with cls._lock:
+            for key in keys:
+                cls._stats[key] += 1
+
+    @classmethod
+    def _audit_due(cls, audit_rate: float) -> bool:
+        """
+        Returns whether this confident decision is one of the 1-in-N sent to the LLM for auditing.
+        """
+        if audit_rate <= 0:
+            return False
+        with cls._lock:
+            cls._confident += 1
+            return cls._confident % max(1, round(1 / audit_rate)) == 0
+
+    @classmethod
+    def routing_stats(cls) -> dict:
+        """
+        Returns how often the LLM call was skipped and how often audited fast-path decisions disagreed with it.
+        """
+        with cls._lock:
+            stats = dict(cls._stats)
+        stats["skip_rate"] = round(stats["fast_path"] / stats["decisions"], 3) if stats["decisions"] else 0.0
+        stats["disagreement_rate"] = (
+            round(stats["disagreements"] / stats["audited"], 3) if stats["audited"] else 0.0
+        )
+        return stats
+
+    def _fast_decision(self, state: MessagesState, fast_path: dict):
+        """
+        Returns the classifier's choice and confidence for a fresh user request, or (None, 0.0).
+        """
+        if not fast_path.get("enabled", False) or not state["messages"]:
+            return None, 0.0
+        last_message = state["messages"][-1]
+        # after a worker has replied, only the LLM can tell whether the request is done
+        if getattr(last_message, "type", None) != "human":
+            return None, 0.0
+        actor, confidence = self.classifier().predict(str(last_message.content))
+        if confidence < fast_path.get("threshold", 0.8):
+            return None, confidence
+        return actor, confidence
     
     def get_decision(self, state: MessagesState) ->dict:
         """
@@ -43,16 +114,27 @@ class SupervisorAgent:
         """
         try:
             logger.info("Getting decision from SupervisorAgent")
-            messages = [SystemMessage(content = SUPERVISOR_SYSTEM_PROMPT) + state["messages"]]
+            fast_path = load_config().get("supervisor_fast_path", {})
+            fast_actor, confidence = self._fast_decision(state, fast_path)
+            audit = fast_actor is not None and self._audit_due(fast_path.get("audit_sample_rate", 0.0))
+            if fast_actor is not None and not audit:
+                self._count("decisions", "fast_path")
+                logger.info(f"Supervisor fast path routed to: {fast_actor} (confidence {confidence:.2f})")
+                return {"next": fast_actor}
+
+            messages = [SystemMessage(content = SUPERVISOR_SYSTEM_PROMPT)] + state["messages"]
 
             decision: NextStep = self.structured_llm.invoke(messages)
+            self._count("decisions", "llm_calls")
+            if audit:
+                self._count("audited")
+                if decision.next_actor != fast_actor:
+                    self._count("disagreements")
+                    logger.info(f"Supervisor fast path chose {fast_actor}, the LLM chose {decision.next_actor}")
             logger.info(f"Supervisor decided to route to: {decision.next_actor}")
             return {"next": decision.next_actor}
         
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
-            raise error 
-
-    
-
+            raise error
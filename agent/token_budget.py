@@ -0,0 +1,199 @@
+import json
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from utils.config_loader import load_config
+from logger.logger import logger
+
+try:
+    import tiktoken
+except ImportError:  # counts fall back to the characters-per-token estimate
+    tiktoken = None
+
+
+# rough size of a token in English text, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+# per-message overhead of the chat format (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class TokenCounter:
+    """
+    Counts tokens with tiktoken, falling back to a characters-per-token estimate.
+
+    The encoding of the configured model is used when tiktoken knows it and
+    cl100k_base otherwise; for non-OpenAI models this is a close approximation.
+    """
+
+    _encodings = {}
+    _encodings_lock = threading.Lock()
+
+    def __init__(self, model_name: Optional[str] = None):
+        """
+        Initializes the TokenCounter.
+
+        Args:
+            model_name (str): The model whose tokenizer should be used, if tiktoken knows it.
+        """
+        self.encoding = self._load_encoding(model_name)
+
+    @classmethod
+    def _load_encoding(cls, model_name: Optional[str]):
+        if tiktoken is None:
+            return None
+        with cls._encodings_lock:
+            if model_name not in cls._encodings:
+                try:
+                    try:
+                        encoding = tiktoken.encoding_for_model(model_name or "")
+                    except KeyError:
+                        encoding = tiktoken.get_encoding("cl100k_base")
+                except Exception as e:
+                    # the encoding files are downloaded on first use and may be unreachable
+                    logger.warning(f"tiktoken unavailable, estimating token counts: {str(e)}")
+                    encoding = None
+                cls._encodings[model_name] = encoding
+            return cls._encodings[model_name]
+
+    def count(self, text: str) -> int:
+        """
+        Returns the number of tokens in a text.
+        """
+        if not text:
+            return 0
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return -(-len(text) // CHARS_PER_TOKEN)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Returns the first `max_tokens` tokens of a text.
+        """
+        if self.encoding is not None:
+            return self.encoding.decode(self.encoding.encode(text, disallowed_special=())[:max_tokens])
+        return text[: max_tokens * CHARS_PER_TOKEN]
+
+    def count_message(self, message: BaseMessage) -> int:
+        """
+        Returns the tokens a message adds to the prompt, including its tool calls.
+        """
+        content = message.content if isinstance(message.content, str) else json.dumps(message.content)
+        tokens = MESSAGE_OVERHEAD_TOKENS + self.count(content)
+        for tool_call in getattr(message, "tool_calls", None) or []:
+            tokens += self.count(tool_call["name"]) + self.count(json.dumps(tool_call["args"]))
+        return tokens
+
+
+class TokenBudget:
+    """
+    Fits the prompt of an agent turn into a token budget.
+
+    Messages of the latest `keep_recent_turns` tool-calling turns are kept verbatim.
+    When the prompt exceeds the budget, older tool outputs are trimmed, oldest first,
+    to their first `trimmed_tool_tokens` tokens until it fits. Tool messages are
+    shortened rather than dropped, so every tool call keeps its answer.
+    """
+
+    # shared across instances so /metrics reports every graph
+    _stats = {"prompts": 0, "trimmed_prompts": 0, "trimmed_messages": 0, "tokens_saved": 0}
+    _stats_lock = threading.Lock()
+
+    def __init__(
+        self,
+        budget_tokens: int,
+        keep_recent_turns: int = 1,
+        trimmed_tool_tokens: int = 200,
+        counter: Optional[TokenCounter] = None,
+    ):
+        """
+        Initializes the TokenBudget.
+
+        Args:
+            budget_tokens (int): The maximum prompt size in tokens.
+            keep_recent_turns (int): The number of latest tool-calling turns kept verbatim.
+            trimmed_tool_tokens (int): The tokens kept of a trimmed tool output.
+            counter (TokenCounter): The token counter. Defaults to cl100k_base.
+        """
+        self.budget_tokens = budget_tokens
+        self.keep_recent_turns = keep_recent_turns
+        self.trimmed_tool_tokens = trimmed_tool_tokens
+        self.counter = counter or TokenCounter()
+
+    @classmethod
+    def from_config(cls, provider: str, model_name: Optional[str] = None) -> "TokenBudget":
+        """
+        Creates the budget of a provider from the `token_budget` config section.
+        """
+        budget_config = load_config().get("token_budget", {})
+        return cls(
+            budget_tokens=budget_config.get("providers", {}).get(
+                provider, budget_config.get("default_budget_tokens", 8000)
+            ),
+            keep_recent_turns=budget_config.get("keep_recent_turns", 1),
+            trimmed_tool_tokens=budget_config.get("trimmed_tool_tokens", 200),
+            counter=TokenCounter(model_name),
+        )
+
+    @classmethod
+    def budget_stats(cls) -> dict:
+        """
+        Returns how many prompts were trimmed and the tokens saved.
+        """
+        with cls._stats_lock:
+            return dict(cls._stats)
+
+    def _protected_from(self, messages: Sequence[BaseMessage]) -> int:
+        """
+        Returns the index from which messages belong to the latest turns kept verbatim.
+        """
+        turns = 0
+        for index in range(len(messages) - 1, -1, -1):
+            message = messages[index]
+            if isinstance(message, AIMessage) and message.tool_calls:
+                turns += 1
+                if turns >= self.keep_recent_turns:
+                    return index
+        return 0
+
+    def fit(self, messages: Sequence[BaseMessage]) -> Tuple[List[BaseMessage], int]:
+        """
+        Trims older tool outputs until the messages fit the budget.
+
+        Args:
+            messages (Sequence[BaseMessage]): The prompt, system prompt included.
+        Returns:
+            Tuple[List[BaseMessage], int]: The fitted messages and the tokens saved.
+        """
+        messages = list(messages)
+        counts = [self.counter.count_message(message) for message in messages]
+        total = sum(counts)
+        saved, trimmed = 0, 0
+        if total > self.budget_tokens:
+            for index in range(self._protected_from(messages)):
+                message = messages[index]
+                if not isinstance(message, ToolMessage) or counts[index] <= self.trimmed_tool_tokens:
+                    continue
+                content = message.content if isinstance(message.content, str) else json.dumps(message.content)
+                kept = self.counter.truncate(content, self.trimmed_tool_tokens)
+                shortened = message.model_copy(
+                    update={"content": f"{kept}\n[trimmed {counts[index] - self.trimmed_tool_tokens} tokens]"}
+                )
+                new_count = self.counter.count_message(shortened)
+                saved += counts[index] - new_count
+                total -= counts[index] - new_count
+                messages[index] = shortened
+                trimmed += 1
+                if total <= self.budget_tokens:
+                    break
+            if total > self.budget_tokens:
+                logger.warning(
+                    f"Prompt still has {total} tokens after trimming, over the {self.budget_tokens} token budget"
+                )
+        with self._stats_lock:
+            self._stats["prompts"] += 1
+            self._stats["trimmed_prompts"] += 1 if trimmed else 0
+            self._stats["trimmed_messages"] += trimmed
+            self._stats["tokens_saved"] += saved
+        return messages, saved
@@ -0,0 +1,205 @@
+import time
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from fnmatch import fnmatch
+from typing import Dict, List, Optional, Sequence
+
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import get_async_callback_manager_for_config
+from langgraph.prebuilt import ToolNode
+
+from agent.state import TripState
+from utils.config_loader import load_config
+from utils.tool_output import ToolOutputStats
+from logger.logger import logger
+
+
+# durations of the tool calls made by the batch running in the current context
+_batch_durations: ContextVar[Optional[List[float]]] = ContextVar("tool_batch_durations", default=None)
+
+
+class ConcurrentToolExecutor:
+    """
+    The graph's tool node: runs every tool call of one AI message concurrently.
+
+    Each call first takes a slot on its provider's semaphore (e.g. every Google Places
+    tool shares one) and then on its own tool's semaphore, so parallel turns from many
+    requests cannot exceed upstream quotas. Every batch logs its wall-clock time next to
+    the time the same calls would have taken one after another.
+    """
+
+    # shared across instances so the limits hold for every graph in the process; an
+    # asyncio.Semaphore belongs to one event loop, so each running loop gets its own set
+    _semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _stats = {"batches": 0, "tool_calls": 0, "wall_seconds": 0.0, "sequential_seconds": 0.0}
+    _lock = threading.Lock()
+
+    def __init__(self, tools: Sequence, concurrency_config: Optional[dict] = None):
+        """
+        Initializes the ConcurrentToolExecutor.
+
+        Args:
+            tools (Sequence): The tools the agent may call.
+            concurrency_config (dict): The `tool_concurrency` config section. Loaded from the config file when omitted.
+        """
+        if concurrency_config is None:
+            concurrency_config = load_config().get("tool_concurrency", {})
+        self.default_limit = concurrency_config.get("default_per_tool", 4)
+        self.tool_limits: Dict[str, int] = concurrency_config.get("per_tool", {})
+        self.provider_limits: Dict[str, int] = concurrency_config.get("per_provider", {})
+        self.tool_providers: Dict[str, str] = concurrency_config.get("tool_providers", {})
+        # set by DestinationPrefetcher when speculative prefetching is enabled
+        self.prefetcher = None
+        self.tool_node = ToolNode(tools, awrap_tool_call=self._limited_call)
+
+    def provider_of(self, tool_name: str) -> Optional[str]:
+        """
+        Returns the upstream provider of a tool from the `tool_providers` glob patterns.
+        """
+        for pattern, provider in self.tool_providers.items():
+            if fnmatch(tool_name, pattern):
+                return provider
+        return None
+
+    @classmethod
+    def _semaphore(cls, key: str, limit: int) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            semaphores = cls._semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(key)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(limit)
+                semaphores[key] = semaphore
+            return semaphore
+
+    @classmethod
+    def reset_semaphores(cls) -> None:
+        """
+        Drops the shared semaphores of every loop so the next calls create them with the current limits.
+
+        Calls holding a slot keep it and release it on the old semaphore.
+        """
+        with cls._lock:
+            cls._semaphores.clear()
+
+    @asynccontextmanager
+    async def slots(self, tool_name: str):
+        """
+        Holds a slot on the provider and tool semaphores of a tool for the duration of the block.
+        """
+        provider = self.provider_of(tool_name)
+        tool_semaphore = self._semaphore(
+            f"tool:{tool_name}", self.tool_limits.get(tool_name, self.default_limit)
+        )
+        # always provider first, then tool, so concurrent calls cannot deadlock
+        provider_semaphore = (
+            self._semaphore(f"provider:{provider}", self.provider_limits[provider])
+            if provider in self.provider_limits
+            else None
+        )
+        if provider_semaphore is not None:
+            await provider_semaphore.acquire()
+        try:
+            async with tool_semaphore:
+                yield
+        finally:
+            if provider_semaphore is not None:
+                provider_semaphore.release()
+
+    async def _limited_call(self, request, execute):
+        """
+        Runs one tool call under its provider and tool semaphores, recording its duration.
+
+        Calls already fetched by the prefetcher are answered from its results instead.
+        """
+        start = time.perf_counter()
+        if self.prefetcher is not None:
+            message = await self.prefetcher.serve(request.tool_call, request.state)
+            if message is not None:
+                self._record(start)
+                ToolOutputStats.record_result(request.tool_call["name"], str(message.content))
+                await self._report_served(request, message)
+                return message
+        async with self.slots(request.tool_call["name"]):
+            start = time.perf_counter()
+            try:
+                message = await execute(request)
+            finally:
+                self._record(start)
+        if isinstance(message, ToolMessage):
+            ToolOutputStats.record_result(request.tool_call["name"], str(message.content))
+        return message
+
+    @staticmethod
+    async def _report_served(request, message: ToolMessage) -> None:
+        """
+        Emits the tool start and end callbacks of a call answered by the prefetcher.
+
+        The tool itself never runs for such a call, so without this event consumers
+        (e.g. the SSE stream) would not see it.
+        """
+        runtime = getattr(request, "runtime", None)
+        manager = get_async_callback_manager_for_config(getattr(runtime, "config", None) or {})
+        tool_call = request.tool_call
+        run_manager = await manager.on_tool_start(
+            {"name": tool_call["name"], "description": getattr(request.tool, "description", "")},
+            str(tool_call["args"]),
+            name=tool_call["name"],
+            inputs=tool_call["args"],
+            tool_call_id=tool_call["id"],
+        )
+        await run_manager.on_tool_end(message, name=tool_call["name"])
+
+    @staticmethod
+    def _record(start: float) -> None:
+        durations = _batch_durations.get()
+        if durations is not None:
+            durations.append(time.perf_counter() - start)
+
+    async def run(self, state: TripState, config: RunnableConfig) -> dict:
+        """
+        The node function: executes the tool calls of the latest AI message in parallel.
+
+        Args:
+            state (TripState): The current state of the graph containing messages.
+            config (RunnableConfig): The run config, forwarded to the tools.
+        Returns:
+            dict: The state update holding one ToolMessage per tool call.
+        """
+        durations: List[float] = []
+        token = _batch_durations.set(durations)
+        start = time.perf_counter()
+        try:
+            result = await self.tool_node.ainvoke(state, config)
+        finally:
+            _batch_durations.reset(token)
+        wall = time.perf_counter() - start
+        sequential = sum(durations)
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["tool_calls"] += len(durations)
+            self._stats["wall_seconds"] += wall
+            self._stats["sequential_seconds"] += sequential
+        logger.info(
+            f"Ran {len(durations)} tool calls in {wall:.2f}s wall clock "
+            f"(sequential {sequential:.2f}s, saved {max(sequential - wall, 0.0):.2f}s)"
+        )
+        return result
+
+    @classmethod
+    def execution_stats(cls) -> dict:
+        """
+        Returns the batch counters and the total wall-clock time saved by running tools in parallel.
+        """
+        with cls._lock:
+            stats = dict(cls._stats)
+        stats["saved_seconds"] = round(max(stats["sequential_seconds"] - stats["wall_seconds"], 0.0), 3)
+        stats["wall_seconds"] = round(stats["wall_seconds"], 3)
+        stats["sequential_seconds"] = round(stats["sequential_seconds"], 3)
+        return stats
@@ -0,0 +1,68 @@
+"""
+Load benchmark for the /query endpoint.
+
+Sends the same batch of trip queries to a running TripMate server twice: once
+one request at a time, then all at once. Before the async request path a single
+uvicorn worker served the concurrent batch about as slowly as the sequential
+one. With the async path the concurrent wall-clock time should be close to
+that of the slowest single request.
+
+Usage:
+    uvicorn main:app --port 8001 --workers 1
+    python benchmarks/query_concurrency.py --url http://127.0.0.1:8001 --concurrency 8
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+QUERIES = [
+    "Plan a 3 day trip to Goa",
+    "Plan a weekend in Paris on a budget",
+    "5 day itinerary for Tokyo with food recommendations",
+    "Plan a 4 day trip to Rome with museums",
+    "2 day trip to Munnar with hiking",
+    "Plan a week in Bali for a family",
+    "3 days in Barcelona with nightlife",
+    "Plan a 4 day trip to Istanbul",
+]
+
+
+async def timed_query(client: httpx.AsyncClient, url: str, query: str) -> float:
+    """
+    Sends one query and returns its latency in seconds.
+    """
+    start = time.perf_counter()
+    response = await client.post(f"{url}/query", json={"query": query})
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run(url: str, concurrency: int, timeout: float) -> None:
+    queries = [QUERIES[i % len(QUERIES)] for i in range(concurrency)]
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        start = time.perf_counter()
+        sequential = [await timed_query(client, url, q) for q in queries]
+        sequential_wall = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent = await asyncio.gather(*(timed_query(client, url, q) for q in queries))
+        concurrent_wall = time.perf_counter() - start
+
+    print(f"requests            : {concurrency}")
+    print(f"sequential wall (s) : {sequential_wall:.2f}")
+    print(f"concurrent wall (s) : {concurrent_wall:.2f}")
+    print(f"median latency (s)  : {statistics.median(sequential):.2f} sequential, "
+          f"{statistics.median(concurrent):.2f} concurrent")
+    print(f"speed-up            : {sequential_wall / concurrent_wall:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8001")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.concurrency, args.timeout))
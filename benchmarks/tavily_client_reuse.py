@@ -0,0 +1,89 @@
+"""
+Benchmark of the Tavily fallback path with and without client reuse.
+
+The Tavily HTTP call is replaced by a canned response, so the numbers isolate
+what the fallback path costs on top of the network: building a TavilySearch
+per query (the old behaviour) versus reusing the pooled client.
+
+Usage:
+    python benchmarks/tavily_client_reuse.py --iterations 200
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_tavily import TavilySearch
+from langchain_tavily._utilities import TavilySearchAPIWrapper
+
+from utils.place_info_search import TavilyPlaceSearchTool
+
+CANNED = {
+    "query": "q",
+    "answer": "Beaches, forts and markets.",
+    "results": [{"title": "Goa", "url": "https://example.com", "content": "Beaches"}],
+    "images": [],
+}
+
+
+async def _fake_raw_results_async(self, *args, **kwargs):
+    return CANNED
+
+
+def _fake_raw_results(self, *args, **kwargs):
+    return CANNED
+
+
+async def per_call_client(api_key: str, place: str) -> str:
+    """
+    The fallback path before pooling: a new TavilySearch for every query.
+    """
+    tavily_tool = TavilySearch(tavily_api_key=api_key, topic="general", include_answer="advanced")
+    result = await tavily_tool.ainvoke({"query": f"top attractive places in and around {place}"})
+    return result["answer"]
+
+
+async def pooled_client(tavily: TavilyPlaceSearchTool, place: str) -> str:
+    """
+    The fallback path with the pooled client, bypassing the place cache.
+    """
+    return await tavily._atavily_query(f"top attractive places in and around {place}")
+
+
+async def measure(fn, iterations: int) -> list:
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await fn(f"city-{i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(name: str, latencies: list) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{name:<18} mean {statistics.mean(latencies):7.3f} ms   p50 {statistics.median(latencies):7.3f} ms   p95 {p95:7.3f} ms")
+
+
+async def main(iterations: int) -> None:
+    TavilySearchAPIWrapper.raw_results = _fake_raw_results
+    TavilySearchAPIWrapper.raw_results_async = _fake_raw_results_async
+    api_key = os.environ.get("TAVILY_API_KEY", "tvly-benchmark")
+    tavily = TavilyPlaceSearchTool(api_key)
+
+    before = await measure(lambda place: per_call_client(api_key, place), iterations)
+    after = await measure(lambda place: pooled_client(tavily, place), iterations)
+    report("per-call client", before)
+    report("pooled client", after)
+    print(f"saved per fallback  {statistics.mean(before) - statistics.mean(after):.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -1,25 +1,203 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
+from contextvars import ContextVar
 from datetime import datetime
+from fnmatch import fnmatch
+from typing import Dict, Optional
 
+import yaml
+
+
+LOG_FORMAT = "[ %(asctime)s ] %(lineno)d %(name)s - %(levelname)s - %(message)s"
+
+DEFAULT_LOGGING_SETTINGS = {
+    "level": "INFO",
+    "json": False,
+    "console": True,
+    "queue": True,
+    "max_bytes": 10 * 1024 * 1024,
+    "backup_count": 5,
+    "sampling": {},
+}
+
+# the id of the request being served, attached to every record logged while serving it
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Attaches the current request id to every record.
+
+    Runs in the thread that logs, before the record is queued, so the id of the
+    request that produced the record is captured rather than the listener's.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps one in every N records of noisy sources at INFO level and below.
+
+    Rules map glob patterns, matched against "<logger name>.<module>" (e.g.
+    "trip_mate.tool_output" or "httpx.*"), to the fraction of records kept. Warnings
+    and errors are never sampled.
+    """
+
+    def __init__(self, rules: Dict[str, float]):
+        super().__init__()
+        self.rules = rules
+        self.dropped = 0
+        self._rates: Dict[str, float] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rate(self, source: str) -> float:
+        rate = self._rates.get(source)
+        if rate is None:
+            rate = next((r for pattern, r in self.rules.items() if fnmatch(source, pattern)), 1.0)
+            self._rates[source] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or not self.rules:
+            return True
+        source = f"{record.name}.{record.module}"
+        rate = self._rate(source)
+        if rate >= 1.0:
+            return True
+        with self._lock:
+            count = self._counters.get(source, 0)
+            self._counters[source] = count + 1
+            # deterministic 1-in-N keeps the first record of every run and an even spread after it
+            keep = rate > 0 and count % max(1, round(1 / rate)) == 0
+            if not keep:
+                self.dropped += 1
+        return keep
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as single-line JSON objects.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "request_id": getattr(record, "request_id", None),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _LightQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that does the least work needed on the logging thread.
+
+    The stdlib handler formats and copies every record before queueing it; this one
+    only merges the arguments into the message (so later changes to them cannot leak
+    into the log) and renders tracebacks, leaving the formatting to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        request_id = getattr(record, "request_id", None)
+        return f"{message} [request_id={request_id}]" if request_id else message
+
+
+def load_logging_settings(config_path: str = "config/config.yaml") -> dict:
+    """
+    Reads the `logging` config section.
+
+    utils.config_loader logs through this module, so the file is read directly here.
+    """
+    try:
+        with open(config_path, "r") as file:
+            section = (yaml.safe_load(file) or {}).get("logging", {})
+    except (OSError, yaml.YAMLError):
+        section = {}
+    return {**DEFAULT_LOGGING_SETTINGS, **section}
+
+
+def configure_logging(settings: dict, log_path: str, stream=None) -> Optional[logging.handlers.QueueListener]:
+    """
+    Replaces the root handlers with a rotating file handler and a console handler.
+
+    With `queue` enabled the root only gets a QueueHandler, and a QueueListener thread
+    formats and writes the records, so file and console I/O leave the calling thread.
+
+    Args:
+        settings (dict): The logging settings.
+        log_path (str): The log file.
+        stream: The console stream. Defaults to stderr.
+    Returns:
+        QueueListener: The started listener, or None when logging synchronously.
+    """
+    formatter = JsonFormatter() if settings["json"] else _TextFormatter(LOG_FORMAT)
+    handlers = [
+        logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=settings["max_bytes"], backupCount=settings["backup_count"], encoding="utf-8"
+        )
+    ]
+    if settings["console"]:
+        handlers.append(logging.StreamHandler(stream or sys.stderr))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(settings["level"])
+
+    listener = None
+    if settings["queue"]:
+        listener = logging.handlers.QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+        front_handlers = [_LightQueueHandler(listener.queue)]
+        listener.start()
+    else:
+        front_handlers = handlers
+    for handler in front_handlers:
+        # sampled-out records are dropped before any other work is done on them
+        handler.addFilter(SamplingFilter(settings["sampling"]))
+        handler.addFilter(RequestContextFilter())
+        root.addHandler(handler)
+    return listener
 
 
 LOG_FILE = f"{datetime.now().strftime('%m_%d_%Y_%H_%M_%S')}.log"
 logs_path = os.path.join(os.getcwd(), "logs", LOG_FILE)
 os.makedirs(os.path.dirname(logs_path), exist_ok=True)
 
-logging.basicConfig(
-    filename=logs_path,
-    format="[ %(asctime)s ] %(lineno)d %(name)s - %(levelname)s - %(message)s",
-    level=logging.INFO,
-)
-
-console = logging.StreamHandler()
-console.setLevel(logging.INFO)
-formatter = logging.Formatter(
-    "[ %(asctime)s ] %(lineno)d %(name)s - %(levelname)s - %(message)s"
-)
-console.setFormatter(formatter)
-logging.getLogger("").addHandler(console)
+_listener = configure_logging(load_logging_settings(), logs_path)
+if _listener is not None:
+    # flush the queue on interpreter exit
+    atexit.register(_listener.stop)
 
 logger = logging.getLogger("trip_mate")
@@ -1,19 +1,112 @@
 import os
 import sys
+import json
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 import uvicorn
 
 load_dotenv()
 
-from agent.agentic_workflow import GraphBuilder
-from logger.logger import logger
+from agent.graph_registry import GraphRegistry
+from agent.tool_executor import ConcurrentToolExecutor
+from agent.prefetch import DestinationPrefetcher
+from agent.response_cache import get_response_cache
+from agent.token_budget import TokenBudget
+from agent.model_cascade import ModelCascade
+from agent.supervisor import SupervisorAgent
+from utils.config_loader import load_config, load_settings, subscribe, subscribe_sections, watch_config
+from utils.http_client import get_http_pool
+from utils.model_loader import get_llm_registry
+from utils.llm_router import routing_stats
+from utils.weather_info import get_weather_caches
+from utils.currency_converter import CurrencyConverter, get_rate_table_cache
+from utils.place_info_search import get_place_cache
+from tools.place_search_tool import PlaceSearchTool
+from utils.circuit_breaker import circuit_breaker_states
+from utils.rate_limiter import rate_limiter_states
+from utils.tool_output import ToolOutputStats
+from utils.single_flight import single_flight_stats
+from logger.logger import logger, request_id_var
 from exception.exception_handling import TripMateException
 
-app = FastAPI(title="Trip Mate")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Builds the agent graphs once at startup and shares them across requests.
+    """
+    config = load_config()
+    graph_config = config.get("graph", {})
+    app.state.response_cache_enabled = config.get("response_cache", {}).get("enabled", True)
+    app.state.default_provider = graph_config.get("default_provider", "groq")
+    registry = GraphRegistry(
+        providers=graph_config.get("preload_providers", [app.state.default_provider])
+    )
+    registry_config = config.get("llm_registry", {})
+    if registry_config.get("warm_up", False):
+        get_llm_registry().warm_up(registry_config.get("warm_up_providers", []), config.get("llm", {}))
+    registry.build_all()
+    app.state.graph_registry = registry
+    subscribe_graph_settings(app)
+    watcher = (
+        asyncio.create_task(watch_config())
+        if load_settings().config_reload.enabled
+        else None
+    )
+    yield
+    if watcher is not None:
+        watcher.cancel()
+    await get_http_pool().aclose()
+
+
+def subscribe_graph_settings(app: FastAPI) -> None:
+    """
+    Applies reloaded config sections that are read when a graph is built by rebuilding the graphs.
+    """
+
+    def rebuild(changed: dict) -> None:
+        # one rebuild however many of the sections a single edit touched
+        if "tool_concurrency" in changed:
+            ConcurrentToolExecutor.reset_semaphores()
+        logger.info(f"Config sections {', '.join(changed)} changed, rebuilding graphs")
+        app.state.graph_registry.reload()
+
+    subscribe_sections(
+        ("llm", "llm_routing", "model_cascade", "tool_concurrency", "prefetch", "token_budget"), rebuild
+    )
+    subscribe(
+        "response_cache",
+        lambda cache_config: setattr(app.state, "response_cache_enabled", cache_config.get("enabled", True)),
+    )
+
+
+app = FastAPI(title="Trip Mate", lifespan=lifespan)
+
+
+@app.middleware("http")
+async def assign_request_id(request: Request, call_next):
+    """
+    Tags every log record written while serving a request with the request's id.
+
+    The id is taken from the `X-Request-ID` header when the caller sends one and is
+    echoed back in the response.
+    """
+    request_id = request.headers.get("x-request-id") or uuid.uuid4().hex[:16]
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    return response
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -35,36 +128,115 @@ async def read_root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok"}
+    """
+    Report service health along with the circuit breaker and rate limiter state of every upstream provider.
+    """
+    breakers = circuit_breaker_states()
+    degraded = any(breaker["state"] != "closed" for breaker in breakers.values())
+    return {
+        "status": "degraded" if degraded else "ok",
+        "circuit_breakers": breakers,
+        "rate_limiters": rate_limiter_states(),
+    }
+
+
+@app.get("/metrics")
+async def metrics(request: Request):
+    """
+    Report runtime statistics such as graph build timings, HTTP pool usage and cache hit rates.
+    """
+    return {
+        "graphs": request.app.state.graph_registry.stats(),
+        "llm_clients": get_llm_registry().stats(),
+        "llm_routing": routing_stats(),
+        "model_cascade": ModelCascade.cascade_stats(),
+        "supervisor": SupervisorAgent.routing_stats(),
+        "http": get_http_pool().stats(),
+        "caches": {
+            cache.name: cache.stats()
+            for cache in (*get_weather_caches(), get_rate_table_cache())
+        },
+        "currency": CurrencyConverter.conversion_stats(),
+        "place_cache": get_place_cache().cache_stats(),
+        "place_search": PlaceSearchTool.hedge_stats(),
+        "tool_execution": ConcurrentToolExecutor.execution_stats(),
+        "prefetch": DestinationPrefetcher.prefetch_stats(),
+        "response_cache": get_response_cache().cache_stats(),
+        "token_budget": TokenBudget.budget_stats(),
+        "tool_output": ToolOutputStats.output_stats(),
+        "single_flight": single_flight_stats(),
+    }
+
+
+@app.post("/graphs/reload")
+async def reload_graphs(request: Request, provider: Optional[str] = None):
+    """
+    Rebuild the compiled graph for one provider, or for all of them.
+
+    Args:
+        provider (str): The provider to rebuild. Rebuilds every graph when omitted.
+    """
+    try:
+        registry = request.app.state.graph_registry
+        reloaded = await run_in_threadpool(registry.reload, provider)
+        # answers of the old graphs may no longer match what the rebuilt ones would say
+        get_response_cache().clear()
+        return {"reloaded": reloaded, "graphs": registry.stats()}
+    except Exception as e:
+        error = TripMateException(e, sys)
+        logger.error(error.error_message)
+        return JSONResponse(status_code=500, content={"error": str(error)})
 
 
 class QueryResponse(BaseModel):
     """
     Data model for the query response.
+
+    Set `use_cache` to false (or send `Cache-Control: no-cache`) to bypass the response cache.
     """
     query: str
+    use_cache: bool = True
 
 
 @app.post("/query")
-async def query_travel_agent(query: QueryResponse):
+async def query_travel_agent(query: QueryResponse, request: Request):
     """
     FastAPI endpoint to query the travel agent.
 
     Args:
         query (QueryResponse): The user's query wrapped in a Pydantic model.
+        request (Request): The incoming request, used to reach the graph registry.
 
     Returns:
-        JSONResponse: A JSON object containing the answer or an error message.
+        JSONResponse: A JSON object containing the answer (and, in cascade mode, the model
+        and latency of every agent turn) or an error message. The `X-Cache` header tells
+        whether the answer came from the response cache.
     """
     try:
-        logger.info(f"Received query: {query.query}")
-        graph = GraphBuilder(model_provider="groq")
-        react_app = graph()
+        # lazy, capped formatting: the query text is only rendered if the record is kept
+        logger.info("Received query: %.200s", query.query)
+        provider = request.app.state.default_provider
+        response_cache = get_response_cache()
+        use_cache = (
+            request.app.state.response_cache_enabled
+            and query.use_cache
+            and "no-cache" not in request.headers.get("cache-control", "")
+        )
+        if use_cache:
+            cached_answer, tier = response_cache.lookup(provider, query.query)
+            if cached_answer is not None:
+                logger.info(f"Answered query from the response cache ({tier} match)")
+                return JSONResponse(content={"answer": cached_answer}, headers={"X-Cache": f"hit-{tier}"})
+        else:
+            response_cache.count_bypass()
+
+        # a graph missing from the registry is built on first use; keep that off the event loop
+        react_app = await run_in_threadpool(request.app.state.graph_registry.get, provider)
 
         messages = {"messages": [query.query]}
 
         logger.info("Invoking travel agent graph")
-        output = react_app.invoke(messages)
+        output = await react_app.ainvoke(messages)
 
         # if result is dict with messages:
         if isinstance(output, dict) and "messages" in output:
@@ -74,13 +246,97 @@ async def query_travel_agent(query: QueryResponse):
         else:
             final_output = str(output)
 
-        logger.info("Query processed successfully")
-        return {"answer": final_output}
+        if use_cache and final_output:
+            response_cache.store(provider, query.query, final_output)
+        tokens_saved = output.get("tokens_saved", 0) if isinstance(output, dict) else 0
+        turns = output.get("turns", []) if isinstance(output, dict) else []
+        logger.info(f"Query processed successfully, {tokens_saved} prompt tokens saved")
+        return JSONResponse(
+            content={"answer": final_output, "turns": turns} if turns else {"answer": final_output},
+            headers={"X-Cache": "miss" if use_cache else "bypass", "X-Tokens-Saved": str(tokens_saved)},
+        )
     except Exception as e:
         error = TripMateException(e, sys)
         logger.error(error.error_message)
         return JSONResponse(status_code=500, content={"error": str(error)})
 
 
+def format_sse(event: str, data: dict) -> str:
+    """
+    Formats a single Server-Sent Event frame.
+
+    Args:
+        event (str): The event name.
+        data (dict): The JSON-serializable event payload.
+
+    Returns:
+        str: The encoded SSE frame.
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@app.post("/query/stream")
+async def stream_travel_agent(query: QueryResponse, request: Request):
+    """
+    FastAPI endpoint streaming the travel agent's progress as Server-Sent Events.
+
+    Emits `message_start` when the LLM starts a new turn, `token` for every generated
+    content chunk, `tool_start`/`tool_end` around each tool call and a final `done`
+    (or `error`) event carrying the prompt tokens the token budget saved and the
+    per-turn model report of the model cascade.
+
+    Args:
+        query (QueryResponse): The user's query wrapped in a Pydantic model.
+        request (Request): The incoming request, used to reach the graph registry.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` response.
+    """
+    logger.info("Received streaming query: %.200s", query.query)
+    registry = request.app.state.graph_registry
+    provider = request.app.state.default_provider
+    messages = {"messages": [query.query]}
+
+    async def event_stream():
+        tokens_saved = 0
+        turns = []
+        try:
+            # a graph missing from the registry is built on first use; keep that off the event loop
+            react_app = await run_in_threadpool(registry.get, provider)
+            async for event in react_app.astream_events(messages, version="v2"):
+                kind = event["event"]
+                if kind == "on_chat_model_start":
+                    yield format_sse("message_start", {})
+                elif kind == "on_chat_model_stream":
+                    content = event["data"]["chunk"].content
+                    if content:
+                        yield format_sse("token", {"content": content})
+                elif kind == "on_tool_start":
+                    yield format_sse(
+                        "tool_start",
+                        {"name": event["name"], "input": event["data"].get("input")},
+                    )
+                elif kind == "on_tool_end":
+                    yield format_sse("tool_end", {"name": event["name"]})
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    # the graph itself finished; its output is the final state
+                    output = event["data"].get("output")
+                    if isinstance(output, dict):
+                        tokens_saved = output.get("tokens_saved", 0)
+                        turns = output.get("turns", [])
+            logger.info(f"Streaming query processed successfully, {tokens_saved} prompt tokens saved")
+            yield format_sse("done", {"tokens_saved": tokens_saved, "turns": turns})
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            yield format_sse("error", {"error": str(error)})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="127.0.0.1", port=8001, reload=True)
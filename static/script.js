@@ -5,6 +5,7 @@ async function sendQuery() {
     const loader = document.getElementById('loader');
     const resultContainer = document.getElementById('resultContainer');
     const responseContent = document.getElementById('responseContent');
+    const toolStatus = document.getElementById('toolStatus');
 
     const query = queryInput.value.trim();
     if (!query) return;
@@ -14,12 +15,58 @@ async function sendQuery() {
     btnText.textContent = "Planning Trip...";
     loader.classList.remove('hidden');
     resultContainer.classList.add('hidden');
+    responseContent.innerHTML = '';
+    toolStatus.textContent = '';
+
+    let rawMarkdown = '';
+    let renderPending = false;
+
+    // Re-render at most once per animation frame while tokens stream in
+    const scheduleRender = () => {
+        if (renderPending) return;
+        renderPending = true;
+        requestAnimationFrame(() => {
+            renderPending = false;
+            responseContent.innerHTML = DOMPurify.sanitize(marked.parse(rawMarkdown));
+        });
+    };
+
+    const handleEvent = (event, data) => {
+        switch (event) {
+            case 'message_start':
+                // Each LLM turn replaces the previous one; only the final turn is the plan
+                rawMarkdown = '';
+                break;
+            case 'token':
+                if (resultContainer.classList.contains('hidden')) {
+                    resultContainer.classList.remove('hidden');
+                    resultContainer.scrollIntoView({ behavior: 'smooth', block: 'start' });
+                }
+                rawMarkdown += data.content;
+                scheduleRender();
+                break;
+            case 'tool_start':
+                toolStatus.textContent = `🔎 Running ${data.name}...`;
+                toolStatus.classList.remove('hidden');
+                resultContainer.classList.remove('hidden');
+                break;
+            case 'tool_end':
+                toolStatus.textContent = `✅ Finished ${data.name}`;
+                break;
+            case 'done':
+                toolStatus.classList.add('hidden');
+                break;
+            case 'error':
+                throw new Error(data.error);
+        }
+    };
 
     try {
-        const response = await fetch('/query', {
+        const response = await fetch('/query/stream', {
             method: 'POST',
             headers: {
-                'Content-Type': 'application/json'
+                'Content-Type': 'application/json',
+                'Accept': 'text/event-stream'
             },
             body: JSON.stringify({ query: query })
         });
@@ -28,20 +75,37 @@ async function sendQuery() {
             throw new Error(`Server Error: ${response.status}`);
         }
 
-        const data = await response.json();
-        
-        // Render Markdown
-        const rawMarkdown = data.answer;
-        const cleanHtml = DOMPurify.sanitize(marked.parse(rawMarkdown));
-        
-        responseContent.innerHTML = cleanHtml;
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            // SSE frames are separated by a blank line
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const frame = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+
+                let event = 'message';
+                let data = '';
+                for (const line of frame.split('\n')) {
+                    if (line.startsWith('event: ')) event = line.slice(7);
+                    else if (line.startsWith('data: ')) data += line.slice(6);
+                }
+                handleEvent(event, data ? JSON.parse(data) : {});
+            }
+        }
+
+        responseContent.innerHTML = DOMPurify.sanitize(marked.parse(rawMarkdown));
         resultContainer.classList.remove('hidden');
-        
-        // Smooth scroll to result
-        resultContainer.scrollIntoView({ behavior: 'smooth', block: 'start' });
 
     } catch (error) {
         console.error('Error:', error);
+        toolStatus.classList.add('hidden');
         responseContent.innerHTML = `<p style="color: #ff6b6b; text-align: center;">⚠️ Something went wrong: ${error.message}. Please try again.</p>`;
         resultContainer.classList.remove('hidden');
     } finally {
@@ -0,0 +1,76 @@
+import pytest
+
+from utils import cache as cache_module
+from utils.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_value_until_ttl_expires(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("goa", "sunny")
+
+    clock[0] += 9.9
+    assert cache.get("goa") == "sunny"
+
+    clock[0] += 0.1
+    assert cache.get("goa", "expired") == "expired"
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2)
+
+    clock[0] += 5
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_resize_evicts_oldest_and_keeps_existing_expiry(clock):
+    cache = TTLCache(maxsize=3, ttl=10)
+    for key in "abc":
+        cache.set(key, key)
+
+    cache.resize(maxsize=1, ttl=100)
+    assert [key for key, _ in cache.items()] == ["c"]
+
+    clock[0] += 10
+    assert cache.get("c") is None
+
+
+def test_stats_count_hits_and_misses(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_peek_does_not_count_as_a_lookup(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("goa", "sunny")
+
+    assert (cache.peek("goa"), cache.peek("kerala", "none")) == ("sunny", "none")
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,86 @@
+import pytest
+
+from utils import circuit_breaker as breaker_module
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(breaker_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def make_breaker(**settings):
+    return CircuitBreaker("test", **{"window": 4, "min_calls": 4, "open_seconds": 30, **settings})
+
+
+def test_stays_closed_until_min_calls(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure(0.1)
+
+    assert breaker.state == CLOSED
+
+
+def test_opens_on_failure_rate_and_rejects_calls(clock):
+    breaker = make_breaker()
+    breaker.record_success(0.1)
+    breaker.record_success(0.1)
+    breaker.record_failure(0.1)
+    breaker.record_failure(0.1)
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "never called")
+    assert breaker.rejected == 1
+
+
+def test_opens_on_slow_call_rate(clock):
+    breaker = make_breaker(slow_call_seconds=1.0, slow_call_rate_threshold=0.75)
+    for _ in range(3):
+        breaker.record_success(2.0)
+    breaker.record_success(0.1)
+
+    assert breaker.state == OPEN
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        breaker.record_failure(0.1)
+
+    clock[0] += 30
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    # only one trial call at a time
+    assert not breaker.allow_request()
+
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        breaker.record_failure(0.1)
+
+    def still_down():
+        raise RuntimeError("still down")
+
+    clock[0] += 30
+    with pytest.raises(RuntimeError):
+        breaker.call(still_down)
+
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+
+
+def test_reconfigure_keeps_recent_calls(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure(0.1)
+    breaker.reconfigure(window=4, min_calls=4, failure_rate_threshold=0.7)
+
+    breaker.record_success(0.1)
+    assert breaker.state == OPEN
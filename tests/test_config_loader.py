@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from utils import config_loader
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_loader, "_subscribers", [])
+    path = tmp_path / "config.yaml"
+
+    def write(text):
+        path.write_text("llm:\n  groq:\n    provider: groq\n    model_name: llama-3.1-8b-instant\n" + text)
+        # a new mtime even when the file is rewritten within the filesystem's resolution
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        return str(path)
+
+    return write
+
+
+def test_only_a_reload_notifies_subscribers(config_file):
+    path = config_file("prefetch:\n  enabled: true\n")
+    seen = []
+    config_loader.subscribe("prefetch", seen.append)
+    config_loader._reload(path)
+
+    config_file("prefetch:\n  enabled: false\n")
+    assert config_loader.load_config(path)["prefetch"] == {"enabled": False}
+    assert seen == []
+
+    config_loader._reload(path)
+    assert seen == [{"enabled": False}]
+
+
+def test_grouped_subscribers_run_once_per_reload(config_file):
+    path = config_file("prefetch:\n  enabled: true\ntoken_budget:\n  enabled: true\n")
+    calls = []
+    config_loader.subscribe_sections(("prefetch", "token_budget", "llm"), calls.append)
+    config_loader._reload(path)
+
+    config_file("prefetch:\n  enabled: false\ntoken_budget:\n  enabled: false\n")
+    config_loader._reload(path)
+
+    assert calls == [{"prefetch": {"enabled": False}, "token_budget": {"enabled": False}}]
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.cache import TTLCache
+from utils.currency_converter import CurrencyConverter
+
+
+RATES = {"USD": 1.0, "INR": 83.0, "EUR": 0.9}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, rates):
+        self.rates = rates
+
+    def json(self):
+        return {"conversion_rates": self.rates}
+
+
+class FakeHttp:
+    """
+    Serves RATES for every base after a short delay, counting the downloads.
+    """
+
+    def __init__(self):
+        self.downloads = []
+        self._lock = threading.Lock()
+
+    def get(self, upstream, url):
+        with self._lock:
+            self.downloads.append(url.rsplit("/", 1)[-1])
+        time.sleep(0.05)
+        return FakeResponse(RATES)
+
+    async def aget(self, upstream, url):
+        self.downloads.append(url.rsplit("/", 1)[-1])
+        await asyncio.sleep(0.05)
+        return FakeResponse(RATES)
+
+
+@pytest.fixture
+def converter():
+    converter = CurrencyConverter("test")
+    converter.http = FakeHttp()
+    converter.rate_tables = TTLCache(maxsize=8, ttl=60, name="test_rates")
+    return converter
+
+
+def test_cached_table_answers_other_pairs_by_triangulation(converter):
+    converter.rate_tables.set("USD", RATES)
+    triangulated = CurrencyConverter.conversion_stats()["triangulated"]
+
+    assert converter.convert(90, "EUR", "INR") == pytest.approx(8300.0)
+    assert converter.http.downloads == []
+    assert CurrencyConverter.conversion_stats()["triangulated"] == triangulated + 1
+
+
+def test_a_conversion_makes_one_cache_lookup(converter):
+    converter.convert(1, "USD", "INR")
+    converter.convert(1, "USD", "EUR")
+
+    stats = converter.rate_tables.stats()
+    assert (stats["misses"], stats["hits"]) == (1, 1)
+
+
+def test_concurrent_misses_share_one_download(converter):
+    threads = [threading.Thread(target=converter.convert, args=(1, "USD", "INR")) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert converter.http.downloads == ["USD"]
+
+
+def test_concurrent_async_misses_share_one_download(converter):
+    async def convert_all():
+        return await asyncio.gather(*(converter.aconvert(1, "USD", "INR") for _ in range(5)))
+
+    assert asyncio.run(convert_all()) == pytest.approx([83.0] * 5)
+    assert converter.http.downloads == ["USD"]
+
+
+def test_batch_from_table_converts_through_the_table_base():
+    converted = CurrencyConverter._batch_from_table(
+        RATES, [(10, "USD", "INR"), (83, "INR", "USD"), (90, "EUR", "INR")]
+    )
+
+    assert converted == pytest.approx([830.0, 1.0, 8300.0])
+
+
+def test_batch_from_table_keeps_input_order_and_same_currency_items():
+    converted = CurrencyConverter._batch_from_table(RATES, [(5, "EUR", "EUR"), (1, "INR", "EUR")])
+
+    assert converted == pytest.approx([5.0, 0.9 / 83.0])
+
+
+def test_batch_from_table_names_every_missing_currency():
+    with pytest.raises(ValueError, match="GBP, JPY not found"):
+        CurrencyConverter._batch_from_table(RATES, [(1, "USD", "JPY"), (1, "GBP", "USD")])
+
+
+def test_batches_update_the_conversion_counters(converter):
+    before = CurrencyConverter.conversion_stats()
+    converter.convert_batch([(1, "USD", "INR"), (1, "EUR", "INR")])
+    converter.convert_batch([(1, "INR", "USD")])
+    after = CurrencyConverter.conversion_stats()
+
+    delta = {key: after[key] - before[key] for key in after}
+    assert delta == {"conversions": 3, "in_memory": 1, "triangulated": 2, "downloads": 1}
@@ -0,0 +1,40 @@
+from langchain_core.callbacks import AsyncCallbackManager, BaseCallbackHandler
+
+from utils.llm_router import streams_tokens, without_token_streaming
+
+
+class Tracer(BaseCallbackHandler):
+    pass
+
+
+class TokenStream(BaseCallbackHandler):
+    def tap_output_aiter(self, run_id, output):
+        return output
+
+
+def test_token_streaming_handlers_are_removed_from_a_list():
+    tracer = Tracer()
+    config = {"callbacks": [tracer, TokenStream()], "tags": ["agent"]}
+
+    stripped = without_token_streaming(config)
+
+    assert stripped == {"callbacks": [tracer], "tags": ["agent"]}
+    assert streams_tokens(config)
+
+
+def test_token_streaming_handlers_are_removed_from_a_manager():
+    tracer = Tracer()
+    manager = AsyncCallbackManager(handlers=[tracer, TokenStream()])
+    manager.add_handler(TokenStream(), inherit=True)
+
+    stripped = without_token_streaming({"callbacks": manager})["callbacks"]
+
+    assert (stripped.handlers, stripped.inheritable_handlers) == ([tracer], [])
+    assert len(manager.handlers) == 3
+
+
+def test_configs_without_streaming_are_kept():
+    config = {"callbacks": [Tracer()]}
+
+    assert without_token_streaming(config) is config
+    assert without_token_streaming(None) is None
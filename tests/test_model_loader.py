@@ -0,0 +1,43 @@
+import pytest
+
+from utils.llm_router import DEFAULT_ROUTING_SETTINGS
+from utils.model_loader import LLMRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test")
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    return LLMRegistry()
+
+
+def llm_config(groq_model, openai_model="gpt-3.5-turbo"):
+    return {"groq": {"model_name": groq_model}, "openai": {"model_name": openai_model}}
+
+
+def test_clients_are_shared_per_provider_model_and_params(registry):
+    first = registry.get("groq", "llama-3.1-8b-instant")
+
+    assert registry.get("groq", "llama-3.1-8b-instant") is first
+    assert registry.get("groq", "llama-3.1-8b-instant", temperature=0) is not first
+
+
+def test_router_follows_a_reloaded_llm_section(registry):
+    old = registry.router(["groq", "openai"], llm_config("llama-3.1-8b-instant"))
+    new = registry.router(["groq", "openai"], llm_config("llama-3.3-70b-versatile"))
+
+    assert new is not old
+    assert new.models["groq"].model_name == "llama-3.3-70b-versatile"
+    assert registry.router(["groq", "openai"], llm_config("llama-3.3-70b-versatile")) is new
+
+
+def test_router_missing_a_provider_is_not_shared(registry):
+    config = {"groq": {"model_name": "llama-3.1-8b-instant"}}
+    first = registry.router(["groq", "openai"], config)
+
+    assert list(first.models) == ["groq"]
+    assert registry.router(["groq", "openai"], config) is not first
+
+
+def test_llm_hedging_is_opt_in():
+    assert DEFAULT_ROUTING_SETTINGS["hedging"]["enabled"] is False
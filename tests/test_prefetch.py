@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import tool
+
+from agent.prefetch import DestinationPrefetcher, extract_destination
+from agent.tool_executor import ConcurrentToolExecutor
+
+
+@tool
+async def get_weather(city: str) -> str:
+    """Returns the weather of a city."""
+    return f"sunny in {city}"
+
+
+@tool
+async def search_attractions(place: str) -> str:
+    """Returns the attractions of a place."""
+    await asyncio.sleep(10)
+    return f"forts in {place}"
+
+
+def make_prefetcher():
+    tools = [get_weather, search_attractions]
+    executor = ConcurrentToolExecutor(tools, {})
+    return DestinationPrefetcher(tools, executor, {"tools": ["get_weather", "search_attractions"], "ttl_seconds": 60})
+
+
+@pytest.mark.parametrize(
+    "query, destination",
+    [
+        ("Plan a trip to Goa for 4 days", "Goa"),
+        ("3 days in Paris", "Paris"),
+        ("I am visiting New York next week", "New York"),
+        ("plan a trip to goa", "Goa"),
+        ("Trip to Goa In December", "Goa"),
+        ("Plan a trip to the Maldives", "Maldives"),
+        ("a 4 day itinerary for Goa in December", "Goa"),
+        ("Going in December to Kerala", "Kerala"),
+    ],
+)
+def test_destination_is_extracted(query, destination):
+    assert extract_destination(query) == destination
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["what should I pack", "Plan a trip to somewhere warm", "how do currencies work", "best beaches in December"],
+)
+def test_no_destination_is_guessed_without_one(query):
+    assert extract_destination(query) is None
+
+
+def test_prefetch_serves_calls_naming_the_city_with_its_country():
+    prefetcher = make_prefetcher()
+
+    async def main():
+        state = await prefetcher.run({"messages": [HumanMessage("Plan a trip to Goa")]}, {})
+        call = {"name": "get_weather", "args": {"city": "Goa, India"}, "id": "call-1"}
+        return await prefetcher.serve(call, state)
+
+    message = asyncio.run(main())
+    assert message.content == "sunny in Goa"
+
+
+def test_unused_prefetches_are_cancelled_when_the_request_ends():
+    prefetcher = make_prefetcher()
+
+    async def main():
+        state = await prefetcher.run({"messages": [HumanMessage("Plan a trip to Goa")]}, {})
+        tasks = list(prefetcher._scopes[state["prefetch_key"]][1].values())
+        await prefetcher.release(state)
+        await asyncio.sleep(0)
+        return tasks, state
+
+    tasks, state = asyncio.run(main())
+    assert tasks[1].cancelled()
+    assert state["prefetch_key"] not in prefetcher._scopes
@@ -0,0 +1,157 @@
+import httpx
+import pytest
+
+from utils import rate_limiter as limiter_module
+from utils.rate_limiter import RateLimiter, RateLimitedTransport, RateLimitExceeded
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(limiter_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def make_limiter(**settings):
+    return RateLimiter("test", **{"rate_per_second": 1.0, "burst": 10, "initial_concurrency": 4, **settings})
+
+
+def test_success_raises_the_limit_additively(clock):
+    limiter = make_limiter()
+    limiter.on_success()
+
+    assert limiter.limit == pytest.approx(4.25)
+
+
+def test_throttle_cuts_the_limit_once_per_cooldown(clock):
+    limiter = make_limiter(decrease_factor=0.5, decrease_cooldown_seconds=1.0)
+    limiter.on_throttled(retry_after=2.0)
+    limiter.on_throttled(retry_after=2.0)
+    assert limiter.limit == 2.0
+
+    clock[0] += 1.0
+    limiter.on_throttled()
+    assert limiter.limit == 1.0
+
+    clock[0] += 1.0
+    limiter.on_throttled()
+    assert limiter.limit == 1.0  # min_concurrency
+
+
+def test_throttle_pauses_the_provider(clock):
+    limiter = make_limiter()
+    limiter.on_throttled(retry_after=5.0)
+
+    assert limiter.snapshot()["paused_seconds"] == 5.0
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire(max_wait=1.0)
+    assert limiter.snapshot()["rejected"] == 1
+
+
+def test_concurrency_limit_caps_in_flight_calls(clock):
+    limiter = make_limiter(initial_concurrency=2)
+    limiter.acquire()
+    limiter.acquire()
+
+    assert limiter._try_acquire() > 0
+    limiter.release()
+    assert limiter._try_acquire() == 0
+
+
+def test_token_bucket_refills_at_the_rate(clock):
+    limiter = make_limiter(burst=1, initial_concurrency=8)
+    limiter.acquire()
+
+    assert limiter._try_acquire() == pytest.approx(1.0)
+    clock[0] += 1.0
+    assert limiter._try_acquire() == 0
+
+
+def test_rate_limit_error_in_block_counts_as_throttle(clock):
+    limiter = make_limiter()
+
+    class TooManyRequests(Exception):
+        status_code = 429
+
+    with pytest.raises(TooManyRequests):
+        with limiter.limit_call():
+            raise TooManyRequests()
+
+    snapshot = limiter.snapshot()
+    assert (snapshot["throttled"], snapshot["in_flight"], snapshot["concurrency_limit"]) == (1, 0, 2.0)
+
+
+def test_transport_retries_a_429_and_frees_the_slot():
+    responses = iter([httpx.Response(429, headers={"retry-after": "0"}), httpx.Response(200, content=b"ok")])
+    limiter = make_limiter(rate_per_second=100.0, max_wait_seconds=1.0)
+    client = httpx.Client(transport=RateLimitedTransport(limiter, httpx.MockTransport(lambda request: next(responses))))
+
+    response = client.get("http://upstream/")
+
+    assert response.status_code == 200
+    snapshot = limiter.snapshot()
+    assert (snapshot["acquired"], snapshot["throttled"], snapshot["in_flight"]) == (2, 1, 0)
+
+
+def test_transport_returns_a_429_whose_pause_exceeds_the_budget():
+    calls = []
+    limiter = make_limiter(max_wait_seconds=1.0)
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"retry-after": "30"})
+
+    client = httpx.Client(transport=RateLimitedTransport(limiter, httpx.MockTransport(handler)))
+
+    assert client.get("http://upstream/").status_code == 429
+    assert len(calls) == 1
+
+
+def test_transport_marks_a_given_up_429_as_final():
+    limiter = make_limiter(max_wait_seconds=1.0, retries_on_429=0)
+    client = httpx.Client(transport=RateLimitedTransport(limiter, httpx.MockTransport(lambda request: httpx.Response(429))))
+
+    assert client.get("http://upstream/").headers["x-should-retry"] == "false"
+
+
+def test_transport_answers_a_refused_call_with_a_final_429(clock):
+    calls = []
+    limiter = make_limiter(max_wait_seconds=1.0)
+    limiter.on_throttled(retry_after=30.0)
+    client = httpx.Client(transport=RateLimitedTransport(limiter, httpx.MockTransport(calls.append)))
+
+    response = client.get("http://upstream/")
+
+    assert (response.status_code, response.headers["x-should-retry"], calls) == (429, "false", [])
+
+
+def test_sdk_retries_server_errors_but_not_final_429s(monkeypatch):
+    openai = pytest.importorskip("openai")
+    monkeypatch.setattr(openai._base_client.BaseClient, "_calculate_retry_timeout", lambda *args: 0)
+    statuses = []
+
+    def client_for(codes):
+        limiter = make_limiter(rate_per_second=100.0, max_wait_seconds=1.0, retries_on_429=0)
+        replies = iter(codes)
+
+        def handler(request):
+            statuses.append(next(replies))
+            return httpx.Response(statuses[-1], json={"object": "list", "data": []})
+
+        http = httpx.Client(transport=RateLimitedTransport(limiter, httpx.MockTransport(handler)))
+        return openai.OpenAI(api_key="test", base_url="http://upstream/v1", http_client=http, max_retries=2)
+
+    assert client_for([500, 200]).models.list().data == []
+    assert statuses == [500, 200]
+
+    statuses.clear()
+    with pytest.raises(openai.RateLimitError):
+        client_for([429, 200]).models.list()
+    assert statuses == [429]
+
+
+def test_reconfigure_applies_new_limits_within_bounds(clock):
+    limiter = make_limiter(initial_concurrency=8)
+    limiter.reconfigure(rate_per_second=2.0, burst=3, max_concurrency=4)
+
+    assert (limiter.rate, limiter.burst, limiter.tokens, limiter.limit) == (2.0, 3.0, 3.0, 4)
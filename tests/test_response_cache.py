@@ -0,0 +1,97 @@
+from agent.response_cache import ResponseCache, query_tokens
+
+
+def make_cache(**settings):
+    return ResponseCache(**{"maxsize": 8, "ttl": 60, **settings})
+
+
+def test_query_tokens_drop_filler_and_plurals():
+    assert query_tokens("Plan a 3-day trip to Goa, please") == ["3", "day", "trip", "goa"]
+    assert query_tokens("3 days in Goa") == query_tokens("3 day Goa")
+
+
+def test_exact_hit_ignores_filler_words():
+    cache = make_cache()
+    cache.store("groq", "3 day trip to Goa", "goa plan")
+
+    assert cache.lookup("groq", "Please plan a 3 day trip to Goa") == ("goa plan", "exact")
+
+
+def test_answers_are_kept_per_provider():
+    cache = make_cache()
+    cache.store("groq", "3 day trip to Goa", "goa plan")
+
+    assert cache.lookup("openai", "3 day trip to Goa") == (None, "miss")
+
+
+def test_reordered_short_query_is_a_near_hit():
+    cache = make_cache()
+    cache.store("groq", "3 day trip to Goa", "goa plan")
+
+    assert cache.lookup("groq", "a 3-day Goa trip") == ("goa plan", "near")
+
+
+def test_short_query_with_an_added_qualifier_misses():
+    cache = make_cache()
+    cache.store("groq", "3 day trip to Goa", "goa plan")
+    cache.store("groq", "plan a trip to Paris", "paris plan")
+    cache.store("groq", "5 day trip to Kerala", "kerala plan")
+
+    assert cache.lookup("groq", "3 day budget trip to Goa") == (None, "miss")
+    assert cache.lookup("groq", "plan a cheap trip to Paris") == (None, "miss")
+    assert cache.lookup("groq", "5 day trip to Kerala with kids") == (None, "miss")
+
+
+def test_long_rephrasing_is_a_near_hit():
+    cache = make_cache()
+    cache.store("groq", "a relaxed 4 day beach and food itinerary for Goa in December", "goa plan")
+
+    answer, tier = cache.lookup("groq", "a relaxed 4 day beach and food itinerary for Goa during December")
+
+    assert (answer, tier) == ("goa plan", "near")
+
+
+def test_different_numbers_or_destinations_never_match():
+    cache = make_cache(exact_match_max_tokens=0, threshold=0.5)
+    cache.store("groq", "relaxed 3 day beach itinerary for Goa", "goa plan")
+
+    assert cache.lookup("groq", "relaxed 5 day beach itinerary for Goa") == (None, "miss")
+    assert cache.lookup("groq", "relaxed 3 day beach itinerary for Kerala") == (None, "miss")
+
+
+def test_month_is_not_mistaken_for_the_destination():
+    cache = make_cache()
+    cache.store("groq", "a relaxed 4 day beach and food itinerary for Goa in December", "goa plan")
+
+    assert cache.lookup("groq", "a relaxed 4 day beach and food itinerary for Kerala in December") == (None, "miss")
+
+
+def test_expired_answers_are_dropped(monkeypatch):
+    from agent import response_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    cache = make_cache(ttl=10)
+    cache.store("groq", "3 day trip to Goa", "goa plan")
+
+    now[0] += 10
+    assert cache.lookup("groq", "3 day trip to Goa") == (None, "miss")
+    assert cache.cache_stats()["size"] == 0
+
+
+def test_reversed_route_never_matches():
+    cache = make_cache(exact_match_max_tokens=0, threshold=0.5)
+    cache.store("groq", "Plan a trip from Goa to Mumbai", "goa to mumbai")
+
+    assert cache.lookup("groq", "Plan a trip from Mumbai to Goa") == (None, "miss")
+    assert cache.lookup("groq", "from Mumbai to Goa") == (None, "miss")
+    assert cache.lookup("groq", "Plan a trip from Goa to Mumbai") == ("goa to mumbai", "exact")
+
+
+def test_negated_query_never_matches():
+    cache = make_cache(exact_match_max_tokens=0, threshold=0.5)
+    cache.store("groq", "best vegetarian food and beach shacks to try in Goa this winter", "veg food")
+
+    negated = "best non vegetarian food and beach shacks to try in Goa this winter"
+    assert cache.lookup("groq", negated) == (None, "miss")
+    assert cache.lookup("groq", "best food and beach shacks to try in Goa this winter without vegetarian") == (None, "miss")
@@ -0,0 +1,110 @@
+import pytest
+
+from agent.route_classifier import RouteClassifier
+
+
+# held-out requests, none of them in TRAINING_QUERIES; multi-step ones start with the
+# first step the supervisor prompt asks for (transport, then hotel, then itinerary)
+EVALUATION_QUERIES = [
+    ("I need a hotel and flight to Paris", "TransportAgent"),
+    ("Book a cab from the airport to my hotel in Goa", "TransportAgent"),
+    ("Plan a 5 day trip to Goa with flights and hotels", "TransportAgent"),
+    ("flights from Delhi to Bangkok in March", "TransportAgent"),
+    ("how much does the ferry to Havelock cost", "TransportAgent"),
+    ("is there an overnight train from Mumbai to Goa", "TransportAgent"),
+    ("cheapest airline from Chennai to Singapore", "TransportAgent"),
+    ("what is the bus fare from Pune to Nashik", "TransportAgent"),
+    ("how do I get from Kyoto to Osaka", "TransportAgent"),
+    ("taxi prices from Dubai airport to the Marina", "TransportAgent"),
+    ("book a hotel near Times Square", "HotelAgent"),
+    ("I need a room in Amsterdam for two nights", "HotelAgent"),
+    ("best resorts in Phuket for a family", "HotelAgent"),
+    ("budget hostels in Prague", "HotelAgent"),
+    ("where can I stay in Lisbon near the old town", "HotelAgent"),
+    ("hotel availability in Jaipur next weekend", "HotelAgent"),
+    ("boutique accommodation in Udaipur with a lake view", "HotelAgent"),
+    ("check in times and room rates at Goa beach resorts", "HotelAgent"),
+    ("a cheap hotel close to Kyoto station", "HotelAgent"),
+    ("book a hotel near the airport in Delhi", "HotelAgent"),
+    ("what are the must see attractions in Lisbon", "ItineraryAgent"),
+    ("give me a day by day plan for 4 days in Prague", "ItineraryAgent"),
+    ("what is the weather in Bali in July", "ItineraryAgent"),
+    ("best restaurants to try in Bangkok", "ItineraryAgent"),
+    ("is Cairo safe for solo travellers", "ItineraryAgent"),
+    ("things to do in Amsterdam in the evening", "ItineraryAgent"),
+    ("suggest an itinerary for 3 days in Udaipur", "ItineraryAgent"),
+    ("top museums in London", "ItineraryAgent"),
+    ("good hikes near Manali", "ItineraryAgent"),
+    ("plan a weekend in Pondicherry", "ItineraryAgent"),
+]
+# requests that do not name a worker's job; the fast path must leave them to the LLM
+AMBIGUOUS_QUERIES = [
+    "Plan my honeymoon in Maldives",
+    "help me with my trip to Japan",
+    "plan something fun for our anniversary",
+    "what should I pack for Iceland",
+]
+FAST_PATH_THRESHOLD = 0.8
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return RouteClassifier()
+
+
+@pytest.mark.parametrize(
+    "query, actor",
+    [
+        ("find flights from mumbai to goa", "TransportAgent"),
+        ("train tickets from delhi to jaipur", "TransportAgent"),
+        ("find a hotel near the beach in goa", "HotelAgent"),
+        ("where should I stay in Lisbon", "HotelAgent"),
+        ("create a 3 day itinerary for paris", "ItineraryAgent"),
+        ("what is the weather like in goa in december", "ItineraryAgent"),
+    ],
+)
+def test_clear_requests_are_routed_confidently(classifier, query, actor):
+    predicted, confidence = classifier.predict(query)
+
+    assert predicted == actor
+    assert confidence >= 0.8
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "how many nights should I spend in Rome",
+        "How long should I stay in Kyoto?",
+        "Is two nights enough for Venice",
+    ],
+)
+def test_trip_length_questions_are_not_hotel_requests(classifier, query):
+    predicted, _ = classifier.predict(query)
+
+    assert predicted == "ItineraryAgent"
+
+
+def test_held_out_accuracy(classifier):
+    predictions = [(classifier.predict(query), actor) for query, actor in EVALUATION_QUERIES]
+    accuracy = sum(predicted == actor for (predicted, _), actor in predictions) / len(predictions)
+    confident_mistakes = [
+        (predicted, actor)
+        for (predicted, confidence), actor in predictions
+        if confidence >= FAST_PATH_THRESHOLD and predicted != actor
+    ]
+
+    assert accuracy >= 0.9
+    assert confident_mistakes == []
+
+
+@pytest.mark.parametrize("query", AMBIGUOUS_QUERIES)
+def test_ambiguous_requests_are_left_to_the_llm(classifier, query):
+    _, confidence = classifier.predict(query)
+
+    assert confidence < FAST_PATH_THRESHOLD
+
+
+def test_probabilities_are_valid(classifier):
+    _, confidence = classifier.predict("something unrelated")
+
+    assert 1 / 3 <= confidence <= 1.0
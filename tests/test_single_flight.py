@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_async_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "forts"
+
+    async def main():
+        return await asyncio.gather(*(flight.ado("goa", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["forts"] * 5
+    assert len(calls) == 1
+    assert flight.flight_stats() == {"calls": 5, "executions": 1, "coalesced": 4, "errors": 0, "in_flight": 0}
+
+
+def test_key_is_released_once_the_call_finishes():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+
+    async def main():
+        return [await flight.ado("goa", fetch), await flight.ado("goa", fetch)]
+
+    assert asyncio.run(main()) == [1, 2]
+
+
+def test_errors_are_shared_with_every_waiter():
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def main():
+        return await asyncio.gather(flight.ado("goa", fail), flight.ado("goa", fail), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.flight_stats()["errors"] == 1
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flight = SingleFlight("test")
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        first = asyncio.create_task(flight.ado("goa", fetch))
+        second = asyncio.create_task(flight.ado("goa", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "done"
+
+
+def test_threads_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return "rates"
+
+    threads = [threading.Thread(target=lambda: results.append(flight.do("usd", fetch))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["rates"] * 4
+    assert len(calls) == 1
+
+
+def test_thread_errors_are_raised_to_the_leader():
+    flight = SingleFlight("test")
+
+    def fail():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        flight.do("usd", fail)
+    assert flight.flight_stats()["in_flight"] == 0
@@ -0,0 +1,65 @@
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from agent.token_budget import TokenBudget, TokenCounter
+
+
+def make_counter():
+    # the characters-per-token estimate keeps counts independent of tiktoken downloads
+    counter = TokenCounter()
+    counter.encoding = None
+    return counter
+
+
+def tool_turn(call_id, output_chars):
+    return [
+        AIMessage(content="", tool_calls=[{"name": "search_attractions", "args": {"place": "Goa"}, "id": call_id}]),
+        ToolMessage(content="x" * output_chars, tool_call_id=call_id),
+    ]
+
+
+def conversation():
+    return [SystemMessage(content="system"), HumanMessage(content="plan goa")] + tool_turn("1", 4000) + tool_turn("2", 4000)
+
+
+def test_prompt_within_budget_is_unchanged():
+    messages = conversation()
+    budget = TokenBudget(budget_tokens=10_000, counter=make_counter())
+
+    fitted, saved = budget.fit(messages)
+
+    assert fitted == messages
+    assert saved == 0
+
+
+def test_older_tool_outputs_are_trimmed_and_latest_turn_kept():
+    messages = conversation()
+    budget = TokenBudget(budget_tokens=1500, keep_recent_turns=1, trimmed_tool_tokens=50, counter=make_counter())
+
+    fitted, saved = budget.fit(messages)
+
+    assert len(fitted) == len(messages)
+    assert fitted[3].content.startswith("x" * 200)
+    # 1000 content tokens plus the message overhead, minus the 50 kept
+    assert fitted[3].content.endswith("\n[trimmed 954 tokens]")
+    assert fitted[3].tool_call_id == "1"
+    assert fitted[5] == messages[5]
+    assert saved > 900
+
+
+def test_trimming_stops_once_the_prompt_fits():
+    messages = conversation() + tool_turn("3", 4000)
+    budget = TokenBudget(budget_tokens=2200, keep_recent_turns=1, trimmed_tool_tokens=50, counter=make_counter())
+
+    fitted, _ = budget.fit(messages)
+
+    assert "[trimmed" in fitted[3].content
+    assert fitted[5] == messages[5]
+
+
+def test_messages_are_never_dropped_when_over_budget():
+    messages = conversation()
+    budget = TokenBudget(budget_tokens=10, keep_recent_turns=1, trimmed_tool_tokens=50, counter=make_counter())
+
+    fitted, _ = budget.fit(messages)
+
+    assert [type(message) for message in fitted] == [type(message) for message in messages]
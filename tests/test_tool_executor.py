@@ -0,0 +1,50 @@
+import asyncio
+
+from langchain_core.tools import tool
+
+from agent.tool_executor import ConcurrentToolExecutor
+
+
+@tool
+def search_places(query: str) -> str:
+    """Searches places."""
+    return query
+
+
+def make_executor():
+    return ConcurrentToolExecutor(
+        [search_places],
+        {"default_per_tool": 1, "per_provider": {"google": 1}, "tool_providers": {"search_*": "google"}},
+    )
+
+
+def test_each_event_loop_gets_its_own_semaphores():
+    executor = make_executor()
+
+    async def hold_slot():
+        async with executor.slots("search_places"):
+            return ConcurrentToolExecutor._semaphore("tool:search_places", 1)
+
+    first = asyncio.run(hold_slot())
+    second = asyncio.run(hold_slot())
+
+    assert first is not second
+    assert not first.locked() and not second.locked()
+
+
+def test_slots_limit_concurrent_calls_within_a_loop():
+    executor = make_executor()
+    running, peak = [0], [0]
+
+    async def call():
+        async with executor.slots("search_places"):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(3)))
+
+    asyncio.run(main())
+    assert peak[0] == 1
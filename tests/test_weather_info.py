@@ -0,0 +1,41 @@
+from utils.weather_info import aggregate_daily
+
+
+def slot(dt, temp_min, temp_max, condition, pop=0.0, rain=None):
+    entry = {"dt": dt, "main": {"temp": temp_min, "temp_min": temp_min, "temp_max": temp_max}, "weather": [{"main": condition}], "pop": pop}
+    if rain is not None:
+        entry["rain"] = {"3h": rain}
+    return entry
+
+
+DAY = 86400
+MIDNIGHT = 1_700_006_400  # 2023-11-15 00:00 UTC
+
+
+def test_slots_are_reduced_per_day():
+    forecast = {
+        "city": {"timezone": 0},
+        "list": [
+            slot(MIDNIGHT, 24, 27, "Clouds", pop=0.2),
+            slot(MIDNIGHT + 3 * 3600, 26, 31, "Rain", pop=0.7, rain=1.5),
+            slot(MIDNIGHT + 6 * 3600, 25, 30, "Rain", rain=2.0),
+            slot(MIDNIGHT + DAY, 22, 29, "Clear"),
+        ],
+    }
+
+    assert aggregate_daily(forecast) == [
+        {"date": "2023-11-15", "temp_min": 24, "temp_max": 31, "condition": "Rain", "pop": 70, "rain_mm": 3.5},
+        {"date": "2023-11-16", "temp_min": 22, "temp_max": 29, "condition": "Clear", "pop": 0, "rain_mm": 0.0},
+    ]
+
+
+def test_days_follow_the_city_timezone():
+    # 20:00 UTC is already the next day at UTC+5:30
+    forecast = {"city": {"timezone": 19800}, "list": [slot(MIDNIGHT + 20 * 3600, 20, 25, "Clear")]}
+
+    assert aggregate_daily(forecast)[0]["date"] == "2023-11-16"
+
+
+def test_empty_forecast_has_no_days():
+    assert aggregate_daily({"list": []}) == []
+    assert aggregate_daily({}) == []
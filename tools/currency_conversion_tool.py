@@ -1,6 +1,7 @@
 import os
 import sys
 from typing import List
+from pydantic import BaseModel, Field
 from langchain.tools import tool
 from utils.currency_converter import CurrencyConverter
 from dotenv import load_dotenv
@@ -8,6 +9,16 @@ from logger.logger import logger
 from exception.exception_handling import TripMateException
 
 
+class CurrencyConversionItem(BaseModel):
+    """
+    A single line of a batch currency conversion.
+    """
+
+    amount: float = Field(description="The amount to convert.")
+    from_currency: str = Field(description="The source currency code")
+    to_currency: str = Field(description="The destination currency code")
+
+
 class CurrencyConverterTool:
     """
     A class that provides currency conversion tools.
@@ -32,7 +43,7 @@ class CurrencyConverterTool:
         """
 
         @tool
-        def convert_currency(
+        async def convert_currency(
             amount: float, from_currency: str, to_currency: str
         ) -> float:
             """
@@ -50,10 +61,35 @@ class CurrencyConverterTool:
                 logger.info(
                     f"Converting {amount} from {from_currency} to {to_currency}"
                 )
-                return self.currency_service.convert(amount, from_currency, to_currency)
+                return await self.currency_service.aconvert(
+                    amount, from_currency, to_currency
+                )
+            except Exception as e:
+                error = TripMateException(e, sys)
+                logger.error(error.error_message)
+                raise error
+
+        @tool
+        async def convert_currency_batch(items: List[CurrencyConversionItem]) -> List[float]:
+            """
+            Convert many amounts between currencies in a single call.
+            Prefer this over repeated convert_currency calls, e.g. for a cost breakdown.
+
+            Args:
+                items (List[CurrencyConversionItem]): The amounts to convert, each with its source and destination currency codes.
+
+            Returns:
+                List[float]: The converted amounts, in the same order as the items.
+            """
+            try:
+                items = [CurrencyConversionItem.model_validate(item) for item in items]
+                logger.info(f"Converting a batch of {len(items)} amounts")
+                return await self.currency_service.aconvert_batch(
+                    [(item.amount, item.from_currency, item.to_currency) for item in items]
+                )
             except Exception as e:
                 error = TripMateException(e, sys)
                 logger.error(error.error_message)
                 raise error
 
-        return [convert_currency]
+        return [convert_currency, convert_currency_batch]
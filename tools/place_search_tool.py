@@ -1,18 +1,48 @@
 import os
 import sys
-from utils.place_info_search import GooglePlaceSearchTool, TavilyPlaceSearchTool
-from typing import List
+import asyncio
+import threading
+from utils.place_info_search import GOOGLE_EMPTY_RESULT, GooglePlaceSearchTool, TavilyPlaceSearchTool
+from utils.config_loader import load_config
+from utils.tool_output import cap_text, max_chars_for, output_settings
+from typing import Awaitable, Callable, List, Tuple
 from langchain.tools import tool
 from dotenv import load_dotenv
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 
 
+# (label used in the tool output, Google method, Tavily method) per search category
+SEARCH_CATEGORIES = {
+    "attractions": ("the attractions of", "agoogle_search_attractions", "atavily_search_attractions"),
+    "restaurants": ("the restaurants of", "agoogle_search_restaurants", "atavily_search_restaurants"),
+    "activities": ("the activities in and around", "agoogle_search_activity", "atavily_search_activity"),
+    "transportation": (
+        "the modes of transportation available in",
+        "agoogle_search_transportation",
+        "atavily_search_transportation",
+    ),
+}
+
 class PlaceSearchTool:
     """
     A class that provides tools for searching places and attractions.
+
+    Google Places is the primary provider and Tavily the secondary. With hedging
+    enabled, Tavily is also queried when Google has not answered within its recent
+    latency percentile; the first non-empty answer wins. The losing call is not
+    awaited, but it is not stopped either: upstream searches are shared through the
+    place cache's single flight (and the compact Google call runs in a thread), so it
+    finishes in the background, stores its result in the cache and still counts
+    against its provider's rate limiter and circuit breaker.
+    In compact mode results are short name/rating/price/address lines, capped per tool.
     """
 
+    # shared across instances so every graph feeds the same latency window and counters
+    google_latency = GooglePlaceSearchTool.upstream_latency
+    _winners = {"google": 0, "tavily": 0, "hedged": 0, "failed": 0, "losers_left_running": 0}
+    _winners_lock = threading.Lock()
+
     def __init__(self):
         """
         Initializes the PlaceSearchTool and sets up the tool list.
@@ -29,8 +59,161 @@ class PlaceSearchTool:
             "TAVILAY_API_KEY"
         )
         self.tavily_search = TavilyPlaceSearchTool(self.tavily_api_key)
+        self.hedging = load_config().get("place_search", {}).get("hedging", {})
+        self.output = output_settings()
+        self.compact = self.output.get("compact", False)
         self.place_search_tool_list = self._setup_tools()
 
+    @classmethod
+    def _count(cls, key: str) -> None:
+        with cls._winners_lock:
+            cls._winners[key] += 1
+
+    @classmethod
+    def hedge_stats(cls) -> dict:
+        """
+        Returns which provider won each place search, how many losing calls were left
+        running in the background and the recent Google latency.
+        """
+        with cls._winners_lock:
+            return {"winners": dict(cls._winners), "google_latency": cls.google_latency.stats()}
+
+    @staticmethod
+    def _is_empty(result: str) -> bool:
+        return not result or str(result).startswith(GOOGLE_EMPTY_RESULT)
+
+    def _hedge_delay(self) -> float:
+        """
+        Returns how long to wait for Google before also querying Tavily.
+
+        Uses the configured percentile of recent Places API latencies (cache hits are
+        not timed) once enough samples exist, clamped to [min_delay_seconds, max_delay_seconds].
+        """
+        observed = None
+        if len(self.google_latency) >= self.hedging.get("min_samples", 20):
+            observed = self.google_latency.percentile(self.hedging.get("percentile", 90))
+        delay = observed if observed is not None else self.hedging.get("default_delay_seconds", 2.0)
+        return min(
+            max(delay, self.hedging.get("min_delay_seconds", 0.5)),
+            self.hedging.get("max_delay_seconds", 5.0),
+        )
+
+    async def _hedged_search(
+        self,
+        place: str,
+        google_search: Callable[[str], Awaitable[str]],
+        tavily_search: Callable[[str], Awaitable[str]],
+    ) -> Tuple[str, str]:
+        """
+        Races Google against a delayed Tavily request and returns the first non-empty answer.
+
+        Returns:
+            Tuple[str, str]: The winning provider and its result.
+        """
+        tasks = {asyncio.create_task(google_search(place)): "google"}
+        delay = self._hedge_delay()
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            logger.info(f"Google slower than {delay:.2f}s for {place}, hedging with Tavily")
+            self._count("hedged")
+        tavily_started = False
+        empty_answer, last_error = None, None
+        try:
+            while True:
+                for task in done:
+                    provider = tasks.pop(task)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        logger.warning(f"{provider} search failed for {place}: {str(last_error)}")
+                    elif self._is_empty(task.result()):
+                        empty_answer = empty_answer or (provider, task.result())
+                    else:
+                        return provider, task.result()
+                # start Tavily when Google is slow, or when it finished without a usable answer
+                if not tavily_started and (not done or not tasks):
+                    tasks[asyncio.create_task(tavily_search(place))] = "tavily"
+                    tavily_started = True
+                if not tasks:
+                    break
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                # only stops waiting here: the shared upstream call runs on and fills the cache
+                if not task.done():
+                    self._count("losers_left_running")
+                task.cancel()
+        if empty_answer is not None:
+            return empty_answer
+        raise last_error
+
+    async def _find_place(self, category: str, place: str) -> Tuple[str, str, bool]:
+        """
+        Searches a category for a place on Google, using Tavily as the fallback or hedge.
+
+        Returns:
+            Tuple[str, str, bool]: The answering provider, its result and whether Google failed first.
+        """
+        _, google_method, tavily_method = SEARCH_CATEGORIES[category]
+        google_search = getattr(self.google_places_search, google_method)
+        tavily_search = getattr(self.tavily_search, tavily_method)
+
+        if self.hedging.get("enabled", False):
+            try:
+                provider, result = await self._hedged_search(place, google_search, tavily_search)
+            except Exception:
+                self._count("failed")
+                raise
+            self._count(provider)
+            return provider, result, False
+
+        try:
+            result = await google_search(place)
+            self._count("google")
+            return "google", result, False
+        except Exception as e:
+            logger.warning(
+                f"Google search failed for {place}, falling back to Tavily: {str(e)}"
+            )
+            try:
+                tavily_result = await tavily_search(place)
+                self._count("tavily")
+                return "tavily", tavily_result, True
+            except Exception:
+                self._count("failed")
+                raise
+
+    def _format_answer(self, category: str, place: str, provider: str, result: str, google_failed: bool) -> str:
+        """
+        Formats a search result as the tool output, capped to the tool's size limit in compact mode.
+        """
+        label = SEARCH_CATEGORIES[category][0]
+        if provider == "google" and self._is_empty(result):
+            return f"Google couldn't find any {category} for {place}."
+        if self.compact:
+            return cap_text(
+                f"{category.capitalize()} in {place} ({provider}):\n{result}",
+                max_chars_for(f"search_{category}", self.output),
+            )
+        if provider == "google":
+            return f"Following are {label} {place} as suggested by google: {result}"
+        if google_failed:
+            return f"Google search failed. Following are {label} {place} from fallback search: {result}"
+        return f"Following are {label} {place} from fallback search: {result}"
+
+    async def _search_place(self, category: str, place: str) -> str:
+        """
+        Searches a category for a place and formats the answer.
+
+        Args:
+            category (str): One of the SEARCH_CATEGORIES keys.
+            place (str): The name of the place.
+
+        Returns:
+            str: The search result prefixed with its provider.
+        """
+        provider, result, google_failed = await self._find_place(category, place)
+        return self._format_answer(category, place, provider, result, google_failed)
+
     def _setup_tools(self) -> List:
         """
         Setup and define the tools for place search.
@@ -40,7 +223,7 @@ class PlaceSearchTool:
         """
 
         @tool
-        def search_attractions(place: str) -> str:
+        async def search_attractions(place: str) -> str:
             """
             Search for attractions in a specific place.
 
@@ -52,26 +235,14 @@ class PlaceSearchTool:
             """
             try:
                 logger.info(f"Searching attractions for: {place}")
-                attraction_result = self.google_places_search.google_search_attractions(
-                    place
-                )
-                if attraction_result:
-                    return f"Following are the attractions of {place} as suggested by google: {attraction_result}"
-                return f"Google couldn't find any attractions for {place}."
+                return await self._search_place("attractions", place)
             except Exception as e:
-                logger.warning(
-                    f"Google search failed for {place}, falling back to Tavily: {str(e)}"
-                )
-                try:
-                    tavily_result = self.tavily_search.tavily_search_attractions(place)
-                    return f"Google search failed. Following are the attractions of {place} from fallback search: {tavily_result}"
-                except Exception as ex:
-                    error = TripMateException(ex, sys)
-                    logger.error(error.error_message)
-                    raise error
+                error = TripMateException(e, sys)
+                logger.error(error.error_message)
+                raise error
 
         @tool
-        def search_restaurants(place: str) -> str:
+        async def search_restaurants(place: str) -> str:
             """
             Search for restaurants in a specific place.
 
@@ -83,26 +254,14 @@ class PlaceSearchTool:
             """
             try:
                 logger.info(f"Searching restaurants for: {place}")
-                restaurants_result = (
-                    self.google_places_search.google_search_restaurants(place)
-                )
-                if restaurants_result:
-                    return f"Following are the restaurants of {place} as suggested by google: {restaurants_result}"
-                return f"Google couldn't find any restaurants for {place}."
+                return await self._search_place("restaurants", place)
             except Exception as e:
-                logger.warning(
-                    f"Google search failed for {place}, falling back to Tavily: {str(e)}"
-                )
-                try:
-                    tavily_result = self.tavily_search.tavily_search_restaurants(place)
-                    return f"Google search failed. Following are the restaurants of {place} from fallback search: {tavily_result}"
-                except Exception as ex:
-                    error = TripMateException(ex, sys)
-                    logger.error(error.error_message)
-                    raise error
+                error = TripMateException(e, sys)
+                logger.error(error.error_message)
+                raise error
 
         @tool
-        def search_activities(place: str) -> str:
+        async def search_activities(place: str) -> str:
             """
             Search for activities in a specific place.
 
@@ -114,26 +273,14 @@ class PlaceSearchTool:
             """
             try:
                 logger.info(f"Searching activities for: {place}")
-                activities_result = self.google_places_search.google_search_activity(
-                    place
-                )
-                if activities_result:
-                    return f"Following are the activities in and around {place} as suggested by google: {activities_result}"
-                return f"Google couldn't find any activities for {place}."
+                return await self._search_place("activities", place)
             except Exception as e:
-                logger.warning(
-                    f"Google search failed for {place}, falling back to Tavily: {str(e)}"
-                )
-                try:
-                    tavily_result = self.tavily_search.tavily_search_activity(place)
-                    return f"Google search failed. Following are the activities of {place} from fallback search: {tavily_result}"
-                except Exception as ex:
-                    error = TripMateException(ex, sys)
-                    logger.error(error.error_message)
-                    raise error
+                error = TripMateException(e, sys)
+                logger.error(error.error_message)
+                raise error
 
         @tool
-        def search_transportation(place: str) -> str:
+        async def search_transportation(place: str) -> str:
             """
             Search for transportation options in a specific place.
 
@@ -144,25 +291,11 @@ class PlaceSearchTool:
             """
             try:
                 logger.info(f"Searching transportation for: {place}")
-                transportation_result = (
-                    self.google_places_search.google_search_transportation(place)
-                )
-                if transportation_result:
-                    return f"Following are the modes of transportation available in {place} as suggested by google: {transportation_result}"
-                return f"Google couldn't find any transportation options for {place}."
+                return await self._search_place("transportation", place)
             except Exception as e:
-                logger.warning(
-                    f"Google search failed for {place}, falling back to Tavily: {str(e)}"
-                )
-                try:
-                    tavily_result = self.tavily_search.tavily_search_transportation(
-                        place
-                    )
-                    return f"Google search failed. Following are the modes of transportation available in {place} from fallback search: {tavily_result}"
-                except Exception as ex:
-                    error = TripMateException(ex, sys)
-                    logger.error(error.error_message)
-                    raise error
+                error = TripMateException(e, sys)
+                logger.error(error.error_message)
+                raise error
 
         return [
             search_attractions,
@@ -6,7 +6,8 @@ from langchain.tools import tool
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 
-from utils.weather_info import WeatherForecastTool
+from utils.weather_info import WeatherForecastTool, aggregate_daily
+from utils.tool_output import cap_lines, max_chars_for, output_settings
 
 
 class WeatherInfoTool:
@@ -21,6 +22,8 @@ class WeatherInfoTool:
         load_dotenv()
         self.api_key = os.environ.get("OPENWEATHER_API_KEY")
         self.weather_service = WeatherForecastTool(self.api_key)
+        self.output = output_settings()
+        self.compact = self.output.get("compact", False)
         self.weather_tool_list = self._setup_tools()
 
     def _setup_tools(self) -> List:
@@ -31,7 +34,7 @@ class WeatherInfoTool:
             list: A list of decorated tool functions.
         """
         @tool
-        def get_current_weather(city: str) -> str:
+        async def get_current_weather(city: str) -> str:
             """
             Get the current weather for a specific city.
 
@@ -43,12 +46,14 @@ class WeatherInfoTool:
             """
             try:
                 logger.info(f"Fetching current weather for: {city}")
-                weather_data = self.weather_service.get_current_weather(city)
+                weather_data = await self.weather_service.aget_current_weather(city)
                 if weather_data:
                     temp = weather_data.get("main", {}).get("temp", "N/A")
                     desc = weather_data.get("weather", [{}])[0].get(
                         "description", "N/A"
                     )
+                    if self.compact and isinstance(temp, (int, float)):
+                        return f"Current weather in {city}: {round(temp)}°C, {desc}"
                     return f"Current weather in {city}: {temp}c, {desc}"
                 return f"Couldn't fetch current weather details for {city}"
             except Exception as e:
@@ -56,9 +61,9 @@ class WeatherInfoTool:
                 logger.error(error.error_message)
                 raise error
         @tool
-        def get_weather_forecast(city: str) -> str:
+        async def get_weather_forecast(city: str) -> str:
             """
-            Get the weather forecast for a specific city.
+            Get the 5 day weather forecast for a specific city.
 
             Args:
                 city (str): The name of the city.
@@ -68,7 +73,17 @@ class WeatherInfoTool:
             """
             try:
                 logger.info(f"Fetching weather forecast for: {city}")
-                forecast_data = self.weather_service.get_weather_forecast(city)
+                forecast_data = await self.weather_service.aget_weather_forecast(city)
+                if forecast_data and "list" in forecast_data and self.weather_service.forecast_mode == "daily":
+                    rows = [
+                        f"{day['date']} | {day['temp_min']}-{day['temp_max']} | {day['condition']} | "
+                        f"{day['pop']}% | {day['rain_mm']}"
+                        for day in aggregate_daily(forecast_data)
+                    ]
+                    return cap_lines(
+                        [f"Daily weather forecast for {city}:", "date | min-max °C | condition | rain chance | rain mm", *rows],
+                        max_chars_for("get_weather_forecast", self.output),
+                    )
                 if forecast_data and "list" in forecast_data:
                     forecast_summary = []
                     for i in range(len(forecast_data["list"])):
@@ -76,8 +91,17 @@ class WeatherInfoTool:
                         date = item["dt_txt"].split(" ")[0]
                         temp = item["main"]["temp"]
                         desc = item["weather"][0]["description"]
-                        forecast_summary.append(
-                            f"{date}: {temp} degree Celsius, {desc}"
+                        if self.compact:
+                            forecast_summary.append(f"{date}: {round(temp)}°C, {desc}")
+                        else:
+                            forecast_summary.append(
+                                f"{date}: {temp} degree Celsius, {desc}"
+                            )
+                    if self.compact:
+                        # consecutive 3-hour slots often repeat once temperatures are rounded
+                        unique = list(dict.fromkeys(forecast_summary))
+                        return f"Weather forecast for {city}:\n" + cap_lines(
+                            unique, max_chars_for("get_weather_forecast", self.output)
                         )
                     return f"Weather forecast for {city}:\n" + "\n".join(
                         forecast_summary
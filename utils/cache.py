@@ -0,0 +1,124 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    A thread-safe in-memory cache with per-entry expiry and LRU eviction.
+
+    Entries expire `ttl` seconds after they were stored. When the cache holds
+    `maxsize` entries, the least recently used one is evicted to make room.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0, name: str = "cache"):
+        """
+        Initializes the TTLCache.
+
+        Args:
+            maxsize (int): The maximum number of entries kept in memory.
+            ttl (float): The time-to-live of an entry in seconds.
+            name (str): A name used when reporting statistics.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value of a key, or `default` if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value of a key like `get`, without counting a lookup or refreshing recency.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return default
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+            ttl (float): Overrides the cache-wide time-to-live for this entry.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maxsize: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """
+        Changes the size limit and the default time-to-live, evicting entries that no longer fit.
+
+        Entries already stored keep the expiry they were given.
+        """
+        with self._lock:
+            if ttl is not None:
+                self.ttl = ttl
+            if maxsize is not None:
+                self.maxsize = maxsize
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+
+    def items(self) -> list:
+        """
+        Returns the unexpired (key, value) pairs, most recently used last.
+
+        Unlike `get`, this does not count as a lookup or refresh recency.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [(key, entry[1]) for key, entry in self._data.items() if entry[0] > now]
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """
+        Returns the size and hit/miss counters of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
@@ -0,0 +1,264 @@
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional
+
+from utils.config_loader import load_config, subscribe
+from logger.logger import logger
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_BREAKER_SETTINGS = {
+    "window": 20,
+    "min_calls": 5,
+    "failure_rate_threshold": 0.5,
+    "slow_call_seconds": 5.0,
+    "slow_call_rate_threshold": 0.8,
+    "open_seconds": 30.0,
+    "half_open_max_calls": 1,
+}
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling a provider whose circuit breaker is open.
+    """
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} is unavailable (circuit open, retry in {retry_in:.0f}s)")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    A closed/open/half-open circuit breaker for one upstream provider.
+
+    While closed, the outcome of the last `window` calls is tracked; once at least
+    `min_calls` were made, the breaker opens if the failure rate or the rate of calls
+    slower than `slow_call_seconds` crosses its threshold. An open breaker rejects calls
+    for `open_seconds`, then lets `half_open_max_calls` trial calls through: a success
+    closes it again, a failure re-opens it.
+    """
+
+    def __init__(self, name: str, **settings):
+        """
+        Initializes the CircuitBreaker.
+
+        Args:
+            name (str): The provider guarded by the breaker.
+            **settings: Overrides of DEFAULT_BREAKER_SETTINGS.
+        """
+        self.name = name
+        self.settings = {**DEFAULT_BREAKER_SETTINGS, **settings}
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._calls = deque(maxlen=self.settings["window"])
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self._half_open_calls = 0
+        logger.warning(f"Circuit breaker for {self.name} opened")
+
+    def retry_in(self) -> float:
+        """
+        Returns the seconds left before an open breaker lets a trial call through.
+        """
+        return max(0.0, self.opened_at + self.settings["open_seconds"] - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """
+        Returns whether a call may go to the provider, reserving a trial slot when half-open.
+        """
+        with self._lock:
+            if self.state == OPEN and self.retry_in() == 0:
+                self.state = HALF_OPEN
+                self._half_open_calls = 0
+                logger.info(f"Circuit breaker for {self.name} half-open")
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and self._half_open_calls < self.settings["half_open_max_calls"]:
+                self._half_open_calls += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, duration: float) -> None:
+        """
+        Records a successful call and its duration in seconds.
+        """
+        slow = duration >= self.settings["slow_call_seconds"]
+        with self._lock:
+            if self.state == HALF_OPEN:
+                if slow:
+                    self._open()
+                    return
+                self.state = CLOSED
+                self._calls.clear()
+                logger.info(f"Circuit breaker for {self.name} closed")
+                return
+            self._calls.append((True, slow))
+            self._evaluate()
+
+    def record_failure(self, duration: float) -> None:
+        """
+        Records a failed call and its duration in seconds.
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._open()
+                return
+            self._calls.append((False, duration >= self.settings["slow_call_seconds"]))
+            self._evaluate()
+
+    def release(self) -> None:
+        """
+        Gives back a half-open trial slot of a call that was abandoned (e.g. cancelled).
+        """
+        with self._lock:
+            if self.state == HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def _evaluate(self) -> None:
+        if self.state != CLOSED or len(self._calls) < self.settings["min_calls"]:
+            return
+        failures = sum(1 for ok, _ in self._calls if not ok) / len(self._calls)
+        slow = sum(1 for _, is_slow in self._calls if is_slow) / len(self._calls)
+        if (
+            failures >= self.settings["failure_rate_threshold"]
+            or slow >= self.settings["slow_call_rate_threshold"]
+        ):
+            self._open()
+
+    def check(self) -> None:
+        """
+        Raises CircuitOpenError if the provider may not be called right now.
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """
+        Calls `fn` through the breaker, recording its outcome.
+
+        Raises:
+            CircuitOpenError: If the breaker is open.
+        """
+        self.check()
+        start = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_failure(time.monotonic() - start)
+            raise
+        self.record_success(time.monotonic() - start)
+        return result
+
+    async def acall(self, fn: Callable[..., Awaitable], *args, **kwargs):
+        """
+        Awaits `fn` through the breaker, recording its outcome. Cancellation is not counted.
+
+        Raises:
+            CircuitOpenError: If the breaker is open.
+        """
+        self.check()
+        start = time.monotonic()
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.release()
+            raise
+        except Exception:
+            self.record_failure(time.monotonic() - start)
+            raise
+        self.record_success(time.monotonic() - start)
+        return result
+
+    def reconfigure(self, **settings) -> None:
+        """
+        Applies reloaded settings, keeping the breaker's state and its recent calls.
+
+        Args:
+            **settings: Overrides of DEFAULT_BREAKER_SETTINGS.
+        """
+        with self._lock:
+            self.settings = {**DEFAULT_BREAKER_SETTINGS, **settings}
+            if self._calls.maxlen != self.settings["window"]:
+                self._calls = deque(self._calls, maxlen=self.settings["window"])
+
+    def snapshot(self) -> dict:
+        """
+        Returns the state and recent failure rate of the breaker.
+        """
+        with self._lock:
+            state = self.state
+            if state == OPEN and self.retry_in() == 0:
+                state = HALF_OPEN
+            calls = len(self._calls)
+            failures = sum(1 for ok, _ in self._calls if not ok)
+            return {
+                "state": state,
+                "recent_calls": calls,
+                "failure_rate": round(failures / calls, 3) if calls else 0.0,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "retry_in_seconds": round(self.retry_in(), 1) if state == OPEN else 0.0,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_breaker_config: Optional[dict] = None
+
+
+def _provider_settings(breaker_config: dict, provider: str) -> dict:
+    return {
+        **breaker_config.get("default", {}),
+        **breaker_config.get("providers", {}).get(provider, {}),
+    }
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """
+    Returns the process-wide circuit breaker of a provider, creating it on first use.
+    """
+    global _breaker_config
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(provider)
+            if breaker is None:
+                if _breaker_config is None:
+                    _breaker_config = load_config().get("circuit_breakers", {})
+                    subscribe("circuit_breakers", _reconfigure_breakers)
+                breaker = CircuitBreaker(provider, **_provider_settings(_breaker_config, provider))
+                _breakers[provider] = breaker
+    return breaker
+
+
+def _reconfigure_breakers(breaker_config: dict) -> None:
+    global _breaker_config
+    with _breakers_lock:
+        _breaker_config = breaker_config
+        breakers = list(_breakers.values())
+    for breaker in breakers:
+        breaker.reconfigure(**_provider_settings(breaker_config, breaker.name))
+
+
+def circuit_breaker_states() -> dict:
+    """
+    Returns a snapshot of every circuit breaker created so far.
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
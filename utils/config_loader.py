@@ -1,27 +1,194 @@
 import yaml
 import os
 import sys
+import asyncio
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from utils.config_schema import TripMateConfig
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 
 
-def load_config(config_path: str = "config/config.yaml") -> dict:
+DEFAULT_CONFIG_PATH = "config/config.yaml"
+
+# path -> (file signature, raw config, validated config)
+_configs: Dict[str, Tuple[tuple, dict, TripMateConfig]] = {}
+# path -> signature of a file version that failed validation, so it is not re-parsed on every call
+_rejected: Dict[str, tuple] = {}
+# (sections, callback, whether the callback takes every changed section at once)
+_subscribers: List[Tuple[Tuple[str, ...], Callable, bool]] = []
+# path -> the config whose changes subscribers were last told about, by `watch_config`
+_applied: Dict[str, dict] = {}
+_config_lock = threading.RLock()
+
+
+def _signature(config_path: str) -> tuple:
+    stat = os.stat(config_path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _parse(config_path: str) -> Tuple[dict, TripMateConfig]:
+    """
+    Reads and validates a config file, merging the `performance` tunables into their sections.
+    """
+    with open(config_path, "r") as file:
+        config = yaml.safe_load(file) or {}
+    settings = TripMateConfig.model_validate(config)
+    settings.performance.apply(config)
+    return config, settings
+
+
+def _notify(previous: dict, config: dict) -> None:
+    """
+    Calls the subscribers of every section that changed, each callback once per reload.
+    """
+    with _config_lock:
+        subscribers = list(_subscribers)
+    for sections, callback, grouped in subscribers:
+        changed = {
+            section: config.get(section, {})
+            for section in sections
+            if previous.get(section) != config.get(section)
+        }
+        if not changed:
+            continue
+        try:
+            callback(changed if grouped else changed[sections[0]])
+        except Exception as e:
+            logger.error(f"Config subscriber of {', '.join(changed)} failed: {e}")
+
+
+def _load(config_path: str) -> Tuple[dict, TripMateConfig]:
+    """
+    Returns the cached config of a path, re-reading it when the file changed.
+    """
+    signature = _signature(config_path)
+    cached = _configs.get(config_path)
+    if cached is not None and (cached[0] == signature or _rejected.get(config_path) == signature):
+        return cached[1], cached[2]
+    with _config_lock:
+        cached = _configs.get(config_path)
+        if cached is not None and (cached[0] == signature or _rejected.get(config_path) == signature):
+            return cached[1], cached[2]
+        logger.info(f"Loading configuration from {config_path}")
+        try:
+            config, settings = _parse(config_path)
+        except Exception as e:
+            if cached is None:
+                raise
+            # keep serving the last valid config rather than failing every caller
+            _rejected[config_path] = signature
+            logger.error(f"Ignoring invalid configuration in {config_path}: {e}")
+            return cached[1], cached[2]
+        _configs[config_path] = (signature, config, settings)
+        _rejected.pop(config_path, None)
+        logger.info("Configuration loaded successfully")
+    return config, settings
+
+
+def _reload(config_path: str) -> None:
+    """
+    Re-reads a config file and tells the subscribers what changed since the last reload.
+
+    Only `watch_config` calls this, from a worker thread, so subscribers never run on a
+    request's thread or the event loop even when a request noticed the change first.
+    """
+    config = _load(config_path)[0]
+    with _config_lock:
+        previous = _applied.get(config_path)
+        _applied[config_path] = config
+    if previous is not None and previous is not config:
+        logger.info(f"Configuration in {config_path} changed, notifying subscribers")
+        _notify(previous, config)
+
+
+def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> dict:
     """
     Loads configuration from a YAML file.
+
+    The parsed config is cached per process and only re-read when the file's mtime or
+    size changes, so calling this per request is cheap. Callers must not modify the
+    returned dict.
+
     Args:
         config_path (str): The path to the configuration file.
     Returns:
         dict: The loaded configuration.
     Raises:
-        TripMateException: If the configuration file cannot be found or parsed.
+        TripMateException: If the configuration file cannot be found, parsed or validated.
     """
     try:
-        logger.info(f"Loading configuration from {config_path}")
-        with open(config_path, "r") as file:
-            config = yaml.safe_load(file)
-        logger.info("Configuration loaded successfully")
-        return config
+        return _load(config_path)[0]
+    except Exception as e:
+        error = TripMateException(e, sys)
+        logger.error(error.error_message)
+        raise error
+
+
+def load_settings(config_path: str = DEFAULT_CONFIG_PATH) -> TripMateConfig:
+    """
+    Returns the validated, typed form of the configuration.
+
+    Args:
+        config_path (str): The path to the configuration file.
+    Returns:
+        TripMateConfig: The validated configuration.
+    Raises:
+        TripMateException: If the configuration file cannot be found, parsed or validated.
+    """
+    try:
+        return _load(config_path)[1]
     except Exception as e:
         error = TripMateException(e, sys)
         logger.error(error.error_message)
         raise error
+
+
+def subscribe(section: str, callback: Callable[[dict], None]) -> None:
+    """
+    Registers a callback called with the new contents of a section whenever a reload changes it.
+
+    Callbacks run on the `watch_config` worker thread; their errors are logged and ignored.
+
+    Args:
+        section (str): The top-level config section to watch.
+        callback (Callable[[dict], None]): Receives the new section.
+    """
+    with _config_lock:
+        _subscribers.append(((section,), callback, False))
+
+
+def subscribe_sections(sections: Sequence[str], callback: Callable[[Dict[str, dict]], None]) -> None:
+    """
+    Registers a callback called once per reload that changes any of several sections.
+
+    Suits work that depends on all of the sections, such as rebuilding the graphs, which
+    should run once however many of them a single edit touched.
+
+    Args:
+        sections (Sequence[str]): The top-level config sections to watch.
+        callback (Callable[[Dict[str, dict]], None]): Receives the new contents of the changed sections.
+    """
+    with _config_lock:
+        _subscribers.append((tuple(sections), callback, True))
+
+
+async def watch_config(config_path: str = DEFAULT_CONFIG_PATH, poll_seconds: Optional[float] = None) -> None:
+    """
+    Checks the config file for changes until cancelled, so edits apply without a restart.
+
+    Args:
+        config_path (str): The path to the configuration file.
+        poll_seconds (float): The interval between checks. Defaults to `config_reload.poll_seconds`.
+    """
+    if poll_seconds is None:
+        poll_seconds = load_settings(config_path).config_reload.poll_seconds
+    logger.info(f"Watching {config_path} for changes every {poll_seconds}s")
+    await asyncio.to_thread(_reload, config_path)
+    while True:
+        await asyncio.sleep(poll_seconds)
+        try:
+            await asyncio.to_thread(_reload, config_path)
+        except Exception as e:
+            logger.error(f"Could not reload {config_path}: {e}")
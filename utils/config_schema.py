@@ -0,0 +1,176 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, PositiveFloat, PositiveInt
+
+
+class _Section(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class TimeoutSettings(_Section):
+    """
+    HTTP timeouts in seconds, applied to `http.default` and `http.upstreams`.
+    """
+
+    http_seconds: Optional[PositiveFloat] = None
+    connect_seconds: Optional[PositiveFloat] = None
+    upstreams: Dict[str, PositiveFloat] = {}
+
+
+class PoolSizeSettings(_Section):
+    """
+    HTTP connection pool sizes, applied to `http.default` and `http.upstreams`.
+    """
+
+    max_connections: Optional[PositiveInt] = None
+    max_keepalive_connections: Optional[PositiveInt] = None
+    upstreams: Dict[str, PositiveInt] = {}
+
+
+class CacheSizeSettings(_Section):
+    """
+    The maximum number of entries of the in-memory caches.
+    """
+
+    weather: Optional[PositiveInt] = None
+    currency: Optional[PositiveInt] = None
+    response: Optional[PositiveInt] = None
+
+
+class CacheTTLSettings(_Section):
+    """
+    Cache time-to-lives in seconds.
+    """
+
+    weather_current_seconds: Optional[PositiveFloat] = None
+    weather_forecast_seconds: Optional[PositiveFloat] = None
+    currency_seconds: Optional[PositiveFloat] = None
+    place_fresh_seconds: Optional[PositiveFloat] = None
+    response_seconds: Optional[PositiveFloat] = None
+
+
+class ConcurrencySettings(_Section):
+    """
+    Concurrent tool call limits, applied to `tool_concurrency`.
+    """
+
+    per_tool_default: Optional[PositiveInt] = None
+    per_tool: Dict[str, PositiveInt] = {}
+    per_provider: Dict[str, PositiveInt] = {}
+
+
+class TokenBudgetSettings(_Section):
+    """
+    Prompt token budgets, applied to `token_budget`.
+    """
+
+    default: Optional[PositiveInt] = None
+    providers: Dict[str, PositiveInt] = {}
+
+
+class PerformanceSettings(_Section):
+    """
+    The performance tunables of the service, kept in one section.
+
+    Each value is merged into the section of the component that uses it when the
+    config is loaded, so components keep reading their own section.
+    """
+
+    timeouts: TimeoutSettings = TimeoutSettings()
+    pool_sizes: PoolSizeSettings = PoolSizeSettings()
+    cache_sizes: CacheSizeSettings = CacheSizeSettings()
+    cache_ttls: CacheTTLSettings = CacheTTLSettings()
+    concurrency_limits: ConcurrencySettings = ConcurrencySettings()
+    token_budgets: TokenBudgetSettings = TokenBudgetSettings()
+
+    def apply(self, config: dict) -> None:
+        """
+        Merges the tunables into the component sections of a raw config.
+
+        Args:
+            config (dict): The raw config, updated in place.
+        """
+
+        def put(path: str, value) -> None:
+            if value is None:
+                return
+            *sections, key = path.split(".")
+            target = config
+            for section in sections:
+                target = target.setdefault(section, {})
+            target[key] = value
+
+        timeouts, pools = self.timeouts, self.pool_sizes
+        put("http.default.timeout", timeouts.http_seconds)
+        put("http.default.connect_timeout", timeouts.connect_seconds)
+        for upstream, timeout in timeouts.upstreams.items():
+            put(f"http.upstreams.{upstream}.timeout", timeout)
+        put("http.default.max_connections", pools.max_connections)
+        put("http.default.max_keepalive_connections", pools.max_keepalive_connections)
+        for upstream, size in pools.upstreams.items():
+            put(f"http.upstreams.{upstream}.max_connections", size)
+
+        put("weather_cache.maxsize", self.cache_sizes.weather)
+        put("currency_cache.maxsize", self.cache_sizes.currency)
+        put("response_cache.maxsize", self.cache_sizes.response)
+        ttls = self.cache_ttls
+        put("weather_cache.current_ttl_seconds", ttls.weather_current_seconds)
+        put("weather_cache.forecast_ttl_seconds", ttls.weather_forecast_seconds)
+        put("currency_cache.ttl_seconds", ttls.currency_seconds)
+        put("place_cache.fresh_seconds", ttls.place_fresh_seconds)
+        put("response_cache.ttl_seconds", ttls.response_seconds)
+
+        limits = self.concurrency_limits
+        put("tool_concurrency.default_per_tool", limits.per_tool_default)
+        for tool_name, limit in limits.per_tool.items():
+            put(f"tool_concurrency.per_tool.{tool_name}", limit)
+        for provider, limit in limits.per_provider.items():
+            put(f"tool_concurrency.per_provider.{provider}", limit)
+
+        put("token_budget.default_budget_tokens", self.token_budgets.default)
+        for provider, budget in self.token_budgets.providers.items():
+            put(f"token_budget.providers.{provider}", budget)
+
+
+class LLMSettings(BaseModel):
+    """
+    The model of one LLM provider.
+    """
+
+    model_config = ConfigDict(extra="allow", protected_namespaces=())
+
+    provider: str
+    model_name: str
+
+
+class GraphSettings(_Section):
+    """
+    Which provider serves requests by default and which graphs are built at startup.
+    """
+
+    default_provider: str = "groq"
+    preload_providers: List[str] = ["groq"]
+
+
+class ConfigReloadSettings(_Section):
+    """
+    How often the config file is checked for changes while the service runs.
+    """
+
+    enabled: bool = True
+    poll_seconds: PositiveFloat = 5.0
+
+
+class TripMateConfig(BaseModel):
+    """
+    The validated config file.
+
+    Sections without a schema are kept as plain dicts.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    llm: Dict[str, LLMSettings]
+    graph: GraphSettings = GraphSettings()
+    performance: PerformanceSettings = PerformanceSettings()
+    config_reload: ConfigReloadSettings = ConfigReloadSettings()
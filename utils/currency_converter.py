@@ -1,13 +1,53 @@
-import requests
 import sys
+import threading
+from collections import Counter
+from typing import List, Optional, Tuple
+import numpy as np
+from utils.cache import TTLCache
+from utils.single_flight import get_single_flight
+from utils.config_loader import load_config, subscribe
+from utils.http_client import get_http_pool
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 
 
+_rate_table_cache: Optional[TTLCache] = None
+_rate_table_cache_lock = threading.Lock()
+
+
+def get_rate_table_cache() -> TTLCache:
+    """
+    Returns the process-wide cache of exchange-rate tables keyed by base currency.
+    """
+    global _rate_table_cache
+    if _rate_table_cache is None:
+        with _rate_table_cache_lock:
+            if _rate_table_cache is None:
+                cache_config = load_config().get("currency_cache", {})
+                _rate_table_cache = TTLCache(
+                    maxsize=cache_config.get("maxsize", 32),
+                    ttl=cache_config.get("ttl_seconds", 3600),
+                    name="exchange_rates",
+                )
+                subscribe(
+                    "currency_cache",
+                    lambda config: _rate_table_cache.resize(config.get("maxsize"), config.get("ttl_seconds")),
+                )
+    return _rate_table_cache
+
+
 class CurrencyConverter:
     """
     A class to handle currency conversion using an external API.
+
+    Rate tables are cached per base currency. A pair is answered from any cached
+    table that contains both currencies (rate = table[to] / table[from]), so a
+    single download serves every pair until the table expires.
     """
+
+    _stats = {"conversions": 0, "in_memory": 0, "triangulated": 0, "downloads": 0}
+    _stats_lock = threading.Lock()
+
     def __init__(self, api_key: str):
         """
         Initializes the CurrencyConverter with an API key.
@@ -15,8 +55,224 @@ class CurrencyConverter:
             api_key (str): The API key for the exchange rate service.
         """
         self.base_url = f"https://v6.exchangerate-api.com/v6/{api_key}/latest/"
+        self.http = get_http_pool()
+        self.rate_tables = get_rate_table_cache()
+        # shared process-wide, so concurrent downloads of one base collapse into one fetch
+        self.flight = get_single_flight("exchangerate_api")
         logger.info("CurrencyConverter initialized")
 
+    @classmethod
+    def _count(cls, key: str, amount: int = 1) -> None:
+        with cls._stats_lock:
+            cls._stats[key] += amount
+
+    @classmethod
+    def _count_batch(cls, items: List[Tuple[float, str, str]], base: str, cached: bool) -> None:
+        """
+        Counts a batch like the single conversions it replaces: items whose source is not
+        the table's base currency are triangulated through it.
+        """
+        with cls._stats_lock:
+            cls._stats["conversions"] += len(items)
+            if cached:
+                cls._stats["in_memory"] += len(items)
+            cls._stats["triangulated"] += sum(1 for _, f, t in items if f not in (base, t))
+
+    @classmethod
+    def conversion_stats(cls) -> dict:
+        """
+        Returns how many conversions were answered in memory, by triangulation or after a download.
+        """
+        with cls._stats_lock:
+            return dict(cls._stats)
+
+    def _cached_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """
+        Derives the rate of a pair from any cached table holding both currencies.
+
+        This is the conversion's only counted cache lookup; the scan for a table to
+        triangulate through and the download path do not count again.
+        """
+        if from_currency == to_currency:
+            return 1.0
+        direct = self.rate_tables.get(from_currency)
+        if direct is not None and to_currency in direct:
+            return direct[to_currency]
+        for base, rates in reversed(self.rate_tables.items()):
+            if rates.get(from_currency) and to_currency in rates:
+                self._count("triangulated")
+                logger.info(f"Triangulating {from_currency}->{to_currency} via {base}")
+                return rates[to_currency] / rates[from_currency]
+        return None
+
+    @staticmethod
+    def _rate_from_table(rates: dict, from_currency: str, to_currency: str) -> float:
+        if to_currency not in rates:
+            raise ValueError(f"{to_currency} not found in the exchange rates")
+        return rates[to_currency] / rates.get(from_currency, 1.0)
+
+    def _covering_base(self, currencies: set) -> Optional[str]:
+        """
+        Returns a cached base currency whose table contains every given currency.
+        """
+        for base, rates in reversed(self.rate_tables.items()):
+            if currencies.issubset(rates):
+                return base
+        return None
+
+    @staticmethod
+    def _batch_from_table(rates: dict, items: List[Tuple[float, str, str]]) -> List[float]:
+        """
+        Converts every item in one vectorized pass over a rate table.
+
+        The table is turned into a rate vector once; each item then costs two index
+        lookups: converted = amount * rate[to] / rate[from].
+        """
+        codes = {code: index for index, code in enumerate(rates)}
+        missing = {c for _, f, t in items for c in (f, t)} - codes.keys()
+        if missing:
+            raise ValueError(f"{', '.join(sorted(missing))} not found in the exchange rates")
+        vector = np.fromiter(rates.values(), dtype=float, count=len(rates))
+        amounts = np.array([amount for amount, _, _ in items], dtype=float)
+        from_index = np.array([codes[f] for _, f, _ in items])
+        to_index = np.array([codes[t] for _, _, t in items])
+        return (amounts * vector[to_index] / vector[from_index]).tolist()
+
+    @staticmethod
+    def _normalize_items(items: List[Tuple[float, str, str]]) -> List[Tuple[float, str, str]]:
+        return [(float(a), f.strip().upper(), t.strip().upper()) for a, f, t in items]
+
+    def convert_batch(self, items: List[Tuple[float, str, str]]) -> List[float]:
+        """
+        Convert many (amount, from_currency, to_currency) items at once.
+
+        All items are answered from one rate table: a cached table covering every
+        currency if there is one, otherwise the table of the most common source currency.
+
+        Args:
+            items (List[Tuple[float, str, str]]): The conversions to perform.
+
+        Returns:
+            List[float]: The converted amounts, in input order.
+        Raises:
+            TripMateException: If the API call fails or a currency code is not found.
+        """
+        try:
+            logger.info(f"Converting a batch of {len(items)} amounts")
+            items = self._normalize_items(items)
+            if not items:
+                return []
+            currencies = {c for _, f, t in items for c in (f, t)}
+            base = self._covering_base(currencies)
+            cached = base is not None
+            if not cached:
+                base = Counter(f for _, f, _ in items).most_common(1)[0][0]
+            rates = self.get_rate_table(base)
+            converted = self._batch_from_table(rates, items)
+            self._count_batch(items, base, cached)
+            return converted
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def aconvert_batch(self, items: List[Tuple[float, str, str]]) -> List[float]:
+        """
+        Asynchronously convert many (amount, from_currency, to_currency) items at once.
+
+        Args:
+            items (List[Tuple[float, str, str]]): The conversions to perform.
+
+        Returns:
+            List[float]: The converted amounts, in input order.
+        Raises:
+            TripMateException: If the API call fails or a currency code is not found.
+        """
+        try:
+            logger.info(f"Converting a batch of {len(items)} amounts")
+            items = self._normalize_items(items)
+            if not items:
+                return []
+            currencies = {c for _, f, t in items for c in (f, t)}
+            base = self._covering_base(currencies)
+            cached = base is not None
+            if not cached:
+                base = Counter(f for _, f, _ in items).most_common(1)[0][0]
+            rates = await self.aget_rate_table(base)
+            converted = self._batch_from_table(rates, items)
+            self._count_batch(items, base, cached)
+            return converted
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    def _parse_rates(self, response) -> dict:
+        if response.status_code != 200:
+            raise Exception(f"API call failed with status {response.status_code}")
+        return response.json().get("conversion_rates", {})
+
+    def get_rate_table(self, base_currency: str) -> dict:
+        """
+        Returns the rate table of a base currency, downloading it if it is not cached.
+
+        Concurrent callers missing the same base wait for a single download.
+
+        Args:
+            base_currency (str): The base currency code.
+        Returns:
+            dict: The `conversion_rates` table of the base currency.
+        """
+        rates = self.rate_tables.get(base_currency)
+        if rates is not None:
+            return rates
+        return self._fetch_rate_table(base_currency)
+
+    def _fetch_rate_table(self, base_currency: str) -> dict:
+        return self.flight.do(base_currency, lambda: self._download_rate_table(base_currency))
+
+    def _download_rate_table(self, base_currency: str) -> dict:
+        # a download that finished just before this flight started already filled the cache
+        rates = self.rate_tables.peek(base_currency)
+        if rates is not None:
+            return rates
+        logger.info(f"Downloading exchange rates for base {base_currency}")
+        response = self.http.get("exchangerate_api", f"{self.base_url}/{base_currency}")
+        rates = self._parse_rates(response)
+        self.rate_tables.set(base_currency, rates)
+        self._count("downloads")
+        return rates
+
+    async def aget_rate_table(self, base_currency: str) -> dict:
+        """
+        Asynchronously returns the rate table of a base currency, downloading it if it is not cached.
+
+        Concurrent callers missing the same base await a single download.
+
+        Args:
+            base_currency (str): The base currency code.
+        Returns:
+            dict: The `conversion_rates` table of the base currency.
+        """
+        rates = self.rate_tables.get(base_currency)
+        if rates is not None:
+            return rates
+        return await self._afetch_rate_table(base_currency)
+
+    async def _afetch_rate_table(self, base_currency: str) -> dict:
+        return await self.flight.ado(base_currency, lambda: self._adownload_rate_table(base_currency))
+
+    async def _adownload_rate_table(self, base_currency: str) -> dict:
+        rates = self.rate_tables.peek(base_currency)
+        if rates is not None:
+            return rates
+        logger.info(f"Downloading exchange rates for base {base_currency}")
+        response = await self.http.aget("exchangerate_api", f"{self.base_url}/{base_currency}")
+        rates = self._parse_rates(response)
+        self.rate_tables.set(base_currency, rates)
+        self._count("downloads")
+        return rates
+
     def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
         """
         Convert the amount from one currency to another using the exchange rate API.
@@ -33,16 +289,49 @@ class CurrencyConverter:
         """
         try:
             logger.info(f"Converting {amount} from {from_currency} to {to_currency}")
-            url = f"{self.base_url}/{from_currency}"
-            response = requests.get(url)
+            from_currency, to_currency = from_currency.strip().upper(), to_currency.strip().upper()
+            self._count("conversions")
+            rate = self._cached_rate(from_currency, to_currency)
+            if rate is None:
+                rates = self._fetch_rate_table(from_currency)
+                rate = self._rate_from_table(rates, from_currency, to_currency)
+            else:
+                self._count("in_memory")
+
+            result = amount * rate
+            logger.info(f"Converted result: {result}")
+            return result
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def aconvert(self, amount: float, from_currency: str, to_currency: str) -> float:
+        """
+        Asynchronously convert the amount from one currency to another.
 
-            if response.status_code != 200:
-                raise Exception(f"API call failed with status {response.status_code}")
-            rates = response.json().get("conversion_rates", {})
-            if to_currency not in rates:
-                raise ValueError(f"{to_currency} not found in the exchange rates")
+        Args:
+            amount (float): The amount to convert.
+            from_currency (str): The source currency code.
+            to_currency (str): The destination currency code.
+
+        Returns:
+            float: The converted amount.
+        Raises:
+            TripMateException: If the API call fails or the currency code is not found.
+        """
+        try:
+            logger.info(f"Converting {amount} from {from_currency} to {to_currency}")
+            from_currency, to_currency = from_currency.strip().upper(), to_currency.strip().upper()
+            self._count("conversions")
+            rate = self._cached_rate(from_currency, to_currency)
+            if rate is None:
+                rates = await self._afetch_rate_table(from_currency)
+                rate = self._rate_from_table(rates, from_currency, to_currency)
+            else:
+                self._count("in_memory")
 
-            result = amount * rates[to_currency]
+            result = amount * rate
             logger.info(f"Converted result: {result}")
             return result
         except Exception as e:
@@ -0,0 +1,348 @@
+import sys
+import time
+import asyncio
+import threading
+import importlib.util
+from typing import Dict, Optional
+
+import httpx
+import requests
+
+from utils.config_loader import load_config, subscribe
+from utils.circuit_breaker import get_circuit_breaker
+from utils.rate_limiter import (
+    AsyncRateLimitedTransport,
+    RateLimitedAdapter,
+    RateLimitedTransport,
+    get_rate_limiter,
+)
+from logger.logger import logger
+from exception.exception_handling import TripMateException
+
+
+DEFAULT_HTTP_SETTINGS = {
+    "timeout": 10.0,
+    "connect_timeout": 5.0,
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    "keepalive_expiry": 30.0,
+    "http2": True,
+}
+
+
+class HttpClientPool:
+    """
+    Process-wide pooled HTTP clients, one per upstream service.
+
+    Each upstream gets a keep-alive `httpx.Client`, an `httpx.AsyncClient` and, for SDKs
+    that only accept one, a `requests.Session`, all sized and timed from the `http`
+    section of the config and rate limited per upstream by utils/rate_limiter.py.
+    Clients are created lazily and reused by every caller, so DNS, TCP and TLS setup
+    is paid once per connection instead of once per call.
+    """
+
+    def __init__(self, http_config: Optional[dict] = None):
+        """
+        Initializes the HttpClientPool.
+
+        Args:
+            http_config (dict): The `http` config section. Loaded from the config file when omitted.
+        """
+        if http_config is None:
+            http_config = load_config().get("http", {})
+        self.defaults = {**DEFAULT_HTTP_SETTINGS, **http_config.get("default", {})}
+        self.upstreams = http_config.get("upstreams", {})
+        self.http2_available = importlib.util.find_spec("h2") is not None
+        self._clients: Dict[str, httpx.Client] = {}
+        self._async_clients: Dict[str, tuple] = {}
+        self._sdk_async_clients: Dict[str, httpx.AsyncClient] = {}
+        self._sessions: Dict[str, requests.Session] = {}
+        # clients replaced by a config reload, closed with the pool since callers may still hold them
+        self._retired: list = []
+        self._stats: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        logger.info(f"HttpClientPool initialized (http2 available: {self.http2_available})")
+
+    def settings(self, upstream: str) -> dict:
+        """
+        Returns the effective settings of an upstream, falling back to the defaults.
+        """
+        return {**self.defaults, **self.upstreams.get(upstream, {})}
+
+    def _client_kwargs(self, upstream: str, asynchronous: bool = False) -> dict:
+        settings = self.settings(upstream)
+        transport_kwargs = {
+            "limits": httpx.Limits(
+                max_connections=settings["max_connections"],
+                max_keepalive_connections=settings["max_keepalive_connections"],
+                keepalive_expiry=settings["keepalive_expiry"],
+            ),
+            "http2": bool(settings["http2"]) and self.http2_available,
+        }
+        # every request of the upstream goes through its token bucket and adaptive concurrency limit
+        limiter = get_rate_limiter(upstream)
+        if asynchronous:
+            transport = AsyncRateLimitedTransport(limiter, httpx.AsyncHTTPTransport(**transport_kwargs))
+        else:
+            transport = RateLimitedTransport(limiter, httpx.HTTPTransport(**transport_kwargs))
+        return {
+            "timeout": httpx.Timeout(settings["timeout"], connect=settings["connect_timeout"]),
+            "transport": transport,
+        }
+
+    def reconfigure(self, http_config: dict) -> None:
+        """
+        Applies a reloaded `http` config section.
+
+        New timeouts are set on every existing client. Clients whose pool size changed
+        are replaced, so later calls use the new limits; the SDK clients held by chat
+        models keep their pool and only take the new timeouts.
+
+        Args:
+            http_config (dict): The new `http` config section.
+        """
+        with self._lock:
+            upstreams = set(self._clients) | set(self._async_clients) | set(self._sdk_async_clients) | set(self._sessions)
+            previous = {upstream: self.settings(upstream) for upstream in upstreams}
+            self.defaults = {**DEFAULT_HTTP_SETTINGS, **http_config.get("default", {})}
+            self.upstreams = http_config.get("upstreams", {})
+            pool_keys = ("max_connections", "max_keepalive_connections", "keepalive_expiry", "http2")
+            for upstream in upstreams:
+                settings = self.settings(upstream)
+                timeout = httpx.Timeout(settings["timeout"], connect=settings["connect_timeout"])
+                if upstream in self._sdk_async_clients:
+                    self._sdk_async_clients[upstream].timeout = timeout
+                if any(previous[upstream][key] != settings[key] for key in pool_keys):
+                    logger.info(f"Pool settings of {upstream} changed, replacing its pooled clients")
+                    for clients in (self._clients, self._async_clients, self._sessions):
+                        if upstream in clients:
+                            self._retired.append(clients.pop(upstream))
+                    continue
+                if upstream in self._clients:
+                    self._clients[upstream].timeout = timeout
+                if upstream in self._async_clients:
+                    self._async_clients[upstream][1].timeout = timeout
+
+    def _record(self, upstream: str, **changes) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(upstream, _empty_stats())
+            for key, value in changes.items():
+                stats[key] += value
+
+    def client(self, upstream: str) -> httpx.Client:
+        """
+        Returns the shared synchronous client of an upstream.
+        """
+        with self._lock:
+            client = self._clients.get(upstream)
+            if client is None:
+                logger.info(f"Creating pooled HTTP client for {upstream}")
+                client = httpx.Client(**self._client_kwargs(upstream))
+                self._clients[upstream] = client
+            return client
+
+    def async_client(self, upstream: str) -> httpx.AsyncClient:
+        """
+        Returns the shared asynchronous client of an upstream for the running event loop.
+
+        An `httpx.AsyncClient` is bound to the loop it first ran on, so a new one is
+        created if the pool is used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._async_clients.get(upstream)
+            if entry is None or entry[0] is not loop:
+                logger.info(f"Creating pooled async HTTP client for {upstream}")
+                entry = (loop, httpx.AsyncClient(**self._client_kwargs(upstream, asynchronous=True)))
+                self._async_clients[upstream] = entry
+            return entry[1]
+
+    def sdk_async_client(self, upstream: str) -> httpx.AsyncClient:
+        """
+        Returns a shared asynchronous client for SDKs that keep their client for their lifetime.
+
+        Unlike `async_client`, this can be called outside an event loop (e.g. while a graph
+        is rebuilt in a worker thread); the client binds to the loop that first uses it.
+        """
+        with self._lock:
+            client = self._sdk_async_clients.get(upstream)
+            if client is None:
+                logger.info(f"Creating pooled SDK async HTTP client for {upstream}")
+                client = httpx.AsyncClient(**self._client_kwargs(upstream, asynchronous=True))
+                self._sdk_async_clients[upstream] = client
+            return client
+
+    def requests_session(self, upstream: str) -> requests.Session:
+        """
+        Returns a pooled `requests.Session` for SDKs that are built on `requests`.
+        """
+        with self._lock:
+            session = self._sessions.get(upstream)
+            if session is None:
+                settings = self.settings(upstream)
+                session = requests.Session()
+                adapter = RateLimitedAdapter(
+                    get_rate_limiter(upstream),
+                    pool_connections=settings["max_keepalive_connections"],
+                    pool_maxsize=settings["max_connections"],
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[upstream] = session
+            return session
+
+    def get(self, upstream: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Sends a GET request through the pooled client of an upstream.
+
+        Args:
+            upstream (str): The upstream name, used to pick the client and its settings.
+            url (str): The URL to request.
+            **kwargs: Extra arguments passed to `httpx.Client.get`.
+
+        Returns:
+            httpx.Response: The response.
+        Raises:
+            CircuitOpenError: If the upstream's circuit breaker is open.
+            TripMateException: If the request fails.
+        """
+        breaker = get_circuit_breaker(upstream)
+        breaker.check()
+        self._record(upstream, requests=1, in_flight=1)
+        start = time.perf_counter()
+        try:
+            response = self.client(upstream).get(url, **kwargs)
+            # 429 and 5xx mean the provider is unhealthy; other statuses are answers
+            if response.status_code == 429 or response.status_code >= 500:
+                breaker.record_failure(time.perf_counter() - start)
+            else:
+                breaker.record_success(time.perf_counter() - start)
+            return response
+        except Exception as e:
+            breaker.record_failure(time.perf_counter() - start)
+            self._record(upstream, errors=1)
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+        finally:
+            self._record(upstream, in_flight=-1, total_ms=(time.perf_counter() - start) * 1000)
+
+    async def aget(self, upstream: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Asynchronously sends a GET request through the pooled client of an upstream.
+
+        Args:
+            upstream (str): The upstream name, used to pick the client and its settings.
+            url (str): The URL to request.
+            **kwargs: Extra arguments passed to `httpx.AsyncClient.get`.
+
+        Returns:
+            httpx.Response: The response.
+        Raises:
+            CircuitOpenError: If the upstream's circuit breaker is open.
+            TripMateException: If the request fails.
+        """
+        breaker = get_circuit_breaker(upstream)
+        breaker.check()
+        self._record(upstream, requests=1, in_flight=1)
+        start = time.perf_counter()
+        try:
+            response = await self.async_client(upstream).get(url, **kwargs)
+            # 429 and 5xx mean the provider is unhealthy; other statuses are answers
+            if response.status_code == 429 or response.status_code >= 500:
+                breaker.record_failure(time.perf_counter() - start)
+            else:
+                breaker.record_success(time.perf_counter() - start)
+            return response
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception as e:
+            breaker.record_failure(time.perf_counter() - start)
+            self._record(upstream, errors=1)
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+        finally:
+            self._record(upstream, in_flight=-1, total_ms=(time.perf_counter() - start) * 1000)
+
+    def stats(self) -> dict:
+        """
+        Returns per-upstream request counters and open pooled connections.
+        """
+        with self._lock:
+            report = {}
+            for upstream in set(self._stats) | set(self._clients) | set(self._async_clients):
+                stats = dict(self._stats.get(upstream, _empty_stats()))
+                requests_sent = stats["requests"]
+                stats["avg_ms"] = round(stats["total_ms"] / requests_sent, 2) if requests_sent else 0.0
+                stats["total_ms"] = round(stats["total_ms"], 2)
+                clients = [self._clients.get(upstream)]
+                if upstream in self._async_clients:
+                    clients.append(self._async_clients[upstream][1])
+                stats["open_connections"] = sum(_open_connections(c) for c in clients if c is not None)
+                report[upstream] = stats
+            return report
+
+    def close(self) -> None:
+        """
+        Closes every synchronous client and session.
+        """
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            for session in self._sessions.values():
+                session.close()
+            self._clients.clear()
+            self._sessions.clear()
+
+    async def aclose(self) -> None:
+        """
+        Closes every client, including the asynchronous ones.
+        """
+        with self._lock:
+            async_clients = [client for _, client in self._async_clients.values()]
+            async_clients.extend(self._sdk_async_clients.values())
+            self._async_clients.clear()
+            self._sdk_async_clients.clear()
+            retired, self._retired = self._retired, []
+        for entry in retired:
+            if isinstance(entry, tuple):
+                await entry[1].aclose()
+            else:
+                entry.close()
+        for client in async_clients:
+            await client.aclose()
+        self.close()
+
+
+def _empty_stats() -> dict:
+    return {"requests": 0, "errors": 0, "in_flight": 0, "total_ms": 0.0}
+
+
+def _open_connections(client) -> int:
+    """
+    Best-effort count of the connections held by an httpx client's pool.
+    """
+    transport = getattr(client, "_transport", None)
+    # unwrap the rate-limiting transport to reach the connection pool
+    transport = getattr(transport, "transport", transport)
+    pool = getattr(transport, "_pool", None)
+    return len(getattr(pool, "connections", []) or [])
+
+
+_http_pool: Optional[HttpClientPool] = None
+_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpClientPool:
+    """
+    Returns the process-wide HttpClientPool, creating it on first use.
+    """
+    global _http_pool
+    if _http_pool is None:
+        with _http_pool_lock:
+            if _http_pool is None:
+                _http_pool = HttpClientPool()
+                subscribe("http", _http_pool.reconfigure)
+    return _http_pool
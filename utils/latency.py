@@ -0,0 +1,50 @@
+import threading
+from collections import deque
+from typing import Optional
+
+
+class LatencyTracker:
+    """
+    A thread-safe rolling window of latency samples with percentile queries.
+    """
+
+    def __init__(self, window: int = 200):
+        """
+        Initializes the LatencyTracker.
+
+        Args:
+            window (int): The number of most recent samples kept.
+        """
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """
+        Adds a latency sample in seconds.
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Returns the given percentile (0-100) of the window, or None if it is empty.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, round(percentile / 100 * len(samples)) - 1))
+        return samples[index]
+
+    def stats(self) -> dict:
+        """
+        Returns the sample count and the p50/p90/p99 latencies in milliseconds.
+        """
+        report = {"samples": len(self._samples)}
+        for percentile in (50, 90, 99):
+            value = self.percentile(percentile)
+            report[f"p{percentile}_ms"] = round(value * 1000, 2) if value is not None else None
+        return report
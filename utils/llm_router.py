@@ -0,0 +1,314 @@
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackManager
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from utils.config_loader import load_config
+from utils.latency import LatencyTracker
+from utils.rate_limiter import RateLimitExceeded, is_rate_limit_error, retry_after_seconds
+from logger.logger import logger
+
+
+DEFAULT_ROUTING_SETTINGS = {
+    "prior_latency_seconds": 2.0,
+    "min_samples": 5,
+    "error_window": 20,
+    "error_penalty": 4.0,
+    "cooldown_seconds": 30.0,
+    "hedging": {
+        "enabled": False,
+        "percentile": 90,
+        "min_samples": 20,
+        "default_delay_seconds": 4.0,
+        "min_delay_seconds": 1.0,
+        "max_delay_seconds": 10.0,
+    },
+}
+
+
+def routing_settings() -> dict:
+    """
+    Returns the `llm_routing` config section merged over the defaults.
+    """
+    section = load_config().get("llm_routing", {})
+    return {
+        **DEFAULT_ROUTING_SETTINGS,
+        **section,
+        "hedging": {**DEFAULT_ROUTING_SETTINGS["hedging"], **section.get("hedging", {})},
+    }
+
+
+def is_provider_outage(error: BaseException) -> bool:
+    """
+    Returns whether an error means the provider itself is unavailable: a 429, a 5xx or a connection failure.
+    """
+    if isinstance(error, RateLimitExceeded) or is_rate_limit_error(error):
+        return True
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int) and status >= 500:
+        return True
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError", "ConnectError", "ReadTimeout")
+
+
+class ProviderHealth:
+    """
+    Rolling latency and error statistics of one LLM provider.
+
+    A provider that answers with a 429 or 5xx, or cannot be reached, is cooled down
+    for its Retry-After (or `cooldown_seconds`) and is only used again if every other
+    provider is cooling down too.
+    """
+
+    def __init__(self, name: str, error_window: int = 20):
+        """
+        Initializes the ProviderHealth.
+
+        Args:
+            name (str): The provider.
+            error_window (int): The number of most recent call outcomes the error rate is computed over.
+        """
+        self.name = name
+        self.latency = LatencyTracker(window=100)
+        self.cooldown_until = 0.0
+        self.stats = {"calls": 0, "errors": 0, "outages": 0, "wins": 0, "hedges": 0, "failovers": 0}
+        self._outcomes = deque(maxlen=error_window)
+        self._lock = threading.Lock()
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def record_success(self, seconds: float) -> None:
+        self.latency.record(seconds)
+        with self._lock:
+            self.stats["calls"] += 1
+            self._outcomes.append(True)
+
+    def record_failure(self, error: BaseException, cooldown_seconds: float) -> None:
+        with self._lock:
+            self.stats["calls"] += 1
+            self.stats["errors"] += 1
+            self._outcomes.append(False)
+            if not is_provider_outage(error):
+                return
+            self.stats["outages"] += 1
+            retry_after = retry_after_seconds(getattr(getattr(error, "response", None), "headers", None))
+            pause = retry_after if retry_after is not None else cooldown_seconds
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + pause)
+        logger.warning(f"{self.name} is unavailable ({type(error).__name__}), routing around it for {pause:.0f}s")
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+    def score(self, settings: dict) -> float:
+        """
+        Returns the expected cost of a call: the median latency inflated by the recent error rate.
+        """
+        median = self.latency.percentile(50) if len(self.latency) >= settings["min_samples"] else None
+        expected = median if median is not None else settings["prior_latency_seconds"]
+        return expected * (1 + settings["error_penalty"] * self.error_rate())
+
+    def snapshot(self) -> dict:
+        report = {**self.latency.stats(), "error_rate": round(self.error_rate(), 3)}
+        with self._lock:
+            report.update(self.stats)
+            report["cooldown_seconds"] = round(max(0.0, self.cooldown_until - time.monotonic()), 2)
+        return report
+
+
+_health: Dict[str, ProviderHealth] = {}
+_health_lock = threading.Lock()
+
+
+def get_provider_health(provider: str) -> ProviderHealth:
+    """
+    Returns the process-wide health of a provider, shared by every router that calls it.
+    """
+    health = _health.get(provider)
+    if health is None:
+        with _health_lock:
+            health = _health.setdefault(
+                provider, ProviderHealth(provider, routing_settings()["error_window"])
+            )
+    return health
+
+
+def routing_stats() -> dict:
+    """
+    Returns the health of every provider a router has called.
+    """
+    with _health_lock:
+        providers = list(_health.values())
+    return {health.name: health.snapshot() for health in providers}
+
+
+def streams_tokens(config: Optional[RunnableConfig]) -> bool:
+    """
+    Returns whether the caller streams the model's tokens (e.g. through astream_events).
+    """
+    callbacks = (config or {}).get("callbacks")
+    handlers = callbacks.handlers if isinstance(callbacks, BaseCallbackManager) else (callbacks or [])
+    return any(hasattr(handler, "tap_output_aiter") for handler in handlers)
+
+
+def without_token_streaming(config: Optional[RunnableConfig]) -> Optional[RunnableConfig]:
+    """
+    Returns a copy of a run config without the handlers that stream tokens to the caller.
+
+    Tracing and other run handlers are kept, so the call is still traced and reported.
+    """
+    if not streams_tokens(config):
+        return config
+    callbacks = config["callbacks"]
+    if isinstance(callbacks, BaseCallbackManager):
+        callbacks = callbacks.copy()
+        for handler in [handler for handler in callbacks.handlers if hasattr(handler, "tap_output_aiter")]:
+            callbacks.remove_handler(handler)
+    else:
+        callbacks = [handler for handler in callbacks if not hasattr(handler, "tap_output_aiter")]
+    return {**config, "callbacks": callbacks}
+
+
+class RoutingChatModel(Runnable):
+    """
+    A chat model that sends each call to the healthiest of several providers.
+
+    Providers are ranked by their rolling median latency, inflated by their recent
+    error rate; providers cooling down after a 429, 5xx or connection failure go last.
+    A call that fails moves on to the next provider. With `hedging` enabled,
+    asynchronous calls are also hedged: if the first provider has not answered within
+    its recent p90 latency, the next one is called too and the first answer wins.
+    Calls whose tokens are being streamed are never hedged, so a client never
+    receives two interleaved answers.
+
+    `bind_tools` and `with_structured_output` return routers over the bound models,
+    so graph and supervisor nodes use the router exactly like a single chat model.
+    """
+
+    def __init__(self, models: Dict[str, Runnable]):
+        """
+        Initializes the RoutingChatModel.
+
+        Args:
+            models (Dict[str, Runnable]): The chat model of every provider, in order of preference.
+        """
+        if not models:
+            raise ValueError("RoutingChatModel needs at least one provider")
+        self.models = models
+        self.health = {provider: get_provider_health(provider) for provider in models}
+
+    def _derive(self, bind: Callable[[Runnable], Runnable]) -> "RoutingChatModel":
+        return RoutingChatModel({provider: bind(model) for provider, model in self.models.items()})
+
+    def bind_tools(self, tools, **kwargs) -> "RoutingChatModel":
+        return self._derive(lambda model: model.bind_tools(tools, **kwargs))
+
+    def with_structured_output(self, schema, **kwargs) -> "RoutingChatModel":
+        return self._derive(lambda model: model.with_structured_output(schema, **kwargs))
+
+    def ranked(self, settings: dict) -> List[str]:
+        """
+        Returns the providers, healthiest first.
+        """
+        order = list(self.models)
+        return sorted(
+            order,
+            key=lambda provider: (
+                self.health[provider].cooling_down(),
+                self.health[provider].score(settings),
+                order.index(provider),
+            ),
+        )
+
+    def _hedge_delay(self, provider: str, hedging: dict) -> float:
+        """
+        Returns how long to wait for a provider before also calling the next one.
+        """
+        latency = self.health[provider].latency
+        observed = latency.percentile(hedging["percentile"]) if len(latency) >= hedging["min_samples"] else None
+        delay = observed if observed is not None else hedging["default_delay_seconds"]
+        return min(max(delay, hedging["min_delay_seconds"]), hedging["max_delay_seconds"])
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs) -> Any:
+        settings = routing_settings()
+        last_error = None
+        for attempt, provider in enumerate(self.ranked(settings)):
+            if attempt:
+                self.health[provider].count("failovers")
+                logger.info(f"Failing over to {provider}")
+            start = time.perf_counter()
+            try:
+                result = self.models[provider].invoke(input, config, **kwargs)
+            except Exception as e:
+                self.health[provider].record_failure(e, settings["cooldown_seconds"])
+                logger.warning(f"{provider} call failed: {e}")
+                last_error = e
+                continue
+            self.health[provider].record_success(time.perf_counter() - start)
+            self.health[provider].count("wins")
+            return result
+        raise last_error
+
+    async def _acall(self, provider: str, input: Any, config: Optional[RunnableConfig], settings: dict, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = await self.models[provider].ainvoke(input, config, **kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.health[provider].record_failure(e, settings["cooldown_seconds"])
+            logger.warning(f"{provider} call failed: {e}")
+            raise
+        self.health[provider].record_success(time.perf_counter() - start)
+        return result
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs) -> Any:
+        settings = routing_settings()
+        remaining = self.ranked(settings)
+        hedge = settings["hedging"]["enabled"] and len(remaining) > 1 and not streams_tokens(config)
+
+        def start_next() -> asyncio.Task:
+            provider = remaining.pop(0)
+            task = asyncio.create_task(self._acall(provider, input, config, settings, **kwargs))
+            tasks[task] = provider
+            return task
+
+        tasks: Dict[asyncio.Task, str] = {}
+        first = remaining[0]
+        start_next()
+        delay = self._hedge_delay(first, settings["hedging"]) if hedge else None
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        last_error = None
+        try:
+            while True:
+                for task in done:
+                    provider = tasks.pop(task)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                    else:
+                        self.health[provider].count("wins")
+                        return task.result()
+                if remaining and not done:
+                    # the running call is slower than its recent p90: hedge with the next provider
+                    self.health[remaining[0]].count("hedges")
+                    logger.info(f"{first} slower than {delay:.2f}s, hedging with {remaining[0]}")
+                    start_next()
+                elif remaining and not tasks:
+                    self.health[remaining[0]].count("failovers")
+                    logger.info(f"Failing over to {remaining[0]}")
+                    start_next()
+                if not tasks:
+                    break
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+        raise last_error
@@ -1,11 +1,16 @@
 import os
 import sys
+import threading
+import time
 from dotenv import load_dotenv
-from typing import Literal, Optional, Any
+from typing import Dict, List, Literal, Optional, Any, Tuple
 from pydantic import BaseModel, Field
 from utils.config_loader import load_config
+from utils.http_client import get_http_pool
+from utils.llm_router import RoutingChatModel
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
+from langchain_core.language_models import BaseChatModel
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 
@@ -22,7 +27,7 @@ class ConfigLoader:
         Initializes ConfigLoader and loads the configuration.
         """
         try:
-            logger.info("Initializing ConfigLoader")
+            # load_config serves the process-wide cached config, re-reading the file only when it changed
             self.config = load_config()
         except Exception as e:
             error = TripMateException(e, sys)
@@ -36,12 +41,169 @@ class ConfigLoader:
         return self.config[key]
 
 
+class LLMRegistry:
+    """
+    A process-wide registry of chat model clients keyed by (provider, model, params).
+
+    Chat models hold no per-request state, so one client per key is shared by the
+    graph, the supervisor and the specialized agents. Every client is built on the
+    pooled, rate-limited HTTP clients of its provider, so sharing it also shares its
+    connections. Construction and reuse counts are kept per key.
+    """
+
+    def __init__(self):
+        """
+        Initializes the LLMRegistry.
+        """
+        self._clients: Dict[Tuple, BaseChatModel] = {}
+        self._stats: Dict[Tuple, dict] = {}
+        # re-entrant: a router is built from clients fetched through `get`
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(provider: str, model_name: str, params: dict) -> Tuple:
+        return (provider, model_name, tuple(sorted(params.items())))
+
+    def _construct(self, provider: str, model_name: str, params: dict) -> BaseChatModel:
+        """
+        Builds a chat model client on the pooled HTTP clients of its provider.
+        """
+        # pooled clients whose transport applies the provider's rate limiter; the transport
+        # retries 429s within the limiter's wait budget and marks the ones it gives up on
+        # as final, so the SDK's own retries are left for 5xx and connection errors
+        http = get_http_pool()
+        if provider == "groq":
+            logger.info(f"Loading Groq model: {model_name}")
+            return ChatGroq(
+                model=model_name,
+                api_key=os.getenv("GROQ_API_KEY"),
+                http_client=http.client("groq"),
+                http_async_client=http.sdk_async_client("groq"),
+                **params,
+            )
+        if provider == "openai":
+            logger.info(f"Loading OpenAI model: {model_name}")
+            return ChatOpenAI(
+                model=model_name,
+                api_key=os.getenv("OPENAI_API_KEY"),
+                http_client=http.client("openai"),
+                http_async_client=http.sdk_async_client("openai"),
+                **params,
+            )
+        raise ValueError(f"Invalid model provider: {provider}")
+
+    def get(self, provider: str, model_name: str, **params) -> BaseChatModel:
+        """
+        Returns the shared client for a provider, model and parameters, building it on first use.
+
+        Args:
+            provider (str): The model provider.
+            model_name (str): The model to call.
+            **params: Extra constructor arguments such as temperature.
+        Returns:
+            BaseChatModel: The shared chat model client.
+        """
+        key = self._key(provider, model_name, params)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                start = time.perf_counter()
+                client = self._construct(provider, model_name, params)
+                self._clients[key] = client
+                self._stats[key] = {
+                    "constructions": 1,
+                    "reuses": 0,
+                    "construct_ms": round((time.perf_counter() - start) * 1000, 2),
+                }
+            else:
+                self._stats[key]["reuses"] += 1
+        return client
+
+    def router(self, providers: List[str], llm_config: dict, **params) -> RoutingChatModel:
+        """
+        Returns the shared router over the default models of several providers.
+
+        Providers whose client cannot be built (e.g. a missing API key) are left out.
+        The router is keyed by every provider's model, so a reloaded `llm` section gets
+        a new router; a router missing a provider is not shared, so the provider is
+        tried again on the next call.
+
+        Args:
+            providers (List[str]): The providers to route between, in order of preference.
+            llm_config (dict): The `llm` config section.
+            **params: Extra constructor arguments passed to every provider's client.
+        Returns:
+            RoutingChatModel: The shared router.
+        """
+        model_names = {provider: (llm_config.get(provider) or {}).get("model_name") for provider in providers}
+        key = self._key("auto", ",".join(f"{provider}:{name}" for provider, name in model_names.items()), params)
+        with self._lock:
+            router = self._clients.get(key)
+            if router is not None:
+                self._stats[key]["reuses"] += 1
+                return router
+            models = {}
+            for provider, model_name in model_names.items():
+                try:
+                    if not model_name:
+                        raise KeyError(f"no model_name in llm.{provider}")
+                    models[provider] = self.get(provider, model_name, **params)
+                except Exception as e:
+                    logger.warning(f"Leaving {provider} out of the router: {e}")
+            router = RoutingChatModel(models)
+            logger.info(f"Routing LLM calls between {', '.join(models)}")
+            if len(models) == len(providers):
+                self._clients[key] = router
+                self._stats[key] = {"constructions": 1, "reuses": 0, "construct_ms": 0.0}
+        return router
+
+    def warm_up(self, providers: List[str], config: dict) -> None:
+        """
+        Builds the default client of every provider ahead of the first request.
+
+        Args:
+            providers (List[str]): The providers to warm up.
+            config (dict): The `llm` config section.
+        """
+        for provider in providers:
+            try:
+                self.get(provider, config[provider]["model_name"])
+            except Exception as e:
+                logger.warning(f"Could not warm up the {provider} client: {e}")
+
+    def stats(self) -> dict:
+        """
+        Returns the construction and reuse counts of every client.
+        """
+        with self._lock:
+            return {
+                ":".join(str(part) for part in key[:2]) + (f" {dict(key[2])}" if key[2] else ""): dict(stats)
+                for key, stats in self._stats.items()
+            }
+
+
+_llm_registry: Optional[LLMRegistry] = None
+_llm_registry_lock = threading.Lock()
+
+
+def get_llm_registry() -> LLMRegistry:
+    """
+    Returns the process-wide LLMRegistry, creating it on first use.
+    """
+    global _llm_registry
+    if _llm_registry is None:
+        with _llm_registry_lock:
+            if _llm_registry is None:
+                _llm_registry = LLMRegistry()
+    return _llm_registry
+
+
 class ModelLoader(BaseModel):
     """
     A class to load LLM models based on provider.
     """
 
-    model_provider: Literal["openai", "groq"] = "groq"
+    model_provider: Literal["openai", "groq", "auto"] = "groq"
     config_loader: Optional[ConfigLoader] = Field(default=None, exclude=True)
 
     def model_post_init(self, __context: Any) -> None:
@@ -58,10 +220,16 @@ class ModelLoader(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
-    def load_llm(self):
+    def load_llm(self, **params):
         """
         Load and return the LLM model based on the specified provider.
 
+        The client comes from the process-wide LLMRegistry, so every caller asking for
+        the same provider, model and parameters gets the same instance. The "auto"
+        provider returns a RoutingChatModel over the providers in `llm_routing`.
+
+        Args:
+            **params: Extra constructor arguments such as temperature.
         Returns:
             BaseChatModel: The loaded LangChain chat model.
 
@@ -70,20 +238,15 @@ class ModelLoader(BaseModel):
         """
         try:
             logger.info(f"Loading LLM from provider: {self.model_provider}")
-
-            if self.model_provider == "groq":
-                groq_api_key = os.getenv("GROQ_API_KEY")
-                model_name = self.config_loader["llm"]["groq"]["model_name"]
-                logger.info(f"Loading Groq model: {model_name}")
-                llm = ChatGroq(model=model_name, api_key=groq_api_key)
-            elif self.model_provider == "openai":
-                openai_api_key = os.getenv("OPENAI_API_KEY")
-                model_name = self.config_loader["llm"]["openai"]["model_name"]
-                logger.info(f"Loading OpenAI model: {model_name}")
-                llm = ChatOpenAI(model=model_name, api_key=openai_api_key)
+            llm_config = self.config_loader["llm"]
+            if self.model_provider == "auto":
+                providers = self.config_loader.config.get("llm_routing", {}).get("providers", ["groq", "openai"])
+                llm = get_llm_registry().router(providers, llm_config, **params)
+            elif self.model_provider in ("groq", "openai"):
+                model_name = llm_config[self.model_provider]["model_name"]
+                llm = get_llm_registry().get(self.model_provider, model_name, **params)
             else:
                 raise ValueError(f"Invalid model provider: {self.model_provider}")
-
             logger.info("LLM loaded successfully")
             return llm
         except Exception as e:
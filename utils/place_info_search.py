@@ -1,17 +1,289 @@
 import os
 import sys
 import json
+import time
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Optional
+import googlemaps
 from langchain_tavily import TavilySearch
 from langchain_google_community import GooglePlacesTool, GooglePlacesAPIWrapper
+from utils.config_loader import load_config, subscribe
+from utils.http_client import get_http_pool
+from utils.latency import LatencyTracker
+from utils.circuit_breaker import get_circuit_breaker
+from utils.single_flight import get_single_flight
+from utils.rate_limiter import get_rate_limiter
+from utils.weather_info import normalize_city
+from utils.tool_output import (
+    ToolOutputStats,
+    format_place_record,
+    output_settings,
+    place_records,
+    web_records,
+)
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 
 
+# what a Places search answers when nothing matched; such results are not cached
+GOOGLE_EMPTY_RESULT = "Google Places did not find any places"
+
+
+def is_cacheable(value: str) -> bool:
+    """
+    Returns whether a search result is worth caching: empty results are retried on the next lookup.
+    """
+    return bool(value) and not str(value).startswith(GOOGLE_EMPTY_RESULT)
+
+
+class PlaceSearchCache:
+    """
+    A disk-backed (SQLite) cache for place search results with stale-while-revalidate.
+
+    Entries are keyed by (provider, category, normalized place). An entry younger than
+    `fresh_seconds` is served as is. An older entry, up to `max_stale_seconds`, is still
+    served immediately while a background refresh replaces it. Concurrent misses of one
+    key share a single upstream search. Empty results are not stored, so they are
+    searched again next time. The database runs in WAL mode, so it survives restarts
+    and can be shared by every worker on the host; the asynchronous path reads and
+    writes it in worker threads, so a locked database never blocks the event loop.
+    """
+
+    def __init__(self, path: str, fresh_seconds: float = 86400, max_stale_seconds: float = 604800):
+        """
+        Initializes the PlaceSearchCache.
+
+        Args:
+            path (str): The SQLite database file.
+            fresh_seconds (float): How long an entry is served without being refreshed.
+            max_stale_seconds (float): How long an expired entry may still be served while refreshing.
+        """
+        self.path = path
+        self.fresh_seconds = fresh_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.stats = {"fresh_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_failures": 0}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._background_tasks = set()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="place-cache-refresh")
+        self.flight = get_single_flight("place_search")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connection() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS place_search (
+                    provider TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    place TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (provider, category, place)
+                )
+                """
+            )
+        logger.info(f"PlaceSearchCache initialized at {path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the SQLite connection of the calling thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def get(self, provider: str, category: str, place: str) -> Optional[tuple]:
+        """
+        Returns the cached (value, age in seconds) of a key, or None if absent.
+        """
+        row = self._connection().execute(
+            "SELECT value, fetched_at FROM place_search WHERE provider = ? AND category = ? AND place = ?",
+            (provider, category, normalize_city(place)),
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], time.time() - row[1]
+
+    def set(self, provider: str, category: str, place: str, value: str) -> None:
+        """
+        Stores a value, replacing any previous entry of the key.
+        """
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO place_search VALUES (?, ?, ?, ?, ?)",
+                (provider, category, normalize_city(place), value, time.time()),
+            )
+
+    def _lookup(self, provider: str, category: str, place: str):
+        """
+        Classifies a key as ("fresh" | "stale" | "miss", cached value).
+        """
+        cached = self.get(provider, category, place)
+        if cached is None or cached[1] > self.max_stale_seconds:
+            self._count("misses")
+            return "miss", None
+        if cached[1] <= self.fresh_seconds:
+            self._count("fresh_hits")
+            return "fresh", cached[0]
+        self._count("stale_hits")
+        return "stale", cached[0]
+
+    def _claim_refresh(self, key: tuple) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _refresh(self, key: tuple, fetch: Callable[[], str]) -> None:
+        try:
+            value = fetch()
+            if is_cacheable(value):
+                self.set(*key, value)
+            self._count("refreshes")
+        except Exception as e:
+            self._count("refresh_failures")
+            logger.warning(f"Background refresh failed for {key}: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def _arefresh(self, key: tuple, fetch: Callable[[], Awaitable[str]]) -> None:
+        try:
+            value = await fetch()
+            if is_cacheable(value):
+                await asyncio.to_thread(self.set, *key, value)
+            self._count("refreshes")
+        except Exception as e:
+            self._count("refresh_failures")
+            logger.warning(f"Background refresh failed for {key}: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def fetch(self, provider: str, category: str, place: str, fetch: Callable[[], str]) -> str:
+        """
+        Returns a cached result, refreshing stale entries in a background thread.
+
+        Args:
+            provider (str): The search provider, e.g. "google".
+            category (str): The kind of search, e.g. "attractions".
+            place (str): The place searched for.
+            fetch (Callable[[], str]): Performs the upstream search on a miss or refresh.
+
+        Returns:
+            str: The cached or freshly fetched result.
+        """
+        key = (provider, category, normalize_city(place))
+        state, value = self._lookup(*key)
+        if state == "fresh":
+            return value
+        if state == "stale":
+            if self._claim_refresh(key):
+                self._executor.submit(self._refresh, key, fetch)
+            return value
+        return self.flight.do(key, lambda: self._fetch_and_store(key, fetch))
+
+    def _fetch_and_store(self, key: tuple, fetch: Callable[[], str]) -> str:
+        value = fetch()
+        if is_cacheable(value):
+            self.set(*key, value)
+        return value
+
+    async def _afetch_and_store(self, key: tuple, fetch: Callable[[], Awaitable[str]]) -> str:
+        value = await fetch()
+        if is_cacheable(value):
+            await asyncio.to_thread(self.set, *key, value)
+        return value
+
+    async def afetch(
+        self, provider: str, category: str, place: str, fetch: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Asynchronously returns a cached result, refreshing stale entries in a background task.
+
+        Args:
+            provider (str): The search provider, e.g. "google".
+            category (str): The kind of search, e.g. "attractions".
+            place (str): The place searched for.
+            fetch (Callable[[], Awaitable[str]]): Performs the upstream search on a miss or refresh.
+
+        Returns:
+            str: The cached or freshly fetched result.
+        """
+        key = (provider, category, normalize_city(place))
+        # SQLite may wait up to its busy timeout for a writer, so it is never queried on the loop
+        state, value = await asyncio.to_thread(self._lookup, *key)
+        if state == "fresh":
+            return value
+        if state == "stale":
+            if self._claim_refresh(key):
+                task = asyncio.create_task(self._arefresh(key, fetch))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            return value
+        return await self.flight.ado(key, lambda: self._afetch_and_store(key, fetch))
+
+    def reconfigure(self, cache_config: dict) -> None:
+        """
+        Applies a reloaded `place_cache` section; the database path only changes on restart.
+
+        Args:
+            cache_config (dict): The new `place_cache` config section.
+        """
+        with self._lock:
+            self.fresh_seconds = cache_config.get("fresh_seconds", 86400)
+            self.max_stale_seconds = cache_config.get("max_stale_seconds", 604800)
+
+    def cache_stats(self) -> dict:
+        """
+        Returns the hit/miss and refresh counters of the cache.
+        """
+        with self._lock:
+            return dict(self.stats, fresh_seconds=self.fresh_seconds)
+
+
+_place_cache: Optional[PlaceSearchCache] = None
+_place_cache_lock = threading.Lock()
+
+
+def get_place_cache() -> PlaceSearchCache:
+    """
+    Returns the process-wide PlaceSearchCache, creating it on first use.
+    """
+    global _place_cache
+    if _place_cache is None:
+        with _place_cache_lock:
+            if _place_cache is None:
+                cache_config = load_config().get("place_cache", {})
+                _place_cache = PlaceSearchCache(
+                    path=cache_config.get("path", "cache/place_search.sqlite3"),
+                    fresh_seconds=cache_config.get("fresh_seconds", 86400),
+                    max_stale_seconds=cache_config.get("max_stale_seconds", 604800),
+                )
+                subscribe("place_cache", _place_cache.reconfigure)
+    return _place_cache
+
+
 class GooglePlaceSearchTool:
     """
     A class to search for places and information using the Google Places API.
     """
 
+    # latency of the Places API calls themselves, cache hits excluded; drives the Tavily hedge
+    upstream_latency = LatencyTracker(window=200)
+
     def __init__(self, api_key: str):
         """
         Initializes the GooglePlaceSearchTool with an API key.
@@ -21,12 +293,70 @@ class GooglePlaceSearchTool:
         try:
             logger.info("Initializing GooglePlaceSearchTool")
             self.places_wrapper = GooglePlacesAPIWrapper(gplaces_api_key=api_key)
+            # route the googlemaps SDK through the shared pooled session and upstream timeouts
+            http = get_http_pool()
+            settings = http.settings("google_places")
+            self.places_wrapper.google_map_client = googlemaps.Client(
+                key=api_key,
+                connect_timeout=settings["connect_timeout"],
+                read_timeout=settings["timeout"],
+                requests_session=http.requests_session("google_places"),
+            )
             self.places_tool = GooglePlacesTool(api_wrapper=self.places_wrapper)
+            self.cache = get_place_cache()
+            self.breaker = get_circuit_breaker("google_places")
+            self.output = output_settings()
+            self.compact = self.output.get("compact", False)
+            # compact and verbose results are cached separately so switching modes never mixes them
+            self.cache_provider = "google-compact" if self.compact else "google"
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
             raise error
 
+    def _compact_places(self, response: dict) -> str:
+        """
+        Formats a Places text search as compact name/rating/price/address lines.
+
+        The text search already carries these fields, so no per-place details
+        request is made.
+        """
+        results = response.get("results", [])
+        if not results:
+            return f"{GOOGLE_EMPTY_RESULT} that match the description"
+        records = place_records(results, self.output.get("max_results", 8))
+        compact = "\n".join(format_place_record(record) for record in records)
+        ToolOutputStats.record_compaction("google_places", len(json.dumps(response, default=str)), compact)
+        return compact
+
+    def _places_query(self, query: str) -> str:
+        """
+        Runs a Google Places query through the provider's circuit breaker.
+        """
+        start = time.perf_counter()
+        try:
+            if self.compact:
+                return self._compact_places(self.breaker.call(self.places_wrapper.google_map_client.places, query))
+            return self.breaker.call(self.places_tool.run, query)
+        finally:
+            self.upstream_latency.record(time.perf_counter() - start)
+
+    async def _aplaces_query(self, query: str) -> str:
+        """
+        Asynchronously runs a Google Places query through the provider's circuit breaker.
+        """
+        start = time.perf_counter()
+        try:
+            if self.compact:
+                response = await self.breaker.acall(
+                    asyncio.to_thread, self.places_wrapper.google_map_client.places, query
+                )
+                return self._compact_places(response)
+            return await self.breaker.acall(self.places_tool.arun, query)
+        finally:
+            # failed and cancelled calls are timed too, so slow upstream periods are not hidden
+            self.upstream_latency.record(time.perf_counter() - start)
+
     def google_search_attractions(self, place: str) -> str:
         """
         Searches for attractions in a specified place.
@@ -37,7 +367,12 @@ class GooglePlaceSearchTool:
         """
         try:
             logger.info(f"Google searching attractions for: {place}")
-            return self.places_tool.run(f"top attractive places in and around {place}")
+            return self.cache.fetch(
+                self.cache_provider,
+                "attractions",
+                place,
+                lambda: self._places_query(f"top attractive places in and around {place}"),
+            )
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
@@ -53,8 +388,11 @@ class GooglePlaceSearchTool:
         """
         try:
             logger.info(f"Google searching restaurants for: {place}")
-            return self.places_tool.run(
-                f"what are the top 10 restaurants and eateries in and around {place}?"
+            return self.cache.fetch(
+                self.cache_provider,
+                "restaurants",
+                place,
+                lambda: self._places_query(f"what are the top 10 restaurants and eateries in and around {place}?"),
             )
         except Exception as e:
             error = TripMateException(e, sys)
@@ -73,7 +411,12 @@ class GooglePlaceSearchTool:
 
         try:
             logger.info(f"Google searching activities for: {place}")
-            return self.places_tool.run(f"Activities in and around {place}")
+            return self.cache.fetch(
+                self.cache_provider,
+                "activities",
+                place,
+                lambda: self._places_query(f"Activities in and around {place}"),
+            )
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
@@ -90,8 +433,11 @@ class GooglePlaceSearchTool:
         """
         try:
             logger.info(f"Google searching transportation for: {place}")
-            return self.places_tool.run(
-                f"What are the different modes of transportations available in {place}"
+            return self.cache.fetch(
+                self.cache_provider,
+                "transportation",
+                place,
+                lambda: self._places_query(f"What are the different modes of transportations available in {place}"),
             )
         except Exception as e:
             error = TripMateException(e, sys)
@@ -103,14 +449,104 @@ class GooglePlaceSearchTool:
         Executes a custom search query using Google Places.
         """
         try:
-            logger.info(f"Google custom search for: {query}")
-            return self.places_tool.run(query)
+            logger.info("Google custom search for: %.200s", query)
+            return self._places_query(query)
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def agoogle_search_attractions(self, place: str) -> str:
+        """
+        Asynchronously searches for attractions in a specified place.
+        Args:
+            place (str): The name of the place.
+        Returns:
+            str: Results from the Google Places search tool.
+        """
+        try:
+            logger.info(f"Google searching attractions for: {place}")
+            return await self.cache.afetch(
+                self.cache_provider,
+                "attractions",
+                place,
+                lambda: self._aplaces_query(f"top attractive places in and around {place}"),
+            )
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def agoogle_search_restaurants(self, place: str) -> str:
+        """
+        Asynchronously searches for restaurants in a specified place.
+        Args:
+            place (str): The name of the place.
+        Returns:
+            str: Results from the Google Places search tool.
+        """
+        try:
+            logger.info(f"Google searching restaurants for: {place}")
+            return await self.cache.afetch(
+                self.cache_provider,
+                "restaurants",
+                place,
+                lambda: self._aplaces_query(f"what are the top 10 restaurants and eateries in and around {place}?"),
+            )
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def agoogle_search_activity(self, place: str) -> str:
+        """
+        Asynchronously searches for popular activities in a specified place.
+        Args:
+            place (str): The name of the place.
+
+        Returns:
+            str: Results from the Google Places search tool.
+        """
+        try:
+            logger.info(f"Google searching activities for: {place}")
+            return await self.cache.afetch(
+                self.cache_provider,
+                "activities",
+                place,
+                lambda: self._aplaces_query(f"Activities in and around {place}"),
+            )
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def agoogle_search_transportation(self, place: str) -> str:
+        """
+        Asynchronously searches for transportation information in a specified place.
+        Args:
+            place (str): The name of the place.
+
+        Returns:
+            str: Results from the Google Places search tool.
+        """
+        try:
+            logger.info(f"Google searching transportation for: {place}")
+            return await self.cache.afetch(
+                self.cache_provider,
+                "transportation",
+                place,
+                lambda: self._aplaces_query(f"What are the different modes of transportations available in {place}"),
+            )
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
             raise error
 
 
+_tavily_clients: Dict[tuple, TavilySearch] = {}
+_tavily_clients_lock = threading.Lock()
+
+
 class TavilyPlaceSearchTool:
     """
     A class to search for places and information using the Tavily Search API.
@@ -129,6 +565,13 @@ class TavilyPlaceSearchTool:
                 or os.environ.get("TAVILY_API_KEY")
                 or os.environ.get("TAVILAY_API_KEY")
             )
+            self.cache = get_place_cache()
+            self.breaker = get_circuit_breaker("tavily")
+            # the Tavily SDK manages its own HTTP sessions, so calls are rate limited here
+            self.rate_limiter = get_rate_limiter("tavily")
+            self.output = output_settings()
+            self.compact = self.output.get("compact", False)
+            self.cache_provider = "tavily-compact" if self.compact else "tavily"
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
@@ -144,15 +587,12 @@ class TavilyPlaceSearchTool:
         """
         try:
             logger.info(f"Tavily searching attractions for: {place}")
-            tavily_tool = TavilySearch(
-                tavily_api_key=self.api_key, topic="general", include_answer="advanced"
+            return self.cache.fetch(
+                self.cache_provider,
+                "attractions",
+                place,
+                lambda: self._tavily_query(f"top attractive places in and around {place}"),
             )
-            result = tavily_tool.invoke(
-                {"query": f"top attractive places in and around {place}"}
-            )
-            if isinstance(result, dict) and result.get("answer"):
-                return result["answer"]
-            return str(result)
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
@@ -169,17 +609,12 @@ class TavilyPlaceSearchTool:
         """
         try:
             logger.info(f"Tavily searching restaurants for: {place}")
-            tavily_tool = TavilySearch(
-                tavily_api_key=self.api_key, topic="general", include_answer="advanced"
-            )
-            result = tavily_tool.invoke(
-                {
-                    "query": f"what are the top 10 restaurants and eateries in and around {place}."
-                }
+            return self.cache.fetch(
+                self.cache_provider,
+                "restaurants",
+                place,
+                lambda: self._tavily_query(f"what are the top 10 restaurants and eateries in and around {place}."),
             )
-            if isinstance(result, dict) and result.get("answer"):
-                return result["answer"]
-            return str(result)
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
@@ -196,13 +631,12 @@ class TavilyPlaceSearchTool:
         """
         try:
             logger.info(f"Tavily searching activities for: {place}")
-            tavily_tool = TavilySearch(
-                tavily_api_key=self.api_key, topic="general", include_answer="advanced"
+            return self.cache.fetch(
+                self.cache_provider,
+                "activities",
+                place,
+                lambda: self._tavily_query(f"activities in and around {place}"),
             )
-            result = tavily_tool.invoke({"query": f"activities in and around {place}"})
-            if isinstance(result, dict) and result.get("answer"):
-                return result["answer"]
-            return str(result)
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
@@ -218,17 +652,12 @@ class TavilyPlaceSearchTool:
         """
         try:
             logger.info(f"Tavily searching transportation for: {place}")
-            tavily_tool = TavilySearch(
-                tavily_api_key=self.api_key, topic="general", include_answer="advanced"
+            return self.cache.fetch(
+                self.cache_provider,
+                "transportation",
+                place,
+                lambda: self._tavily_query(f"What are the different modes of transportations available in {place}"),
             )
-            result = tavily_tool.invoke(
-                {
-                    "query": f"What are the different modes of transportations available in {place}"
-                }
-            )
-            if isinstance(result, dict) and result.get("answer"):
-                return result["answer"]
-            return str(result)
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
@@ -239,14 +668,150 @@ class TavilyPlaceSearchTool:
         Executes a custom search query using Tavily.
         """
         try:
-            logger.info(f"Tavily custom search for: {query}")
-            tavily_tool = TavilySearch(
-                tavily_api_key=self.api_key, topic="general", include_answer="advanced"
-            )
-            result = tavily_tool.invoke({"query": query})
-            if isinstance(result, dict) and result.get("answer"):
-                return result["answer"]
+            logger.info("Tavily custom search for: %.200s", query)
+            return self._tavily_query(query)
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    def get_client(
+        self, topic: str = "general", include_answer: str = "advanced", max_results: int = 5
+    ) -> TavilySearch:
+        """
+        Returns the shared TavilySearch client of a configuration, creating it on first use.
+
+        TavilySearch keeps no per-query state, so one instance per
+        (api key, topic, answer mode, max_results) is safely shared by every thread and task.
+        """
+        key = (self.api_key, topic, include_answer, max_results)
+        client = _tavily_clients.get(key)
+        if client is None:
+            with _tavily_clients_lock:
+                client = _tavily_clients.get(key)
+                if client is None:
+                    logger.info(f"Creating Tavily client for topic={topic}, max_results={max_results}")
+                    client = TavilySearch(
+                        tavily_api_key=self.api_key,
+                        topic=topic,
+                        include_answer=include_answer,
+                        max_results=max_results,
+                    )
+                    _tavily_clients[key] = client
+        return client
+
+    def _format_result(self, result) -> str:
+        """
+        Returns the answer of a Tavily result, or its results when no answer was produced.
+
+        In compact mode the results are reduced to de-duplicated "title: snippet" lines
+        instead of the whole result dict.
+        """
+        if isinstance(result, dict) and result.get("answer"):
+            return result["answer"]
+        if not self.compact or not isinstance(result, dict):
             return str(result)
+        compact = "\n".join(web_records(result.get("results", []), self.output.get("max_results", 8)))
+        ToolOutputStats.record_compaction("tavily", len(json.dumps(result, default=str)), compact)
+        return compact
+
+    def _tavily_query(self, query: str) -> str:
+        """
+        Runs a Tavily query and returns the answer, or the results if no answer was produced.
+        """
+        with self.rate_limiter.limit_call():
+            result = self.breaker.call(self.get_client().invoke, {"query": query})
+        return self._format_result(result)
+
+    async def _atavily_query(self, query: str) -> str:
+        """
+        Asynchronously runs a Tavily query and returns the answer, or the results if no answer was produced.
+        """
+        async with self.rate_limiter.alimit_call():
+            result = await self.breaker.acall(self.get_client().ainvoke, {"query": query})
+        return self._format_result(result)
+
+    async def atavily_search_attractions(self, place: str) -> str:
+        """
+        Asynchronously searches for attractions in a specified place using Tavily.
+        Args:
+            place (str): The name of the place.
+        Returns:
+            str: Answers from the Tavily search tool.
+        """
+        try:
+            logger.info(f"Tavily searching attractions for: {place}")
+            return await self.cache.afetch(
+                self.cache_provider,
+                "attractions",
+                place,
+                lambda: self._atavily_query(f"top attractive places in and around {place}"),
+            )
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def atavily_search_restaurants(self, place: str) -> str:
+        """
+        Asynchronously searches for restaurants in a specified place using Tavily.
+        Args:
+            place (str): The name of the place.
+
+        Returns:
+            str: Answers from the Tavily search tool.
+        """
+        try:
+            logger.info(f"Tavily searching restaurants for: {place}")
+            return await self.cache.afetch(
+                self.cache_provider,
+                "restaurants",
+                place,
+                lambda: self._atavily_query(f"what are the top 10 restaurants and eateries in and around {place}."),
+            )
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def atavily_search_activity(self, place: str) -> str:
+        """
+        Asynchronously searches for activities in a specified place using Tavily.
+        Args:
+            place (str): The name of the place.
+
+        Returns:
+            str: Answers from the Tavily search tool.
+        """
+        try:
+            logger.info(f"Tavily searching activities for: {place}")
+            return await self.cache.afetch(
+                self.cache_provider,
+                "activities",
+                place,
+                lambda: self._atavily_query(f"activities in and around {place}"),
+            )
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def atavily_search_transportation(self, place: str) -> str:
+        """
+        Asynchronously searches for transportation in a specified place using Tavily.
+        Args:
+            place (str): The name of the place.
+        Returns:
+            str: Answers from the Tavily search tool.
+        """
+        try:
+            logger.info(f"Tavily searching transportation for: {place}")
+            return await self.cache.afetch(
+                self.cache_provider,
+                "transportation",
+                place,
+                lambda: self._atavily_query(f"What are the different modes of transportations available in {place}"),
+            )
         except Exception as e:
             error = TripMateException(e, sys)
             logger.error(error.error_message)
@@ -0,0 +1,524 @@
+import time
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+from requests.adapters import HTTPAdapter
+
+from utils.config_loader import load_config, subscribe
+from logger.logger import logger
+
+
+DEFAULT_RATE_LIMIT_SETTINGS = {
+    "rate_per_second": 10.0,
+    "burst": 20,
+    "initial_concurrency": 8,
+    "min_concurrency": 1,
+    "max_concurrency": 32,
+    "decrease_factor": 0.5,
+    "decrease_cooldown_seconds": 1.0,
+    "default_retry_after_seconds": 1.0,
+    "max_wait_seconds": 10.0,
+    "retries_on_429": 2,
+}
+
+# how often a caller waiting for a concurrency slot checks again
+SLOT_POLL_SECONDS = 0.05
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised when a call would have to wait longer than the provider's `max_wait_seconds`.
+    """
+
+    def __init__(self, provider: str, wait: float):
+        super().__init__(f"{provider} is rate limited (a call would have waited {wait:.1f}s)")
+        self.provider = provider
+        self.wait = wait
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """
+    Parses a Retry-After header given in seconds or as an HTTP date.
+    """
+    value = headers.get("retry-after") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Returns whether an SDK exception reports an HTTP 429 or a provider quota error.
+    """
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "over_query_limit" in message
+
+
+class _Permit:
+    """
+    A granted call slot; `throttled` reports that the provider answered with a rate limit.
+    """
+
+    def __init__(self, limiter: "RateLimiter"):
+        self.limiter = limiter
+        self.was_throttled = False
+        self.finished = False
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        if not self.was_throttled:
+            self.was_throttled = True
+            self.limiter.on_throttled(retry_after)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """
+        Frees the slot, recording whether the call succeeded; later calls are ignored.
+        """
+        if not self.finished:
+            self.finished = True
+            self.limiter._finish(self, error)
+
+
+class RateLimiter:
+    """
+    A token bucket with AIMD adaptive concurrency for one provider.
+
+    Calls take a token from a bucket refilled at `rate_per_second` up to `burst`, and a
+    slot from a concurrency limit. Every successful call raises the limit additively
+    (by 1/limit, about one slot per round of calls); a 429 cuts it multiplicatively and
+    pauses the provider for the Retry-After period. Callers that find no token or slot
+    queue for up to `max_wait_seconds` instead of failing, so short bursts are smoothed
+    out and only sustained overload raises RateLimitExceeded.
+    """
+
+    def __init__(self, name: str, **settings):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            name (str): The provider guarded by the limiter.
+            **settings: Overrides of DEFAULT_RATE_LIMIT_SETTINGS.
+        """
+        self.name = name
+        self.settings = {**DEFAULT_RATE_LIMIT_SETTINGS, **settings}
+        self.rate = float(self.settings["rate_per_second"])
+        self.burst = float(self.settings["burst"])
+        self.tokens = self.burst
+        self.limit = float(self.settings["initial_concurrency"])
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.stats = {"acquired": 0, "queued": 0, "wait_ms": 0.0, "throttled": 0, "rejected": 0}
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """
+        Takes a token and a slot if both are free; otherwise returns how long to wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.in_flight >= max(1, int(self.limit)):
+                return SLOT_POLL_SECONDS
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+            self.in_flight += 1
+            return 0.0
+
+    def _granted(self, queued: bool, waited: float) -> None:
+        with self._lock:
+            self.stats["acquired"] += 1
+            if queued:
+                self.stats["queued"] += 1
+                self.stats["wait_ms"] += waited * 1000
+
+    def _reject(self, wait: float) -> None:
+        with self._lock:
+            self.stats["rejected"] += 1
+        logger.warning(f"Rate limiter for {self.name} rejected a call that would have waited {wait:.1f}s")
+        raise RateLimitExceeded(self.name, wait)
+
+    def acquire(self, max_wait: Optional[float] = None) -> None:
+        """
+        Blocks until a call may start.
+
+        Args:
+            max_wait (float): The longest wait allowed. Defaults to `max_wait_seconds`.
+        Raises:
+            RateLimitExceeded: If no slot was free within the allowed wait.
+        """
+        max_wait = self.settings["max_wait_seconds"] if max_wait is None else max_wait
+        start = time.monotonic()
+        queued = False
+        while True:
+            wait = self._try_acquire()
+            waited = time.monotonic() - start
+            if wait == 0:
+                return self._granted(queued, waited)
+            if waited + wait > max_wait:
+                self._reject(waited + wait)
+            queued = True
+            time.sleep(wait)
+
+    async def aacquire(self, max_wait: Optional[float] = None) -> None:
+        """
+        Waits without blocking the event loop until a call may start.
+
+        Args:
+            max_wait (float): The longest wait allowed. Defaults to `max_wait_seconds`.
+        Raises:
+            RateLimitExceeded: If no slot was free within the allowed wait.
+        """
+        max_wait = self.settings["max_wait_seconds"] if max_wait is None else max_wait
+        start = time.monotonic()
+        queued = False
+        while True:
+            wait = self._try_acquire()
+            waited = time.monotonic() - start
+            if wait == 0:
+                return self._granted(queued, waited)
+            if waited + wait > max_wait:
+                self._reject(waited + wait)
+            queued = True
+            await asyncio.sleep(wait)
+
+    def release(self) -> None:
+        """
+        Frees the slot of a finished call.
+        """
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+
+    def on_success(self) -> None:
+        """
+        Additively raises the concurrency limit after a call that was not rate limited.
+        """
+        with self._lock:
+            self.limit = min(self.settings["max_concurrency"], self.limit + 1 / self.limit)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Cuts the concurrency limit and pauses the provider after a 429.
+
+        Args:
+            retry_after (float): The provider's Retry-After in seconds, if it sent one.
+        """
+        pause = retry_after if retry_after is not None else self.settings["default_retry_after_seconds"]
+        with self._lock:
+            now = time.monotonic()
+            self.stats["throttled"] += 1
+            self.blocked_until = max(self.blocked_until, now + pause)
+            self.tokens = min(self.tokens, 0.0)
+            # concurrent 429s from one burst count as a single congestion signal
+            if now - self._last_decrease >= self.settings["decrease_cooldown_seconds"]:
+                self._last_decrease = now
+                self.limit = max(self.settings["min_concurrency"], self.limit * self.settings["decrease_factor"])
+        logger.warning(f"{self.name} rate limited us; pausing {pause:.1f}s, concurrency limit now {self.limit:.1f}")
+
+    def _finish(self, permit: _Permit, error: Optional[BaseException]) -> None:
+        if error is not None and not permit.was_throttled and is_rate_limit_error(error):
+            permit.throttled(retry_after_seconds(getattr(getattr(error, "response", None), "headers", None)))
+        if error is None and not permit.was_throttled:
+            self.on_success()
+        self.release()
+
+    @contextmanager
+    def limit_call(self):
+        """
+        Holds a rate-limited call slot for the duration of the block.
+
+        Rate-limit errors raised in the block are reported automatically; callers that
+        receive a 429 response instead of an exception call `permit.throttled()`.
+        """
+        self.acquire()
+        permit = _Permit(self)
+        try:
+            yield permit
+        except BaseException as e:
+            permit.finish(e)
+            raise
+        permit.finish()
+
+    @asynccontextmanager
+    async def alimit_call(self):
+        """
+        Asynchronously holds a rate-limited call slot for the duration of the block.
+        """
+        await self.aacquire()
+        permit = _Permit(self)
+        try:
+            yield permit
+        except BaseException as e:
+            permit.finish(e)
+            raise
+        permit.finish()
+
+    def reconfigure(self, **settings) -> None:
+        """
+        Applies reloaded settings, keeping the adapted concurrency limit within the new bounds.
+
+        Args:
+            **settings: Overrides of DEFAULT_RATE_LIMIT_SETTINGS.
+        """
+        with self._lock:
+            self.settings = {**DEFAULT_RATE_LIMIT_SETTINGS, **settings}
+            self.rate = float(self.settings["rate_per_second"])
+            self.burst = float(self.settings["burst"])
+            self.tokens = min(self.tokens, self.burst)
+            self.limit = min(self.settings["max_concurrency"], max(self.settings["min_concurrency"], self.limit))
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current limit, tokens and counters of the limiter.
+        """
+        with self._lock:
+            snapshot = dict(self.stats)
+            snapshot["wait_ms"] = round(snapshot["wait_ms"], 2)
+            snapshot.update(
+                concurrency_limit=round(self.limit, 2),
+                in_flight=self.in_flight,
+                tokens=round(min(self.burst, self.tokens + (time.monotonic() - self._updated) * self.rate), 2),
+                paused_seconds=round(max(0.0, self.blocked_until - time.monotonic()), 2),
+            )
+            return snapshot
+
+
+class _PermitStream(httpx.SyncByteStream):
+    """
+    A response body that frees its call's rate-limiter slot when the response is closed.
+    """
+
+    def __init__(self, stream: httpx.SyncByteStream, permit: _Permit):
+        self.stream = stream
+        self.permit = permit
+
+    def __iter__(self):
+        yield from self.stream
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            self.permit.finish()
+
+
+class _AsyncPermitStream(httpx.AsyncByteStream):
+    """
+    An async response body that frees its call's rate-limiter slot when the response is closed.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, permit: _Permit):
+        self.stream = stream
+        self.permit = permit
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            self.permit.finish()
+
+
+def _final_429(response: httpx.Response) -> httpx.Response:
+    """
+    Marks a 429 the transport gave up on so SDK clients do not retry it again.
+    """
+    # OpenAI-style SDKs obey this header before their own status-code retry rules
+    response.headers["x-should-retry"] = "false"
+    return response
+
+
+def _refused(request: httpx.Request, error: RateLimitExceeded) -> httpx.Response:
+    """
+    Answers a call the limiter refused with a final 429 instead of an exception,
+    which an SDK would treat as a connection error and retry.
+    """
+    return _final_429(
+        httpx.Response(429, headers={"retry-after": f"{error.wait:.0f}"}, text=str(error), request=request)
+    )
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """
+    An httpx transport that sends every request through a provider's RateLimiter.
+
+    The call slot is held until the response is closed, so streamed bodies count
+    against the concurrency limit. A 429 is retried after the provider's pause, up
+    to `retries_on_429` times, while the whole call stays within `max_wait_seconds`.
+    A 429 it gives up on, or a call the limiter refuses, is returned with
+    `x-should-retry: false`, so SDK clients keep retrying 5xx and connection errors
+    but never multiply the wait budget by retrying rate limits again.
+    """
+
+    def __init__(self, limiter: RateLimiter, transport: httpx.BaseTransport):
+        self.limiter = limiter
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        deadline = time.monotonic() + self.limiter.settings["max_wait_seconds"]
+        try:
+            self.limiter.acquire()
+        except RateLimitExceeded as e:
+            return _refused(request, e)
+        attempt = 0
+        while True:
+            permit = _Permit(self.limiter)
+            try:
+                response = self.transport.handle_request(request)
+            except BaseException as e:
+                permit.finish(e)
+                raise
+            if response.status_code == 429:
+                permit.throttled(retry_after_seconds(response.headers))
+                if attempt < self.limiter.settings["retries_on_429"]:
+                    permit.finish()
+                    try:
+                        self.limiter.acquire(max(0.0, deadline - time.monotonic()))
+                    except RateLimitExceeded:
+                        # the pause outlasts the call's budget: hand the 429 to the caller
+                        return _final_429(response)
+                    response.close()
+                    attempt += 1
+                    continue
+                _final_429(response)
+            if response.is_closed:
+                # the body was read in full already (e.g. a response built from bytes)
+                permit.finish()
+            else:
+                response.stream = _PermitStream(response.stream, permit)
+            return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    An async httpx transport that sends every request through a provider's RateLimiter.
+
+    Holds slots and retries 429s like RateLimitedTransport.
+    """
+
+    def __init__(self, limiter: RateLimiter, transport: httpx.AsyncBaseTransport):
+        self.limiter = limiter
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        deadline = time.monotonic() + self.limiter.settings["max_wait_seconds"]
+        try:
+            await self.limiter.aacquire()
+        except RateLimitExceeded as e:
+            return _refused(request, e)
+        attempt = 0
+        while True:
+            permit = _Permit(self.limiter)
+            try:
+                response = await self.transport.handle_async_request(request)
+            except BaseException as e:
+                permit.finish(e)
+                raise
+            if response.status_code == 429:
+                permit.throttled(retry_after_seconds(response.headers))
+                if attempt < self.limiter.settings["retries_on_429"]:
+                    permit.finish()
+                    try:
+                        await self.limiter.aacquire(max(0.0, deadline - time.monotonic()))
+                    except RateLimitExceeded:
+                        return _final_429(response)
+                    await response.aclose()
+                    attempt += 1
+                    continue
+                _final_429(response)
+            if response.is_closed:
+                permit.finish()
+            else:
+                response.stream = _AsyncPermitStream(response.stream, permit)
+            return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    A requests adapter that sends every request through a provider's RateLimiter.
+    """
+
+    def __init__(self, limiter: RateLimiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        with self.limiter.limit_call() as permit:
+            response = super().send(request, **kwargs)
+            if response.status_code == 429:
+                permit.throttled(retry_after_seconds(response.headers))
+            return response
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+_rate_limit_config: Optional[dict] = None
+
+
+def _provider_settings(rate_limit_config: dict, provider: str) -> dict:
+    return {
+        **rate_limit_config.get("default", {}),
+        **rate_limit_config.get("providers", {}).get(provider, {}),
+    }
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """
+    Returns the process-wide rate limiter of a provider, creating it on first use.
+    """
+    global _rate_limit_config
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(provider)
+            if limiter is None:
+                if _rate_limit_config is None:
+                    _rate_limit_config = load_config().get("rate_limits", {})
+                    subscribe("rate_limits", _reconfigure_limiters)
+                limiter = RateLimiter(provider, **_provider_settings(_rate_limit_config, provider))
+                _limiters[provider] = limiter
+    return limiter
+
+
+def _reconfigure_limiters(rate_limit_config: dict) -> None:
+    global _rate_limit_config
+    with _limiters_lock:
+        _rate_limit_config = rate_limit_config
+        limiters = list(_limiters.values())
+    for limiter in limiters:
+        limiter.reconfigure(**_provider_settings(rate_limit_config, limiter.name))
+
+
+def rate_limiter_states() -> dict:
+    """
+    Returns a snapshot of every rate limiter created so far.
+    """
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.snapshot() for limiter in limiters}
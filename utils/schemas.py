@@ -0,0 +1,12 @@
+from typing import Literal
+from pydantic import BaseModel, Field
+
+
+class NextStep(BaseModel):
+    """
+    The routing decision of the SupervisorAgent.
+    """
+
+    next_actor: Literal["TransportAgent", "HotelAgent", "ItineraryAgent", "FINISH"] = Field(
+        description="The worker to route the conversation to next, or FINISH when the request is fully answered."
+    )
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into one upstream call.
+
+    The first caller of a key runs the call; callers arriving while it is in flight
+    wait for and share its result (or exception) instead of repeating it. Once the
+    call finishes the key is released, so later callers start a fresh call. Threads
+    use `do` and coroutines use `ado`; the two paths do not coalesce with each other.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initializes the SingleFlight.
+
+        Args:
+            name (str): The upstream the calls go to, used when reporting statistics.
+        """
+        self.name = name
+        self.stats = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0}
+        self._calls: Dict[Hashable, Future] = {}
+        self._acalls: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], object]):
+        """
+        Runs `fn` unless an identical call is already in flight, then returns the shared result.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn (Callable): Performs the call.
+        Returns:
+            The result of the call.
+        """
+        with self._lock:
+            self.stats["calls"] += 1
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.stats["executions"] += 1
+            else:
+                self.stats["coalesced"] += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                self.stats["errors"] += 1
+                self._calls.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._calls.pop(key, None)
+        future.set_result(result)
+        return result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable]):
+        """
+        Awaits `fn()` unless an identical call is already in flight, then returns the shared result.
+
+        The call runs as its own task, so a cancelled caller does not cancel it for the others.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn (Callable[[], Awaitable]): Starts the call.
+        Returns:
+            The result of the call.
+        """
+        # futures belong to one event loop, so calls are only shared within a loop
+        flight_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            self.stats["calls"] += 1
+            task = self._acalls.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._acalls[flight_key] = task
+                self.stats["executions"] += 1
+                task.add_done_callback(lambda done: self._finish(flight_key, done))
+            else:
+                self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, flight_key: Tuple[int, Hashable], task: asyncio.Future) -> None:
+        with self._lock:
+            self._acalls.pop(flight_key, None)
+            if not task.cancelled() and task.exception() is not None:
+                self.stats["errors"] += 1
+
+    def flight_stats(self) -> dict:
+        """
+        Returns the number of calls, upstream executions and coalesced duplicates.
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["in_flight"] = len(self._calls) + len(self._acalls)
+        return stats
+
+
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Returns the process-wide SingleFlight of an upstream, creating it on first use.
+    """
+    flight = _flights.get(name)
+    if flight is None:
+        with _flights_lock:
+            flight = _flights.setdefault(name, SingleFlight(name))
+    return flight
+
+
+def single_flight_stats() -> dict:
+    """
+    Returns the statistics of every SingleFlight created so far.
+    """
+    with _flights_lock:
+        flights = list(_flights.values())
+    return {flight.name: flight.flight_stats() for flight in flights}
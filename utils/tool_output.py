@@ -0,0 +1,177 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from utils.config_loader import load_config
+from logger.logger import logger
+
+
+PRICE_LEVELS = {0: "free", 1: "$", 2: "$$", 3: "$$$", 4: "$$$$"}
+TRUNCATION_MARK = " …"
+
+
+def output_settings() -> dict:
+    """
+    Returns the `tool_output` config section.
+    """
+    return load_config().get("tool_output", {})
+
+
+def max_chars_for(tool_name: str, settings: Optional[dict] = None) -> int:
+    """
+    Returns the character cap of a tool's output.
+    """
+    settings = output_settings() if settings is None else settings
+    caps = settings.get("max_chars", {})
+    return caps.get(tool_name, caps.get("default", 1500))
+
+
+def cap_text(text: str, max_chars: int) -> str:
+    """
+    Cuts a text to `max_chars` characters, preferring to end on a line or word boundary.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text[: max_chars - len(TRUNCATION_MARK)]
+    boundary = max(cut.rfind("\n"), cut.rfind(" "))
+    if boundary > max_chars // 2:
+        cut = cut[:boundary]
+    return cut.rstrip() + TRUNCATION_MARK
+
+
+def cap_lines(lines: Iterable[str], max_chars: int) -> str:
+    """
+    Joins lines until `max_chars` is reached, dropping whole lines instead of cutting one.
+    """
+    kept, size, dropped = [], 0, 0
+    for line in lines:
+        if size + len(line) + 1 > max_chars and kept:
+            dropped += 1
+            continue
+        kept.append(line)
+        size += len(line) + 1
+    if dropped:
+        kept.append(f"(+{dropped} more)")
+    return cap_text("\n".join(kept), max_chars)
+
+
+def place_records(results: List[dict], max_results: int) -> List[dict]:
+    """
+    Reduces Google Places text-search results to de-duplicated name/rating/price/address records.
+
+    Args:
+        results (List[dict]): The `results` of a Places text search.
+        max_results (int): The maximum number of records kept.
+    Returns:
+        List[dict]: The records, in the order Google ranked them.
+    """
+    records, seen = [], set()
+    for result in results:
+        name = (result.get("name") or "").strip()
+        address = (result.get("formatted_address") or result.get("vicinity") or "").strip()
+        key = result.get("place_id") or (name.casefold(), address.casefold())
+        if not name or key in seen or (name.casefold(), address.casefold()) in seen:
+            continue
+        seen.update({key, (name.casefold(), address.casefold())})
+        records.append(
+            {
+                "name": name,
+                "rating": result.get("rating"),
+                "ratings": result.get("user_ratings_total"),
+                "price_level": PRICE_LEVELS.get(result.get("price_level")),
+                "address": address,
+            }
+        )
+        if len(records) >= max_results:
+            break
+    return records
+
+
+def format_place_record(record: dict) -> str:
+    """
+    Formats a place record as one compact line: name; rating; price; address.
+    """
+    parts = [record["name"]]
+    if record.get("rating") is not None:
+        rating = f"{record['rating']}/5"
+        if record.get("ratings"):
+            rating += f" ({record['ratings']})"
+        parts.append(rating)
+    if record.get("price_level"):
+        parts.append(record["price_level"])
+    if record.get("address"):
+        parts.append(record["address"])
+    return "; ".join(parts)
+
+
+def web_records(results: List[dict], max_results: int, snippet_chars: int = 200) -> List[str]:
+    """
+    Reduces Tavily results to de-duplicated "title: snippet" lines.
+    """
+    lines, seen = [], set()
+    for result in results:
+        title = (result.get("title") or "").strip()
+        key = result.get("url") or title.casefold()
+        if not title or key in seen:
+            continue
+        seen.add(key)
+        snippet = " ".join((result.get("content") or "").split())
+        lines.append(f"{title}: {cap_text(snippet, snippet_chars)}" if snippet else title)
+        if len(lines) >= max_results:
+            break
+    return lines
+
+
+class ToolOutputStats:
+    """
+    Process-wide byte-size statistics of tool results, per tool.
+
+    Every result records its size; compacted results also record the size of the
+    raw upstream payload they replaced.
+    """
+
+    _stats: Dict[str, dict] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _entry(cls, tool_name: str) -> dict:
+        return cls._stats.setdefault(
+            tool_name,
+            {"results": 0, "bytes": 0, "max_bytes": 0, "compacted": 0, "raw_bytes": 0, "compact_bytes": 0},
+        )
+
+    @classmethod
+    def record_result(cls, tool_name: str, content: str) -> int:
+        """
+        Records the size of a tool result and returns it in bytes.
+        """
+        size = len(content.encode("utf-8"))
+        with cls._lock:
+            entry = cls._entry(tool_name)
+            entry["results"] += 1
+            entry["bytes"] += size
+            entry["max_bytes"] = max(entry["max_bytes"], size)
+        logger.info("%s returned %d bytes", tool_name, size)
+        return size
+
+    @classmethod
+    def record_compaction(cls, tool_name: str, raw_bytes: int, compact: str) -> None:
+        """
+        Records the size of a raw upstream payload and of the compact output built from it.
+        """
+        with cls._lock:
+            entry = cls._entry(tool_name)
+            entry["compacted"] += 1
+            entry["raw_bytes"] += raw_bytes
+            entry["compact_bytes"] += len(compact.encode("utf-8"))
+
+    @classmethod
+    def output_stats(cls) -> dict:
+        """
+        Returns per-tool result counts, mean and max sizes and the bytes saved by compaction.
+        """
+        with cls._lock:
+            stats = {tool_name: dict(entry) for tool_name, entry in cls._stats.items()}
+        for entry in stats.values():
+            entry["mean_bytes"] = round(entry["bytes"] / entry["results"]) if entry["results"] else 0
+            entry["bytes_saved"] = entry["raw_bytes"] - entry["compact_bytes"]
+        return stats
@@ -1,9 +1,115 @@
-import requests
 import sys
+import threading
+from typing import List, Optional, Tuple
+import numpy as np
+from utils.cache import TTLCache
+from utils.config_loader import load_config, subscribe
+from utils.http_client import get_http_pool
+from utils.single_flight import get_single_flight
 from logger.logger import logger
 from exception.exception_handling import TripMateException
 
 
+_weather_caches: Optional[Tuple[TTLCache, TTLCache]] = None
+_weather_caches_lock = threading.Lock()
+
+
+def get_weather_caches() -> Tuple[TTLCache, TTLCache]:
+    """
+    Returns the process-wide (current conditions, forecast) caches, creating them on first use.
+
+    Current conditions change quickly and use a TTL of minutes, while the 5 day
+    forecast is refreshed by OpenWeatherMap every few hours and can be kept longer.
+    """
+    global _weather_caches
+    if _weather_caches is None:
+        with _weather_caches_lock:
+            if _weather_caches is None:
+                cache_config = load_config().get("weather_cache", {})
+                _weather_caches = (
+                    TTLCache(
+                        maxsize=cache_config.get("maxsize", 512),
+                        ttl=cache_config.get("current_ttl_seconds", 600),
+                        name="current_weather",
+                    ),
+                    TTLCache(
+                        maxsize=cache_config.get("maxsize", 512),
+                        ttl=cache_config.get("forecast_ttl_seconds", 3600),
+                        name="weather_forecast",
+                    ),
+                )
+                subscribe("weather_cache", _resize_weather_caches)
+    return _weather_caches
+
+
+def _resize_weather_caches(cache_config: dict) -> None:
+    current, forecast = get_weather_caches()
+    current.resize(cache_config.get("maxsize"), cache_config.get("current_ttl_seconds"))
+    forecast.resize(cache_config.get("maxsize"), cache_config.get("forecast_ttl_seconds"))
+
+
+def normalize_city(place: str) -> str:
+    """
+    Normalizes a city or place name so that case and whitespace variants share a cache entry.
+
+    Example: "  New   York , US" -> "new york,us"
+    """
+    parts = [" ".join(part.split()) for part in place.split(",")]
+    return ",".join(part for part in parts if part).casefold()
+
+
+def aggregate_daily(forecast: dict) -> List[dict]:
+    """
+    Aggregates 3-hour forecast slots into one record per local calendar day.
+
+    All slots are reduced in a single vectorized pass: the minimum and maximum
+    temperature, the most frequent condition, the highest precipitation probability
+    and the total rain of each day.
+
+    Args:
+        forecast (dict): The JSON response of the OpenWeatherMap forecast endpoint.
+    Returns:
+        List[dict]: One record per day with date, temp_min, temp_max, condition, pop and rain_mm.
+    """
+    slots = forecast.get("list") or []
+    if not slots:
+        return []
+    offset = forecast.get("city", {}).get("timezone", 0)
+    timestamps = np.array([slot["dt"] + offset for slot in slots], dtype="int64")
+    dates = timestamps.astype("datetime64[s]").astype("datetime64[D]")
+    temp_min = np.array([slot["main"].get("temp_min", slot["main"]["temp"]) for slot in slots], dtype=float)
+    temp_max = np.array([slot["main"].get("temp_max", slot["main"]["temp"]) for slot in slots], dtype=float)
+    pop = np.array([slot.get("pop", 0.0) for slot in slots], dtype=float)
+    rain = np.array([slot.get("rain", {}).get("3h", 0.0) for slot in slots], dtype=float)
+    conditions = np.array([(slot.get("weather") or [{}])[0].get("main", "Unknown") for slot in slots])
+
+    days, day_index = np.unique(dates, return_inverse=True)
+    names, condition_index = np.unique(conditions, return_inverse=True)
+    mins = np.full(len(days), np.inf)
+    maxs = np.full(len(days), -np.inf)
+    max_pop = np.zeros(len(days))
+    rain_total = np.zeros(len(days))
+    condition_counts = np.zeros((len(days), len(names)), dtype=int)
+    np.minimum.at(mins, day_index, temp_min)
+    np.maximum.at(maxs, day_index, temp_max)
+    np.maximum.at(max_pop, day_index, pop)
+    np.add.at(rain_total, day_index, rain)
+    np.add.at(condition_counts, (day_index, condition_index), 1)
+    dominant = names[condition_counts.argmax(axis=1)]
+
+    return [
+        {
+            "date": str(day),
+            "temp_min": round(float(low)),
+            "temp_max": round(float(high)),
+            "condition": str(condition),
+            "pop": round(float(chance) * 100),
+            "rain_mm": round(float(total), 1),
+        }
+        for day, low, high, condition, chance, total in zip(days, mins, maxs, dominant, max_pop, rain_total)
+    ]
+
+
 class WeatherForecastTool:
     """
     A class to fetch weather information from OpenWeatherMap API.
@@ -16,8 +122,25 @@ class WeatherForecastTool:
         """
         self.api_key = api_key
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        self.http = get_http_pool()
+        self.current_cache, self.forecast_cache = get_weather_caches()
+        # identical requests for one city made at the same moment share a single upstream call
+        self.flight = get_single_flight("openweathermap")
+        forecast_config = load_config().get("weather_forecast", {})
+        self.forecast_mode = forecast_config.get("mode", "daily")
+        # the daily mode needs the full 5 day window (40 three-hour slots)
+        self.forecast_slots = forecast_config.get("slots", 40 if self.forecast_mode == "daily" else 10)
         logger.info("WeatherForecastTool initialized")
 
+    def cache_stats(self) -> dict:
+        """
+        Returns the hit/miss statistics of the weather caches.
+        """
+        return {
+            "current": self.current_cache.stats(),
+            "forecast": self.forecast_cache.stats(),
+        }
+
     def get_current_weather(self, place: str) -> dict:
         """
         Fetch current weather for a specific place.
@@ -29,12 +152,22 @@ class WeatherForecastTool:
             TripMateException: If the API call fails or an error occurs.
         """
         try:
+            city = normalize_city(place)
+            cached = self.current_cache.get(city)
+            if cached is not None:
+                logger.info(f"Current weather cache hit for: {city}")
+                return cached
+
             logger.info(f"Fetching current weather for: {place}")
             url = f"{self.base_url}/weather"
-            params = {"q": place, "appid": self.api_key, "units": "metric"}
-            response = requests.get(url, params=params)
+            params = {"q": city, "appid": self.api_key, "units": "metric"}
+            response = self.flight.do(
+                ("weather", city), lambda: self.http.get("openweathermap", url, params=params)
+            )
             if response.status_code == 200:
-                return response.json()
+                weather = response.json()
+                self.current_cache.set(city, weather)
+                return weather
             else:
                 logger.warning(
                     f"Failed to fetch weather for {place}: {response.status_code} - {response.text}"
@@ -57,12 +190,99 @@ class WeatherForecastTool:
             TripMateException: If the API call fails or an error occurs.
         """
         try:
+            city = normalize_city(place)
+            cached = self.forecast_cache.get((city, self.forecast_slots))
+            if cached is not None:
+                logger.info(f"Weather forecast cache hit for: {city}")
+                return cached
+
+            logger.info(f"Fetching weather forecast for: {place}")
+            url = f"{self.base_url}/forecast"
+            params = {"q": city, "appid": self.api_key, "cnt": self.forecast_slots, "units": "metric"}
+            response = self.flight.do(
+                ("forecast", city, self.forecast_slots),
+                lambda: self.http.get("openweathermap", url, params=params),
+            )
+            if response.status_code == 200:
+                forecast = response.json()
+                self.forecast_cache.set((city, self.forecast_slots), forecast)
+                return forecast
+            else:
+                logger.warning(
+                    f"Failed to fetch forecast for {place}: {response.status_code} - {response.text}"
+                )
+                return {}
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def aget_current_weather(self, place: str) -> dict:
+        """
+        Asynchronously fetch current weather for a specific place.
+        Args:
+            place (str): The name of the place.
+        Returns:
+            dict: The JSON response from the API.
+        Raises:
+            TripMateException: If the API call fails or an error occurs.
+        """
+        try:
+            city = normalize_city(place)
+            cached = self.current_cache.get(city)
+            if cached is not None:
+                logger.info(f"Current weather cache hit for: {city}")
+                return cached
+
+            logger.info(f"Fetching current weather for: {place}")
+            url = f"{self.base_url}/weather"
+            params = {"q": city, "appid": self.api_key, "units": "metric"}
+            response = await self.flight.ado(
+                ("weather", city), lambda: self.http.aget("openweathermap", url, params=params)
+            )
+            if response.status_code == 200:
+                weather = response.json()
+                self.current_cache.set(city, weather)
+                return weather
+            else:
+                logger.warning(
+                    f"Failed to fetch weather for {place}: {response.status_code} - {response.text}"
+                )
+                return {}
+        except Exception as e:
+            error = TripMateException(e, sys)
+            logger.error(error.error_message)
+            raise error
+
+    async def aget_weather_forecast(self, place: str) -> dict:
+        """
+        Asynchronously fetch 5 day weather forecast for a specific place.
+        Args:
+            place (str): The name of the place.
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            TripMateException: If the API call fails or an error occurs.
+        """
+        try:
+            city = normalize_city(place)
+            cached = self.forecast_cache.get((city, self.forecast_slots))
+            if cached is not None:
+                logger.info(f"Weather forecast cache hit for: {city}")
+                return cached
+
             logger.info(f"Fetching weather forecast for: {place}")
             url = f"{self.base_url}/forecast"
-            params = {"q": place, "appid": self.api_key, "cnt": 10, "units": "metric"}
-            response = requests.get(url, params=params)
+            params = {"q": city, "appid": self.api_key, "cnt": self.forecast_slots, "units": "metric"}
+            response = await self.flight.ado(
+                ("forecast", city, self.forecast_slots),
+                lambda: self.http.aget("openweathermap", url, params=params),
+            )
             if response.status_code == 200:
-                return response.json()
+                forecast = response.json()
+                self.forecast_cache.set((city, self.forecast_slots), forecast)
+                return forecast
             else:
                 logger.warning(
                     f"Failed to fetch forecast for {place}: {response.status_code} - {response.text}"